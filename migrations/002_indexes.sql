@@ -0,0 +1,38 @@
+-- Secondary indexes for the DataStore access paths.
+-- Each index leads with the filter column, follows with the sort column, and
+-- ends with `id` so the id-only list queries are answered from the index alone.
+
+CREATE INDEX IF NOT EXISTS idx_roles_startup
+    ON roles (startup_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_scorecards_role
+    ON scorecards (role_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_sequences_role
+    ON sequences (role_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_interactions_candidate_occurred
+    ON interactions (candidate_id, occurred_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_interactions_occurred
+    ON interactions (occurred_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_stage_events_candidate_occurred
+    ON stage_events (candidate_id, occurred_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_event_created
+    ON audit_logs (event_type, created_at DESC, id);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_created
+    ON audit_logs (created_at DESC, id);
+
+-- Foreign-key children: without these, ON DELETE CASCADE / SET NULL scans the
+-- whole child table for every deleted candidate or role.
+CREATE INDEX IF NOT EXISTS idx_profile_sources_candidate
+    ON profile_sources (candidate_id);
+
+CREATE INDEX IF NOT EXISTS idx_stage_events_role
+    ON stage_events (role_id);
+
+CREATE INDEX IF NOT EXISTS idx_consent_events_candidate
+    ON consent_events (candidate_id);
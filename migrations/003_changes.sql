@@ -0,0 +1,69 @@
+-- Append-only change outbox for incremental downstream consumers.
+-- Triggers record (table, row id, op) for every write to the tracked tables;
+-- AUTOINCREMENT keeps `seq` strictly increasing and never reused.
+
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_id TEXT NOT NULL,
+    op TEXT NOT NULL CHECK (op IN ('insert', 'update', 'delete')),
+    changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS change_consumers (
+    consumer TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_candidates_insert AFTER INSERT ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('candidates', NEW.id, 'insert');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_candidates_update AFTER UPDATE ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('candidates', NEW.id, 'update');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_candidates_delete AFTER DELETE ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('candidates', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_roles_insert AFTER INSERT ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('roles', NEW.id, 'insert');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_roles_update AFTER UPDATE ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('roles', NEW.id, 'update');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_roles_delete AFTER DELETE ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('roles', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_interactions_insert AFTER INSERT ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('interactions', NEW.id, 'insert');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_interactions_update AFTER UPDATE ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('interactions', NEW.id, 'update');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_interactions_delete AFTER DELETE ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('interactions', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stage_events_insert AFTER INSERT ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('stage_events', NEW.id, 'insert');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_stage_events_update AFTER UPDATE ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('stage_events', NEW.id, 'update');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_stage_events_delete AFTER DELETE ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op) VALUES ('stage_events', OLD.id, 'delete');
+END;
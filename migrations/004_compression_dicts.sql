@@ -0,0 +1,13 @@
+-- Preset dictionaries for compressed text columns (see src/data/compression.py).
+-- `id` is the hex content hash embedded in every value compressed with it, so
+-- dictionaries are never updated in place, only added.
+
+CREATE TABLE IF NOT EXISTS compression_dicts (
+    id TEXT PRIMARY KEY,
+    column_name TEXT NOT NULL,
+    zdict BLOB NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_compression_dicts_column
+    ON compression_dicts (column_name, created_at);
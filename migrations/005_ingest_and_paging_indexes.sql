@@ -0,0 +1,11 @@
+-- Case-insensitive email lookups for ingest dedupe (`DataStore.existing_emails`).
+-- Partial like idx_candidates_email, so queries must also filter
+-- `email IS NOT NULL` for the planner to use it.
+
+CREATE INDEX IF NOT EXISTS idx_candidates_email_lower
+    ON candidates (lower(email)) WHERE email IS NOT NULL;
+
+-- Keyset pages of one startup's roles (`page_roles`): entries end with the
+-- implicit rowid, so `startup_id = ? AND rowid > ? ORDER BY rowid` is a range.
+CREATE INDEX IF NOT EXISTS idx_roles_startup_rowid
+    ON roles (startup_id);
@@ -0,0 +1,8 @@
+-- Routing table for `ShardedDataStore`: which startup shard owns each role,
+-- scorecard, sequence and stage event. Only the global store of a sharded
+-- layout writes it; a plain DataStore leaves it empty.
+
+CREATE TABLE IF NOT EXISTS shard_routes (
+    entity_id TEXT PRIMARY KEY,
+    startup_id TEXT NOT NULL
+) WITHOUT ROWID;
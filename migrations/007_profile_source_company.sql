@@ -0,0 +1,5 @@
+-- Company a profile source reported for the candidate (the CSV importer's
+-- `company` column). Candidates have no company of their own; dedupe reads
+-- this instead of guessing from free-text `notes`.
+
+ALTER TABLE profile_sources ADD COLUMN company TEXT;
@@ -0,0 +1,83 @@
+-- Stamp change-feed rows the way the store stamps every other timestamp
+-- (`_now()`: ISO-8601 UTC with a `+00:00` offset). The column default from
+-- 003 ends in `Z`, so the triggers now pass `changed_at` themselves and rows
+-- already recorded are rewritten to the same form.
+
+UPDATE changes SET changed_at = substr(changed_at, 1, 19) || '+00:00'
+    WHERE changed_at LIKE '%Z';
+
+DROP TRIGGER IF EXISTS trg_candidates_insert;
+CREATE TRIGGER trg_candidates_insert AFTER INSERT ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('candidates', NEW.id, 'insert', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_candidates_update;
+CREATE TRIGGER trg_candidates_update AFTER UPDATE ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('candidates', NEW.id, 'update', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_candidates_delete;
+CREATE TRIGGER trg_candidates_delete AFTER DELETE ON candidates
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('candidates', OLD.id, 'delete', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+
+DROP TRIGGER IF EXISTS trg_roles_insert;
+CREATE TRIGGER trg_roles_insert AFTER INSERT ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('roles', NEW.id, 'insert', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_roles_update;
+CREATE TRIGGER trg_roles_update AFTER UPDATE ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('roles', NEW.id, 'update', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_roles_delete;
+CREATE TRIGGER trg_roles_delete AFTER DELETE ON roles
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('roles', OLD.id, 'delete', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+
+DROP TRIGGER IF EXISTS trg_interactions_insert;
+CREATE TRIGGER trg_interactions_insert AFTER INSERT ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('interactions', NEW.id, 'insert', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_interactions_update;
+CREATE TRIGGER trg_interactions_update AFTER UPDATE ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('interactions', NEW.id, 'update', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_interactions_delete;
+CREATE TRIGGER trg_interactions_delete AFTER DELETE ON interactions
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('interactions', OLD.id, 'delete', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+
+DROP TRIGGER IF EXISTS trg_stage_events_insert;
+CREATE TRIGGER trg_stage_events_insert AFTER INSERT ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('stage_events', NEW.id, 'insert', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_stage_events_update;
+CREATE TRIGGER trg_stage_events_update AFTER UPDATE ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('stage_events', NEW.id, 'update', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
+DROP TRIGGER IF EXISTS trg_stage_events_delete;
+CREATE TRIGGER trg_stage_events_delete AFTER DELETE ON stage_events
+BEGIN
+    INSERT INTO changes (table_name, row_id, op, changed_at)
+    VALUES ('stage_events', OLD.id, 'delete', strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now'));
+END;
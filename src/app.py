@@ -1,9 +1,9 @@
-"""FastAPI application wiring routers and in-memory repos.
+"""FastAPI application wiring routers and repositories.
 
 Purpose:
   Expose endpoints for health, startups, roles, candidates, matching, and
-  outreach using a simple in-memory repository. Suitable for local testing
-  and demos; swap the repo layer for persistence later.
+  outreach. The repository defaults to the in-memory demo backend; set
+  `REPO_BACKEND=sqlite` to persist to a shared SQLite file across workers.
 """
 
 from fastapi import FastAPI
@@ -17,6 +17,8 @@ from .routers import (
     outreach,
     sourcing,
     descriptions,
+    admin,
+    export,
 )
 
 
@@ -33,3 +35,7 @@ app.include_router(match.router, tags=["match"])
 app.include_router(outreach.router, tags=["outreach"])
 app.include_router(sourcing.router, tags=["sourcing"])
 app.include_router(descriptions.router, tags=["descriptions"])
+
+# Operations
+app.include_router(admin.router, tags=["admin"])
+app.include_router(export.router, tags=["export"])
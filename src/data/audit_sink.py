@@ -0,0 +1,166 @@
+"""Write-behind sink for audit and consent events.
+
+Purpose:
+    Take audit/consent inserts off the request path. Events are queued in a
+    bounded in-process queue and a background thread writes them in batches,
+    one transaction per batch, when the batch fills or the flush interval
+    elapses. A full queue degrades to a synchronous write instead of dropping.
+    A batch the database rejects is retried row by row; rows that still fail
+    are logged and counted under `stats["failed"]`, and the thread keeps going.
+    Events flushed into a store transaction that later rolls back are put back
+    at the front of the queue.
+Dependencies:
+    Standard library (atexit, queue, sqlite3, threading) plus `src.obs.logging`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Tuple
+
+from ..obs.logging import get_logger
+
+if TYPE_CHECKING:
+    from .store import DataStore
+
+BufferedEvent = Tuple[str, Tuple[Any, ...]]
+
+
+class AuditSink:
+    def __init__(
+        self,
+        store: "DataStore",
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be positive")
+        self._store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[BufferedEvent]" = queue.Queue(maxsize=max_queue)
+        # Rolled-back events, drained before the queue; guarded by the store lock.
+        self._requeued: Deque[BufferedEvent] = deque()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self.stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "sync_fallbacks": 0,
+            "failed": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._logger = get_logger("scoutshonor.store.audit_sink")
+        self._thread = threading.Thread(
+            target=self._run, name="audit-sink", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, table: str, params: Tuple[Any, ...]) -> None:
+        """Queue one insert for `table`; writes inline if the queue is full."""
+        if self._closed.is_set():
+            raise RuntimeError("audit sink is closed")
+        try:
+            self._queue.put_nowait((table, params))
+        except queue.Full:
+            self._count("sync_fallbacks")
+            # Keep ordering: flush what is queued, then write this event.
+            with self._store._lock:
+                self.flush()
+                self._write([(table, params)])
+            return
+        self._count("enqueued")
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Drain the queue and write it in batches; returns rows written.
+
+        Holds the store lock while draining so a concurrent reader never
+        observes a batch that has left the queue but is not yet written.
+        """
+        written = 0
+        with self._store._lock:
+            while True:
+                batch = self._drain()
+                if not batch:
+                    return written
+                written += self._write(batch)
+
+    def requeue(self, events: List[BufferedEvent]) -> None:
+        """Put back events whose write was rolled back; the caller holds the lock."""
+        self._requeued.extendleft(reversed(events))
+        self._count("written", -len(events))
+
+    def close(self) -> None:
+        """Stop the background thread and flush everything still queued."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def pending(self) -> int:
+        return self._queue.qsize() + len(self._requeued)
+
+    def _drain(self) -> List[BufferedEvent]:
+        batch: List[BufferedEvent] = []
+        while self._requeued and len(batch) < self.batch_size:
+            batch.append(self._requeued.popleft())
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _write(self, batch: List[BufferedEvent]) -> int:
+        written = len(batch)
+        try:
+            self._store._write_buffered_events(batch)
+        except sqlite3.Error:
+            # One bad row (e.g. an unknown candidate_id) must not take the
+            # rest of the batch with it.
+            written = 0
+            for event in batch:
+                try:
+                    self._store._write_buffered_events([event])
+                except sqlite3.Error as exc:
+                    self._count("failed")
+                    self._logger.error(
+                        "audit event dropped",
+                        extra={"table": event[0], "error": str(exc)},
+                    )
+                else:
+                    written += 1
+        self._count("written", written)
+        self._count("batches")
+        return written
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                break
+            try:
+                self.flush()
+            except Exception:
+                self._logger.exception("audit sink flush failed")
+
+
+__all__ = ["AuditSink"]
@@ -0,0 +1,239 @@
+"""Micro-benchmarks for the SQLite store.
+
+Purpose:
+    Measure representative store workloads so storage changes can be compared
+    before and after, e.g. `python -m src.data.bench transactions --ops 200`.
+Dependencies:
+    Standard library only plus the local DataStore.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from ..jobs.recompress import recompress_column
+from .sharding import ShardedDataStore
+from .store import DataStore
+
+
+def _candidate_flow(store: DataStore, index: int) -> None:
+    """Create a candidate, add a source, log an interaction, and audit it."""
+    candidate = store.create_candidate(
+        {"full_name": f"Bench {index}", "email": f"bench{index}@example.com"}
+    )
+    store.add_profile_source({"candidate_id": candidate["id"], "source": "csv"})
+    store.log_interaction(
+        {
+            "candidate_id": candidate["id"],
+            "channel": "email",
+            "direction": "outbound",
+            "subject": "Hello",
+        }
+    )
+    store.record_audit_event(
+        event_type="bench_flow", subject_id=candidate["id"], detail={"i": index}
+    )
+
+
+def bench_transactions(ops: int = 200, db_dir: Path | None = None) -> Dict[str, Any]:
+    """Compare commit-per-call against one transaction per logical operation."""
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmp:
+        for mode in ("per_call", "grouped"):
+            store = DataStore(str(Path(tmp) / f"{mode}.db"))
+            baseline = store.commit_stats()
+            started = time.perf_counter()
+            for index in range(ops):
+                if mode == "grouped":
+                    with store.transaction():
+                        _candidate_flow(store, index)
+                else:
+                    _candidate_flow(store, index)
+            elapsed = time.perf_counter() - started
+            stats = store.commit_stats()
+            commits = stats["commits"] - baseline["commits"]
+            commit_seconds = stats["commit_seconds"] - baseline["commit_seconds"]
+            results[mode] = {
+                "ops": ops,
+                "commits": commits,
+                "commits_per_op": commits / ops,
+                "commit_ms_per_op": commit_seconds * 1000 / ops,
+                "total_ms_per_op": elapsed * 1000 / ops,
+            }
+            store.close()
+    return results
+
+
+def bench_startup(constructions: int = 200) -> Dict[str, Any]:
+    """Time `DataStore(":memory:")` with and without the template fast path."""
+    results: Dict[str, Any] = {}
+    for mode, use_template in (("migrate", False), ("template", True)):
+        DataStore(use_template=use_template).close()  # warm caches
+        started = time.perf_counter()
+        for _ in range(constructions):
+            DataStore(use_template=use_template).close()
+        elapsed = time.perf_counter() - started
+        results[mode] = {
+            "constructions": constructions,
+            "ms_per_store": elapsed * 1000 / constructions,
+        }
+    return results
+
+
+def bench_shards(
+    shard_counts: Sequence[int] = (1, 2, 4, 8),
+    threads: int = 8,
+    ops: int = 400,
+    db_dir: Path | None = None,
+) -> List[Dict[str, Any]]:
+    """Concurrent role+scorecard writes spread over N per-startup shards."""
+    results = []
+    for shard_count in shard_counts:
+        with tempfile.TemporaryDirectory(dir=db_dir) as tmp:
+            store = ShardedDataStore(tmp)
+            startups = [
+                store.create_startup({"name": f"S{i}", "stage": "seed"})["id"]
+                for i in range(shard_count)
+            ]
+            for startup_id in startups:
+                store.shard(startup_id)
+
+            def work(index: int) -> None:
+                role = store.create_role(
+                    {"startup_id": startups[index % shard_count], "title": f"R{index}"}
+                )
+                store.create_scorecard({"role_id": role["id"], "summary": "bench"})
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(work, range(ops)))
+            elapsed = time.perf_counter() - started
+            store.close()
+        results.append(
+            {
+                "shards": shard_count,
+                "threads": threads,
+                "ops": ops,
+                "ops_per_second": ops / elapsed,
+            }
+        )
+    return results
+
+
+_SENTENCES = [
+    "Thanks for taking the time to chat last week about the platform team.",
+    "We're building the core infrastructure for real-time payments at scale.",
+    "The founders previously led engineering at two successful fintech startups.",
+    "You'd own the hiring plan and the technical roadmap for the next two years.",
+    "Happy to share more detail on compensation, equity, and the board.",
+    "Would Tuesday or Thursday afternoon work for a 30 minute intro call?",
+    "Our stack is Python, Postgres, and Kubernetes on AWS with Terraform.",
+    "Let me know if you'd prefer to talk to the CEO first.",
+    "Looking forward to hearing your thoughts on the opportunity.",
+    "Best regards, and thanks again for your time.",
+]
+
+
+def _email_body(rng: random.Random, index: int) -> str:
+    lines = [f"Hi Candidate {index},", ""]
+    lines += [rng.choice(_SENTENCES) for _ in range(rng.randint(8, 20))]
+    lines += ["", "> On a previous day you wrote:"]
+    lines += ["> " + rng.choice(_SENTENCES) for _ in range(rng.randint(4, 12))]
+    return "\n".join(lines)
+
+
+def bench_compression(rows: int = 2000, db_dir: Path | None = None) -> Dict[str, Any]:
+    """Database size for email traffic: plain, zlib, and zlib + trained dictionary."""
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(dir=db_dir) as tmp:
+        for mode in ("plain", "zlib", "dictionary"):
+            rng = random.Random(7)
+            path = Path(tmp) / f"{mode}.db"
+            store = DataStore(str(path))
+            if mode != "plain":
+                store.enable_compression()
+            with store.transaction():
+                candidate = store.create_candidate({"full_name": "Bench"})
+                for index in range(rows):
+                    store.log_interaction(
+                        {
+                            "candidate_id": candidate["id"],
+                            "channel": "email",
+                            "direction": "outbound",
+                            "subject": f"Intro {index}",
+                            "body": _email_body(rng, index),
+                        }
+                    )
+            if mode == "dictionary":
+                recompress_column(
+                    store,
+                    "interactions",
+                    "body",
+                    pause_seconds=0,
+                    train_dictionary=True,
+                )
+            # The change outbox is not what is being measured.
+            with store.transaction():
+                store.conn.execute("DELETE FROM changes")
+            store.conn.execute("VACUUM")
+            started = time.perf_counter()
+            store.list_interactions(candidate["id"])
+            read_ms = (time.perf_counter() - started) * 1000
+            store.close()
+            results[mode] = {"bytes": path.stat().st_size, "read_all_ms": read_ms}
+    for mode in ("zlib", "dictionary"):
+        results[mode]["ratio"] = results["plain"]["bytes"] / results[mode]["bytes"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite store.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    tx = sub.add_parser("transactions", help="Commit latency per logical operation.")
+    tx.add_argument("--ops", type=int, default=200)
+    tx.add_argument("--db-dir", default=None, help="Directory for temporary DBs.")
+
+    startup = sub.add_parser("startup", help="In-memory DataStore construction.")
+    startup.add_argument("--constructions", type=int, default=200)
+
+    shards = sub.add_parser("shards", help="Write throughput vs shard count.")
+    shards.add_argument("--counts", default="1,2,4,8")
+    shards.add_argument("--threads", type=int, default=8)
+    shards.add_argument("--ops", type=int, default=400)
+    shards.add_argument("--db-dir", default=None, help="Directory for shard DBs.")
+
+    compression = sub.add_parser("compression", help="DB size with compression.")
+    compression.add_argument("--rows", type=int, default=2000)
+    compression.add_argument("--db-dir", default=None, help="Directory for DBs.")
+
+    args = parser.parse_args()
+    if args.bench == "transactions":
+        report = bench_transactions(
+            args.ops, Path(args.db_dir) if args.db_dir else None
+        )
+    elif args.bench == "startup":
+        report = bench_startup(args.constructions)
+    elif args.bench == "shards":
+        report = bench_shards(
+            [int(c) for c in args.counts.split(",")],
+            args.threads,
+            args.ops,
+            Path(args.db_dir) if args.db_dir else None,
+        )
+    elif args.bench == "compression":
+        report = bench_compression(
+            args.rows, Path(args.db_dir) if args.db_dir else None
+        )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
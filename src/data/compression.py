@@ -0,0 +1,158 @@
+"""Transparent zlib compression for large text columns.
+
+Purpose:
+    Encode long text values as marker-prefixed zlib BLOBs so bulky columns
+    (email bodies, notes, audit JSON) take less space on disk and in the page
+    cache. Compressed values are BLOBs while plain values are TEXT, and every
+    BLOB carries a marker, so rows written before compression was enabled stay
+    readable and both forms can coexist. Short values such as single emails
+    compress poorly on their own, so a preset dictionary trained on sampled
+    values (zstd-style dictionary compression, via zlib's `zdict`) can be used;
+    dictionaries are identified by a content hash and registered process-wide
+    so row decoders can find them. An id nobody registered (e.g. a dictionary
+    another process trained) is looked up through the registered dictionary
+    sources, normally each open store's `compression_dicts` table.
+Dependencies:
+    Standard library only (zlib, hashlib).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+import zlib
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+MARKER = b"\x00zc1"
+# Followed by the 8-byte dictionary id, then the zlib stream.
+DICT_MARKER = b"\x00zd1"
+MAX_DICTIONARY_BYTES = 32 * 1024  # zlib only uses a 32 KiB window
+
+# table -> columns eligible for compression.
+COMPRESSIBLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "interactions": ("body",),
+    "profile_sources": ("notes",),
+    "audit_logs": ("detail",),
+}
+
+_dictionaries: Dict[bytes, bytes] = {}
+_dictionaries_lock = threading.Lock()
+# Bound `loader(dictionary_id) -> zdict or None` methods, held weakly.
+_sources: List["weakref.WeakMethod[Callable[[bytes], Optional[bytes]]]"] = []
+
+
+def all_columns() -> FrozenSet[str]:
+    """Every compressible column as a `table.column` name."""
+    return frozenset(
+        f"{table}.{column}"
+        for table, columns in COMPRESSIBLE_COLUMNS.items()
+        for column in columns
+    )
+
+
+def dictionary_id(zdict: bytes) -> bytes:
+    return hashlib.sha256(zdict).digest()[:8]
+
+
+def register_dictionary(zdict: bytes) -> bytes:
+    """Make `zdict` available to `decompress_text`; returns its id."""
+    key = dictionary_id(zdict)
+    with _dictionaries_lock:
+        _dictionaries[key] = zdict
+    return key
+
+
+def add_dictionary_source(loader: Callable[[bytes], Optional[bytes]]) -> None:
+    """Ask `loader` (a bound method) for dictionary ids nobody registered."""
+    with _dictionaries_lock:
+        _sources.append(weakref.WeakMethod(loader))
+
+
+def remove_dictionary_source(loader: Callable[[bytes], Optional[bytes]]) -> None:
+    with _dictionaries_lock:
+        _sources[:] = [ref for ref in _sources if ref() not in (None, loader)]
+
+
+def _find_dictionary(key: bytes) -> Optional[bytes]:
+    with _dictionaries_lock:
+        zdict = _dictionaries.get(key)
+        loaders = [ref() for ref in _sources]
+    if zdict is not None:
+        return zdict
+    for load in loaders:
+        zdict = load(key) if load is not None else None
+        if zdict is not None:
+            register_dictionary(zdict)
+            return zdict
+    return None
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICTIONARY_BYTES) -> bytes:
+    """Build a preset dictionary from the lines that recur most across samples.
+
+    The most frequent lines go last because zlib encodes nearer matches with
+    shorter distances.
+    """
+    counts: Counter[str] = Counter()
+    for sample in samples:
+        counts.update({line for line in sample.splitlines() if len(line) > 3})
+    chosen = []
+    used = 0
+    for line, count in counts.most_common():
+        if count < 2:
+            break
+        encoded = line.encode("utf-8") + b"\n"
+        if used + len(encoded) > size:
+            break
+        chosen.append(encoded)
+        used += len(encoded)
+    return b"".join(reversed(chosen))
+
+
+def compress_text(
+    value: Any,
+    *,
+    min_size: int = 128,
+    level: int = 6,
+    zdict: Optional[bytes] = None,
+) -> Any:
+    """Return a compressed BLOB for long strings, else the value unchanged."""
+    if not isinstance(value, str) or len(value) < min_size:
+        return value
+    raw = value.encode("utf-8")
+    if zdict:
+        compressor = zlib.compressobj(level, zdict=zdict)
+        packed = (
+            DICT_MARKER
+            + dictionary_id(zdict)
+            + compressor.compress(raw)
+            + compressor.flush()
+        )
+    else:
+        packed = MARKER + zlib.compress(raw, level)
+    return packed if len(packed) < len(raw) else value
+
+
+def decompress_text(value: Any) -> Any:
+    """Inverse of `compress_text`; plain values pass through untouched."""
+    if not isinstance(value, bytes):
+        return value
+    if value.startswith(MARKER):
+        return zlib.decompress(value[len(MARKER) :]).decode("utf-8")
+    if value.startswith(DICT_MARKER):
+        start = len(DICT_MARKER)
+        key = value[start : start + 8]
+        zdict = _find_dictionary(key)
+        if zdict is None:
+            raise KeyError(f"compression dictionary {key.hex()} is not registered")
+        decompressor = zlib.decompressobj(zdict=zdict)
+        data = decompressor.decompress(value[start + 8 :]) + decompressor.flush()
+        return data.decode("utf-8")
+    return value
+
+
+def compressed_prefix(zdict: Optional[bytes]) -> bytes:
+    """Marker (plus dictionary id) that values compressed with `zdict` start with."""
+    return DICT_MARKER + dictionary_id(zdict) if zdict else MARKER
@@ -0,0 +1,245 @@
+"""Per-statement timing for the SQLite store.
+
+Purpose:
+    Record call counts, rows returned, and latency histograms per normalized SQL
+    fingerprint, and log slow statements with PII-redacted parameters. The
+    timing proxy is only installed when stats are enabled on a `DataStore`, so
+    the disabled path is the raw `sqlite3.Connection` with no extra overhead.
+Dependencies:
+    Standard library plus `src.utils.redact` and `src.obs.logging`.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Sequence
+
+from ..obs.logging import get_logger
+from ..utils.redact import redact_payload
+
+# Upper bounds (ms) for latency histogram buckets; the last bucket is open.
+BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+_WS_RE = re.compile(r"\s+")
+_INSERT_COLUMNS_RE = re.compile(
+    r"insert\s+(?:or\s+\w+\s+)?into\s+\w+\s*\(([^)]*)\)", re.I
+)
+# `col = ?`, also through function wrappers such as `lower(trim(col)) IN (?)`.
+_BOUND_COLUMN_RE = re.compile(
+    r"(\w+)\)*\s*(=|<=|>=|<|>|\bIN\b|\bLIKE\b)\s*\(?\s*\?", re.I
+)
+_REDACTED = "[REDACTED]"
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize SQL so statements differing only in literals share a key."""
+    text = _STRING_RE.sub("?", sql)
+    text = _NUMBER_RE.sub("?", text)
+    text = _WS_RE.sub(" ", text).strip()
+    return _PLACEHOLDER_LIST_RE.sub("?, ...", text)
+
+
+def _redacted_params(sql: str, params: Any) -> Any:
+    """Map positional parameters to column names when possible, then redact.
+
+    LIKE patterns are free-text search terms and are always redacted. When
+    the parameters cannot be mapped to columns, every string is redacted.
+    """
+    if isinstance(params, dict):
+        return redact_payload(params)
+    values = list(params or [])
+    match = _INSERT_COLUMNS_RE.search(sql)
+    if match:
+        bound = [(c.strip(), "=") for c in match.group(1).split(",")]
+    else:
+        bound = _BOUND_COLUMN_RE.findall(sql)
+    if not bound or len(bound) != len(values):
+        return [_REDACTED if isinstance(v, str) else v for v in values]
+    return redact_payload(
+        {
+            name: _REDACTED if op.upper() == "LIKE" else value
+            for (name, op), value in zip(bound, values)
+        }
+    )
+
+
+@dataclass
+class StatementStats:
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+
+    def observe(self, elapsed_ms: float, rows: int) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for index, bound in enumerate(BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b}ms" for b in BUCKETS_MS] + ["gt_" + f"{BUCKETS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class QueryStats:
+    """Thread-safe aggregate of statement timings keyed by SQL fingerprint."""
+
+    def __init__(self, slow_ms: float = 50.0) -> None:
+        self.slow_ms = slow_ms
+        self._stats: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+        self._logger = get_logger("scoutshonor.store.slow_query")
+
+    def record(self, sql: str, params: Any, elapsed_ms: float, rows: int) -> None:
+        key = fingerprint(sql)
+        with self._lock:
+            self._stats.setdefault(key, StatementStats()).observe(elapsed_ms, rows)
+        if elapsed_ms >= self.slow_ms:
+            self._logger.warning(
+                "slow query",
+                extra={
+                    "fingerprint": key,
+                    "elapsed_ms": round(elapsed_ms, 3),
+                    "rows": rows,
+                    "params": _redacted_params(sql, params),
+                },
+            )
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = sorted(
+                self._stats.items(), key=lambda kv: kv[1].total_ms, reverse=True
+            )
+            return {key: stats.to_dict() for key, stats in items}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class _TimedCursor:
+    """Cursor wrapper that finishes timing once rows have been fetched."""
+
+    def __init__(
+        self,
+        cursor: sqlite3.Cursor,
+        stats: QueryStats,
+        sql: str,
+        params: Any,
+        elapsed: float,
+    ) -> None:
+        self._cursor = cursor
+        self._stats = stats
+        self._sql = sql
+        self._params = params
+        self._elapsed = elapsed
+        self._rows = 0
+        self._done = False
+
+    def _finish(self) -> None:
+        if not self._done:
+            self._done = True
+            self._stats.record(
+                self._sql, self._params, self._elapsed * 1000, self._rows
+            )
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._elapsed += time.perf_counter() - started
+        self._rows += row is not None
+        self._finish()
+        return row
+
+    def fetchall(self) -> List[Any]:
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._elapsed += time.perf_counter() - started
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def fetchmany(self, size: int = 1) -> List[Any]:
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._elapsed += time.perf_counter() - started
+        self._rows += len(rows)
+        if not rows:
+            self._finish()
+        return rows
+
+    def __iter__(self) -> "_TimedCursor":
+        return self
+
+    def __next__(self) -> Any:
+        started = time.perf_counter()
+        try:
+            row = next(self._cursor)
+        except StopIteration:
+            self._finish()
+            raise
+        finally:
+            self._elapsed += time.perf_counter() - started
+        self._rows += 1
+        return row
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class TimedConnection:
+    """Delegating `sqlite3.Connection` proxy that times execute/executemany."""
+
+    def __init__(self, conn: sqlite3.Connection, stats: QueryStats) -> None:
+        self.raw = conn
+        self.stats = stats
+
+    def execute(self, sql: str, params: Sequence[Any] | Dict[str, Any] = ()) -> Any:
+        started = time.perf_counter()
+        cursor = self.raw.execute(sql, params)
+        elapsed = time.perf_counter() - started
+        if cursor.description is None:
+            rows = max(cursor.rowcount, 0)
+            self.stats.record(sql, params, elapsed * 1000, rows)
+            return cursor
+        return _TimedCursor(cursor, self.stats, sql, params, elapsed)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Any]) -> Any:
+        params = list(seq_of_params)
+        started = time.perf_counter()
+        cursor = self.raw.executemany(sql, params)
+        elapsed = time.perf_counter() - started
+        self.stats.record(
+            sql, params[0] if params else (), elapsed * 1000, max(cursor.rowcount, 0)
+        )
+        return cursor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+
+def unwrap(conn: Any) -> sqlite3.Connection:
+    return conn.raw if isinstance(conn, TimedConnection) else conn
+
+
+__all__ = ["QueryStats", "TimedConnection", "fingerprint", "unwrap"]
@@ -2,22 +2,42 @@
 
 Purpose:
     Apply ordered `.sql` files from the repository `migrations/` directory and
-    track which versions have been executed in `schema_migrations`.
+    track which versions have been executed in `schema_migrations`. Parsed
+    migration text is cached per directory (revalidated by file stat) with a
+    SHA-256 checksum, all pending migrations run in a single transaction, and
+    fresh in-memory databases can be cloned from a pre-migrated template.
 Dependencies:
-    Standard library only (sqlite3, pathlib).
+    Standard library only (sqlite3, pathlib, hashlib).
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Dict, List, NamedTuple, Tuple
 
 
 DEFAULT_MIGRATIONS_DIR = Path(__file__).resolve().parent.parent.parent / "migrations"
 
 
+class Migration(NamedTuple):
+    version: str
+    sql: str
+    checksum: str
+
+
+_Signature = Tuple[Tuple[str, int, int], ...]
+
+_cache_lock = threading.Lock()
+_template_lock = threading.Lock()
+_migration_cache: Dict[Path, Tuple[_Signature, List[Migration]]] = {}
+_templates: Dict[Tuple[Path, _Signature], sqlite3.Connection] = {}
+
+
 def _connect(db_path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
@@ -30,21 +50,53 @@ def _ensure_migrations_table(conn: sqlite3.Connection) -> None:
         """
         CREATE TABLE IF NOT EXISTS schema_migrations (
             version TEXT PRIMARY KEY,
-            applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            checksum TEXT
         );
         """
     )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(schema_migrations)")}
+    if "checksum" not in columns:
+        conn.execute("ALTER TABLE schema_migrations ADD COLUMN checksum TEXT")
     conn.commit()
 
 
-def _applied_versions(conn: sqlite3.Connection) -> Set[str]:
+def _applied_versions(conn: sqlite3.Connection) -> Dict[str, str | None]:
     _ensure_migrations_table(conn)
-    rows = conn.execute("SELECT version FROM schema_migrations").fetchall()
-    return {row["version"] for row in rows}
-
-
-def _load_migrations(migrations_dir: Path) -> Iterable[Path]:
-    return sorted(migrations_dir.glob("*.sql"))
+    rows = conn.execute("SELECT version, checksum FROM schema_migrations").fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _signature(migrations_dir: Path) -> _Signature:
+    with os.scandir(migrations_dir) as entries:
+        stats = [
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith(".sql") and entry.is_file()
+        ]
+    return tuple(sorted(stats))
+
+
+def _load_migrations(migrations_dir: Path) -> List[Migration]:
+    """Return parsed migrations, re-reading files only when their stat changes."""
+    key = Path(migrations_dir).resolve()
+    signature = _signature(key)
+    with _cache_lock:
+        cached = _migration_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+    migrations = []
+    for name, _, _ in signature:
+        sql = (key / name).read_text(encoding="utf-8")
+        checksum = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        migrations.append(Migration(name, sql, checksum))
+    with _cache_lock:
+        _migration_cache[key] = (signature, migrations)
+    return migrations
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
 
 
 def apply_migrations(
@@ -56,27 +108,66 @@ def apply_migrations(
     """Apply pending migrations to the SQLite database at `db_path`.
 
     If an open SQLite `connection` is provided the migrations run there; otherwise
-    the runner opens and owns its own connection.
+    the runner opens and owns its own connection. Pending migrations are applied
+    together in one transaction, so a failure leaves the schema untouched.
+    Raises ValueError if an already-applied migration file has been edited.
     """
     mig_dir = migrations_dir or DEFAULT_MIGRATIONS_DIR
     if connection is None and db_path is None:
         raise ValueError("db_path is required when a connection is not provided")
 
     conn = connection or _connect(db_path or "")
-    seen = _applied_versions(conn)
-
-    for migration in _load_migrations(mig_dir):
-        version = migration.name
-        if version in seen:
-            continue
-
-        sql = migration.read_text(encoding="utf-8")
-        conn.executescript(sql)
-        conn.execute("INSERT INTO schema_migrations(version) VALUES (?)", (version,))
-        conn.commit()
+    try:
+        seen = _applied_versions(conn)
+        pending: List[Migration] = []
+        for migration in _load_migrations(Path(mig_dir)):
+            if migration.version not in seen:
+                pending.append(migration)
+            elif seen[migration.version] not in (None, migration.checksum):
+                raise ValueError(
+                    f"migration {migration.version} changed after being applied"
+                )
+
+        if pending:
+            parts = ["BEGIN;"]
+            for migration in pending:
+                parts.append(migration.sql)
+                parts.append(
+                    "INSERT INTO schema_migrations(version, checksum) VALUES "
+                    f"({_quote(migration.version)}, {_quote(migration.checksum)});"
+                )
+            parts.append("COMMIT;")
+            try:
+                conn.executescript("\n".join(parts))
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+    finally:
+        if connection is None:
+            conn.close()
+
+
+def clone_migrated_template(
+    connection: sqlite3.Connection, migrations_dir: Path | None = None
+) -> None:
+    """Copy a pre-migrated in-memory schema into `connection`.
 
-    if connection is None:
-        conn.close()
+    The template is built once per migrations directory (and rebuilt if its files
+    change) and copied with the SQLite backup API, which is much cheaper than
+    re-running every migration script for each new in-memory database.
+    """
+    mig_dir = Path(migrations_dir or DEFAULT_MIGRATIONS_DIR).resolve()
+    key = (mig_dir, _signature(mig_dir))
+    with _template_lock:
+        template = _templates.get(key)
+        if template is None:
+            template = sqlite3.connect(":memory:", check_same_thread=False)
+            apply_migrations(None, mig_dir, connection=template)
+            for stale in [k for k in _templates if k[0] == mig_dir]:
+                _templates.pop(stale).close()
+            _templates[key] = template
+        template.backup(connection)
 
 
 def main() -> None:
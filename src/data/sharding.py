@@ -0,0 +1,612 @@
+"""Per-startup sharding on top of `DataStore`.
+
+Purpose:
+    Give every startup its own SQLite file for roles, scorecards, sequences, and
+    stage events so writes for different tenants no longer queue behind one
+    database writer lock. Candidates, startups, interactions, consent, audit,
+    and the change feed stay in a shared global store. `ShardedDataStore`
+    mirrors the `DataStore` method surface: per-entity calls are routed to the
+    owning shard and global listings fan out across shards.
+Routing:
+    The owning startup of every role, scorecard, sequence and stage event is
+    recorded in `shard_routes`. A routed write only touches its shard: the
+    route goes into the shard's own copy of the table, in the same
+    transaction as the row, and into an in-process map of routes not merged
+    yet. Lookups read that map and then the global table, so an unknown id
+    never opens a shard.
+Change feed:
+    Shards run the same migrations, so their CDC triggers fill each shard's
+    own `changes` table. Pending routes and changes are merged into the
+    global store in one batch per shard: when the feed is read, every
+    `sync_interval` seconds from a background thread, and on close. The
+    global feed gives one `seq` order and one set of consumer offsets for the
+    whole layout; rows from different shards are ordered by merge time.
+    Another process sees a new route once it has been merged.
+Layout:
+    `<root>/global.db` plus `<root>/shards/<startup_id>.db`.
+Dependencies:
+    Standard library only plus the local DataStore.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from uuid import uuid4
+
+from ..obs.logging import get_logger
+from .instrumentation import QueryStats
+from .migrations import DEFAULT_MIGRATIONS_DIR
+from .store import DataStore
+
+_SHARD_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+# Shard tables whose ids are recorded in `shard_routes`.
+_ROUTED_TABLES = ("roles", "scorecards", "sequences", "stage_events")
+
+
+def _delegate(name: str) -> Callable[..., Any]:
+    """Forward a method call to the global store."""
+
+    def method(self: "ShardedDataStore", *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.global_store, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = getattr(DataStore, name).__doc__
+    return method
+
+
+def _foreign_key_error() -> sqlite3.IntegrityError:
+    # Shards cannot enforce references into the global store, so the router
+    # checks them and raises what SQLite would have raised.
+    return sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+
+
+def _has_outbox(path: Path) -> bool:
+    """Whether a shard file holds routes or changes not merged yet."""
+    conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    try:
+        return bool(
+            conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM shard_routes) "
+                "OR EXISTS (SELECT 1 FROM changes)"
+            ).fetchone()[0]
+        )
+    except sqlite3.OperationalError:
+        return False  # not migrated yet
+    finally:
+        conn.close()
+
+
+class ShardedDataStore:
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        migrations_dir=DEFAULT_MIGRATIONS_DIR,
+        sync_interval: Optional[float] = 1.0,
+    ) -> None:
+        self.root = Path(root)
+        self.shard_dir = self.root / "shards"
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self.migrations_dir = migrations_dir
+        self.global_store = DataStore(
+            str(self.root / "global.db"), migrations_dir=migrations_dir
+        )
+        self._shards: Dict[str, DataStore] = {}
+        self._shards_lock = threading.Lock()
+        self._query_stats: Optional[QueryStats] = None
+        # Shards that may hold routes or changes not merged into global yet,
+        # and the routes this process wrote to them.
+        self._dirty: Set[str] = set()
+        self._pending_routes: Dict[str, str] = {}
+        self.sync_interval = sync_interval
+        self._closed = threading.Event()
+        self._syncer: Optional[threading.Thread] = None
+        self._logger = get_logger("scoutshonor.data.sharding")
+        if (
+            self.shard_ids()
+            and not self.global_store.conn.execute(
+                "SELECT 1 FROM shard_routes LIMIT 1"
+            ).fetchone()
+        ):
+            self.rebuild_routes()
+        # Merge what a previous process left behind, opening only those shards.
+        for startup_id in self.shard_ids():
+            if _has_outbox(self.shard_dir / f"{startup_id}.db"):
+                self._merge(startup_id, self.shard(startup_id))
+
+    # --- shard management ---
+    def shard(self, startup_id: str) -> DataStore:
+        """Return (opening or creating) the store holding `startup_id`'s data."""
+        if not _SHARD_ID_RE.match(startup_id):
+            raise ValueError(f"invalid startup id for sharding: {startup_id!r}")
+        store = self._shards.get(startup_id)
+        if store is not None:
+            return store
+        with self._shards_lock:
+            store = self._shards.get(startup_id)
+            if store is None:
+                store = DataStore(
+                    str(self.shard_dir / f"{startup_id}.db"),
+                    migrations_dir=self.migrations_dir,
+                )
+                store.conn.execute("PRAGMA foreign_keys = OFF")
+                if self._query_stats is not None:
+                    store.enable_query_stats(stats=self._query_stats)
+                self._shards[startup_id] = store
+            return store
+
+    def shard_ids(self) -> List[str]:
+        """Startup ids with a shard, including ones not opened yet."""
+        on_disk = {path.stem for path in self.shard_dir.glob("*.db")}
+        return sorted(on_disk | set(self._shards))
+
+    def _has_shard(self, startup_id: str) -> bool:
+        return startup_id in self._shards or (
+            bool(_SHARD_ID_RE.match(startup_id))
+            and (self.shard_dir / f"{startup_id}.db").exists()
+        )
+
+    def _all_shards(self) -> Iterator[Tuple[str, DataStore]]:
+        for startup_id in self.shard_ids():
+            yield startup_id, self.shard(startup_id)
+
+    # --- routing ---
+    def _route(self, entity_id: str) -> Optional[str]:
+        startup_id = self._pending_routes.get(entity_id)
+        if startup_id is not None:
+            return startup_id
+        row = self.global_store.conn.execute(
+            "SELECT startup_id FROM shard_routes WHERE entity_id = ?", (entity_id,)
+        ).fetchone()
+        return row["startup_id"] if row else None
+
+    def _add_routes(self, startup_id: str, entity_ids: List[str]) -> None:
+        with self.global_store.transaction() as store:
+            store.conn.executemany(
+                "INSERT OR REPLACE INTO shard_routes (entity_id, startup_id) "
+                "VALUES (?, ?)",
+                [(entity_id, startup_id) for entity_id in entity_ids],
+            )
+
+    def _drop_routes(self, store: DataStore, entity_ids: List[str]) -> None:
+        """Forget routes in `store`'s outbox (caller's transaction) and globally."""
+        if not entity_ids:
+            return
+        with self._shards_lock:
+            for entity_id in entity_ids:
+                self._pending_routes.pop(entity_id, None)
+        params = [(entity_id,) for entity_id in entity_ids]
+        sql = "DELETE FROM shard_routes WHERE entity_id = ?"
+        store.conn.executemany(sql, params)
+        with self.global_store.transaction() as target:
+            target.conn.executemany(sql, params)
+
+    def rebuild_routes(self) -> int:
+        """Re-index every shard's entity ids into `shard_routes`.
+
+        Only needed for shards written before routes were persisted; runs on
+        open when shards exist but the routing table is empty.
+        """
+        total = 0
+        for startup_id, store in self._all_shards():
+            ids = [
+                row["id"]
+                for table in _ROUTED_TABLES
+                for row in store.conn.execute(f"SELECT id FROM {table}")
+            ]
+            self._add_routes(startup_id, ids)
+            total += len(ids)
+        return total
+
+    def _locate(self, getter: str, entity_id: str) -> Optional[Tuple[str, Any]]:
+        """The shard owning `entity_id` and the row `getter` reads there."""
+        startup_id = self._route(entity_id)
+        if startup_id is None:
+            return None
+        row = getattr(self.shard(startup_id), getter)(entity_id)
+        return (startup_id, row) if row else None
+
+    @contextmanager
+    def _routed(self, startup_id: str, entity_id: str) -> Iterator[DataStore]:
+        """Write a new entity and its route in one `startup_id` shard commit."""
+        store = self.shard(startup_id)
+        with store.transaction():
+            store.conn.execute(
+                "INSERT OR REPLACE INTO shard_routes (entity_id, startup_id) "
+                "VALUES (?, ?)",
+                (entity_id, startup_id),
+            )
+            self._mark_dirty(startup_id, entity_id)
+            yield store
+
+    # --- merging shard outboxes ---
+    def _pending(self) -> List[str]:
+        with self._shards_lock:
+            return list(self._dirty)
+
+    def _mark_dirty(self, startup_id: str, entity_id: Optional[str] = None) -> None:
+        with self._shards_lock:
+            self._dirty.add(startup_id)
+            if entity_id is not None:
+                self._pending_routes[entity_id] = startup_id
+            if (
+                self._syncer is None
+                and self.sync_interval
+                and not self._closed.is_set()
+            ):
+                self._syncer = threading.Thread(
+                    target=self._run, name="shard-sync", daemon=True
+                )
+                self._syncer.start()
+
+    def _merge(self, startup_id: str, store: DataStore) -> int:
+        """Move one shard's pending routes and changes into the global store."""
+        with store._lock:
+            if store._tx_depth:
+                return 0  # merged after the enclosing transaction commits
+            with store.transaction():
+                routes = store.conn.execute(
+                    "SELECT entity_id, startup_id FROM shard_routes"
+                ).fetchall()
+                changes = store.conn.execute(
+                    "SELECT seq, table_name, row_id, op, changed_at FROM changes "
+                    "ORDER BY seq"
+                ).fetchall()
+                if routes or changes:
+                    with self.global_store.transaction() as target:
+                        target.conn.executemany(
+                            "INSERT OR REPLACE INTO shard_routes "
+                            "(entity_id, startup_id) VALUES (?, ?)",
+                            [tuple(row) for row in routes],
+                        )
+                        target.conn.executemany(
+                            "INSERT INTO changes (table_name, row_id, op, changed_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            [tuple(row)[1:] for row in changes],
+                        )
+                    store.conn.executemany(
+                        "DELETE FROM shard_routes WHERE entity_id = ?",
+                        [(row[0],) for row in routes],
+                    )
+                    if changes:
+                        store.conn.execute(
+                            "DELETE FROM changes WHERE seq <= ?", (changes[-1][0],)
+                        )
+            # Still under the shard lock, so a later write re-marks the shard.
+            with self._shards_lock:
+                self._dirty.discard(startup_id)
+                for row in routes:
+                    if self._pending_routes.get(row[0]) == startup_id:
+                        del self._pending_routes[row[0]]
+            return len(routes) + len(changes)
+
+    def sync_shards(self) -> int:
+        """Merge every open shard's pending routes and changes; rows moved."""
+        with self._shards_lock:
+            shards = list(self._shards.items())
+        return sum(self._merge(startup_id, store) for startup_id, store in shards)
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.sync_interval):
+            for startup_id in self._pending():
+                try:
+                    self._merge(startup_id, self.shard(startup_id))
+                except Exception:
+                    self._logger.exception(
+                        "shard merge failed", extra={"startup_id": startup_id}
+                    )
+
+    def changes_since(self, seq: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """Global change feed, including writes made directly on a shard."""
+        self.sync_shards()
+        return self.global_store.changes_since(seq, limit)
+
+    def _role_shard(self, role_id: str) -> Tuple[str, DataStore]:
+        found = self._locate("get_role", role_id)
+        if found is None:
+            raise _foreign_key_error()
+        return found[0], self.shard(found[0])
+
+    @staticmethod
+    def _by_time(rows: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+        return sorted(rows, key=lambda row: row.get(key) or "")
+
+    # --- transactions and stats ---
+    @contextmanager
+    def transaction(self, startup_id: Optional[str] = None) -> Iterator[DataStore]:
+        """Group writes on one store: the global one, or `startup_id`'s shard.
+
+        There is no cross-shard atomicity; each store commits independently.
+        """
+        store = self.shard(startup_id) if startup_id else self.global_store
+        if startup_id:
+            self._mark_dirty(startup_id)
+        with store.transaction():
+            yield store
+
+    def _stores(self) -> List[DataStore]:
+        with self._shards_lock:
+            return [self.global_store, *self._shards.values()]
+
+    def commit_stats(self) -> Dict[str, float]:
+        totals = {"commits": 0, "commit_seconds": 0.0}
+        for store in self._stores():
+            for key, value in store.commit_stats().items():
+                totals[key] += value
+        return totals
+
+    def enable_query_stats(self, slow_ms: float = 50.0) -> QueryStats:
+        stats = self.global_store.enable_query_stats(slow_ms)
+        self._query_stats = stats
+        for store in self._stores():
+            store.enable_query_stats(slow_ms, stats=stats)
+        return stats
+
+    def disable_query_stats(self) -> None:
+        self._query_stats = None
+        for store in self._stores():
+            store.disable_query_stats()
+
+    # --- global data ---
+    create_candidate = _delegate("create_candidate")
+    create_candidates = _delegate("create_candidates")
+    existing_emails = _delegate("existing_emails")
+    get_candidate = _delegate("get_candidate")
+    list_candidates = _delegate("list_candidates")
+    page_candidates = _delegate("page_candidates")
+    search_candidates = _delegate("search_candidates")
+    explain_search_candidates = _delegate("explain_search_candidates")
+    update_candidate = _delegate("update_candidate")
+    add_candidate_skills = _delegate("add_candidate_skills")
+    remove_candidate_skills = _delegate("remove_candidate_skills")
+    create_startup = _delegate("create_startup")
+    get_startup = _delegate("get_startup")
+    list_startups = _delegate("list_startups")
+    page_startups = _delegate("page_startups")
+    add_profile_source = _delegate("add_profile_source")
+    get_profile_source = _delegate("get_profile_source")
+    log_interaction = _delegate("log_interaction")
+    get_interaction = _delegate("get_interaction")
+    list_interactions = _delegate("list_interactions")
+    suppress_contact = _delegate("suppress_contact")
+    is_suppressed = _delegate("is_suppressed")
+    record_consent_event = _delegate("record_consent_event")
+    get_consent_event = _delegate("get_consent_event")
+    record_audit_event = _delegate("record_audit_event")
+    get_audit_event = _delegate("get_audit_event")
+    list_audit_events = _delegate("list_audit_events")
+    get_consumer_offset = _delegate("get_consumer_offset")
+    commit_consumer_offset = _delegate("commit_consumer_offset")
+    prune_changes = _delegate("prune_changes")
+    row_decoder = _delegate("row_decoder")
+    enable_audit_buffer = _delegate("enable_audit_buffer")
+    flush_audit_buffer = _delegate("flush_audit_buffer")
+    # Compressible columns all live in global tables.
+    enable_compression = _delegate("enable_compression")
+    compression_dictionary = _delegate("compression_dictionary")
+    train_compression_dictionary = _delegate("train_compression_dictionary")
+
+    def delete_candidate(self, candidate_id: str) -> None:
+        self.global_store.delete_candidate(candidate_id)
+        for startup_id, store in self._all_shards():
+            with store.transaction():
+                rows = store.conn.execute(
+                    "DELETE FROM stage_events WHERE candidate_id = ? RETURNING id",
+                    (candidate_id,),
+                ).fetchall()
+                if rows:
+                    self._drop_routes(store, [row["id"] for row in rows])
+                    self._mark_dirty(startup_id)
+
+    # --- roles ---
+    def create_role(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        startup_id = payload["startup_id"]
+        if self.global_store.get_startup(startup_id) is None:
+            raise _foreign_key_error()
+        role_id = payload.get("id") or str(uuid4())
+        with self._routed(startup_id, role_id) as store:
+            return store.create_role({**payload, "id": role_id})
+
+    def get_role(self, role_id: str) -> Optional[Dict[str, Any]]:
+        found = self._locate("get_role", role_id)
+        return found[1] if found else None
+
+    def list_roles(self, startup_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        if startup_id:
+            if not self._has_shard(startup_id):
+                return []
+            return self.shard(startup_id).list_roles(startup_id)
+        rows = [row for _, store in self._all_shards() for row in store.list_roles()]
+        return self._by_time(rows, "created_at")
+
+    def page_roles(
+        self,
+        startup_id: Optional[str] = None,
+        *,
+        after: Any = None,
+        limit: int = 50,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Any]:
+        """Keyset page of roles; across shards the key is `[startup_id, rowid]`.
+
+        Without `startup_id`, shards are walked in startup-id order, so a page
+        may end on a shard boundary and the last page may be empty.
+        """
+        if startup_id:
+            if not self._has_shard(startup_id):
+                return [], None
+            return self.shard(startup_id).page_roles(
+                startup_id, after=after or 0, limit=limit, columns=columns
+            )
+        shard_after, row_after = after or ("", 0)
+        rows: List[Dict[str, Any]] = []
+        for sid in self.shard_ids():
+            if sid < shard_after:
+                continue
+            if len(rows) == limit:
+                return rows, [sid, 0]
+            page, next_key = self.shard(sid).page_roles(
+                after=row_after if sid == shard_after else 0,
+                limit=limit - len(rows),
+                columns=columns,
+            )
+            rows.extend(page)
+            if next_key is not None:
+                return rows, [sid, next_key]
+        return rows, None
+
+    def update_role(
+        self, role_id: str, updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        found = self._locate("get_role", role_id)
+        if found is None:
+            return None
+        self._mark_dirty(found[0])
+        return self.shard(found[0]).update_role(role_id, updates)
+
+    def delete_role(self, role_id: str) -> None:
+        found = self._locate("get_role", role_id)
+        if found is None:
+            return
+        store = self.shard(found[0])
+        # Foreign keys are off in shards, so cascade by hand.
+        removed = [role_id]
+        with store.transaction():
+            for table in ("scorecards", "sequences", "stage_events"):
+                removed += [
+                    row["id"]
+                    for row in store.conn.execute(
+                        f"DELETE FROM {table} WHERE role_id = ? RETURNING id",
+                        (role_id,),
+                    ).fetchall()
+                ]
+            store.delete_role(role_id)
+            self._drop_routes(store, removed)
+        self._mark_dirty(found[0])
+
+    # --- scorecards and sequences ---
+    def create_scorecard(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        startup_id, _ = self._role_shard(payload["role_id"])
+        scorecard_id = payload.get("id") or str(uuid4())
+        with self._routed(startup_id, scorecard_id) as store:
+            return store.create_scorecard({**payload, "id": scorecard_id})
+
+    def get_scorecard(self, scorecard_id: str) -> Optional[Dict[str, Any]]:
+        found = self._locate("get_scorecard", scorecard_id)
+        return found[1] if found else None
+
+    def list_scorecards(self, role_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        if role_id:
+            found = self._locate("get_role", role_id)
+            return self.shard(found[0]).list_scorecards(role_id) if found else []
+        rows = [r for _, store in self._all_shards() for r in store.list_scorecards()]
+        return self._by_time(rows, "created_at")
+
+    def create_sequence(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        startup_id, _ = self._role_shard(payload["role_id"])
+        sequence_id = payload.get("id") or str(uuid4())
+        with self._routed(startup_id, sequence_id) as store:
+            return store.create_sequence({**payload, "id": sequence_id})
+
+    def get_sequence(self, sequence_id: str) -> Optional[Dict[str, Any]]:
+        found = self._locate("get_sequence", sequence_id)
+        return found[1] if found else None
+
+    def list_sequences(self, role_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        if role_id:
+            found = self._locate("get_role", role_id)
+            return self.shard(found[0]).list_sequences(role_id) if found else []
+        rows = [r for _, store in self._all_shards() for r in store.list_sequences()]
+        return self._by_time(rows, "created_at")
+
+    # --- stage events ---
+    def record_stage_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.global_store.get_candidate(payload["candidate_id"]) is None:
+            raise _foreign_key_error()
+        startup_id, _ = self._role_shard(payload["role_id"])
+        event_id = payload.get("id") or str(uuid4())
+        with self._routed(startup_id, event_id) as store:
+            return store.record_stage_event({**payload, "id": event_id})
+
+    def get_stage_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        found = self._locate("get_stage_event", event_id)
+        return found[1] if found else None
+
+    def list_stage_events(self, candidate_id: str) -> List[Dict[str, Any]]:
+        rows = [
+            row
+            for _, store in self._all_shards()
+            for row in store.list_stage_events(candidate_id)
+        ]
+        return self._by_time(rows, "occurred_at")
+
+    # --- snapshots ---
+    def snapshot(
+        self,
+        path: Path | str,
+        pages_per_step: int = 256,
+        *,
+        progress: Optional[Callable[[int, int], None]] = None,
+        pause_seconds: float = 0.0,
+    ) -> Path:
+        """Snapshot the global store and every shard into directory `path`."""
+        target = Path(path)
+        self.sync_shards()
+        options = dict(progress=progress, pause_seconds=pause_seconds)
+        self.global_store.snapshot(target / "global.db", pages_per_step, **options)
+        for startup_id, store in self._all_shards():
+            store.snapshot(
+                target / "shards" / f"{startup_id}.db", pages_per_step, **options
+            )
+        return target
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot_path: Path | str,
+        root: Path | str,
+        *,
+        migrations_dir=DEFAULT_MIGRATIONS_DIR,
+    ) -> "ShardedDataStore":
+        """Restore a directory written by `snapshot` into `root`."""
+        source = Path(snapshot_path)
+        target = Path(root)
+        (target / "shards").mkdir(parents=True, exist_ok=True)
+        files = [Path("global.db")] + [
+            Path("shards") / p.name for p in (source / "shards").glob("*.db")
+        ]
+        for relative in files:
+            DataStore.from_snapshot(
+                source / relative,
+                str(target / relative),
+                migrations_dir=migrations_dir,
+            ).close()
+        return cls(target, migrations_dir=migrations_dir)
+
+    def close(self) -> None:
+        """Stop the merge thread, merge what is pending, and close every store."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+        self.sync_shards()
+        for store in self._stores():
+            store.close()
+        with self._shards_lock:
+            self._shards.clear()
@@ -5,24 +5,89 @@ Purpose:
     interactions, sequences, and stage events with light consent/suppression
     checks. Intended for early prototyping; swap out with a fuller ORM later.
 Dependencies:
-    Standard library sqlite3/json/uuid plus local migration runner.
+    Standard library sqlite3/json/uuid plus local migration runner. Writes use
+    `RETURNING` and JSON1 functions, so SQLite >= 3.35 is required.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import re
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import wraps
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from uuid import uuid4
 
-from .migrations import apply_migrations, DEFAULT_MIGRATIONS_DIR
+from .audit_sink import AuditSink, BufferedEvent
+from .compression import (
+    add_dictionary_source,
+    all_columns,
+    compress_text,
+    decompress_text,
+    dictionary_id,
+    register_dictionary,
+    remove_dictionary_source,
+    train_dictionary,
+)
+from .instrumentation import QueryStats, TimedConnection, unwrap
+from .migrations import (
+    apply_migrations,
+    clone_migrated_template,
+    DEFAULT_MIGRATIONS_DIR,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CONSENT_COLUMNS = (
+    "id",
+    "contact",
+    "candidate_id",
+    "status",
+    "source",
+    "notes",
+    "recorded_at",
+)
+_AUDIT_COLUMNS = ("id", "event_type", "subject_id", "detail", "created_at")
+
+_CONSENT_INSERT_SQL = """
+    INSERT INTO consent_events (id, contact, candidate_id, status, source, notes, recorded_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_AUDIT_INSERT_SQL = """
+    INSERT INTO audit_logs (id, event_type, subject_id, detail, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
 
 
 def _now() -> str:
     return datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat()
 
 
+def _casefold(value: Any) -> Any:
+    """SQL `casefold(x)`: Unicode case folding, matching `str.casefold`."""
+    return value.casefold() if isinstance(value, str) else value
+
+
 def _dump_list(values: Optional[List[Any]]) -> str:
     return json.dumps(values or [])
 
@@ -35,6 +100,249 @@ def _json_or_empty(raw: Any) -> Any:
     return json.loads(raw) if raw else []
 
 
+_CANDIDATE_INSERT_SQL = """
+    INSERT INTO candidates (
+        id, full_name, current_title, titles, years_experience, skills,
+        domains, locations, timezone, remote_preference, stage_preferences,
+        linkedin_url, email, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _candidate_params(
+    payload: Dict[str, Any], candidate_id: str, now: str
+) -> Tuple[Any, ...]:
+    return (
+        candidate_id,
+        payload["full_name"],
+        payload.get("current_title"),
+        _dump_list(payload.get("titles")),
+        int(payload.get("years_experience", 0)),
+        _dump_list(payload.get("skills")),
+        _dump_list(payload.get("domains")),
+        _dump_list(payload.get("locations")),
+        payload.get("timezone"),
+        int(payload["remote_preference"])
+        if payload.get("remote_preference") is not None
+        else None,
+        _dump_list(payload.get("stage_preferences")),
+        payload.get("linkedin_url"),
+        payload.get("email"),
+        now,
+    )
+
+
+def _candidate_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "full_name": row["full_name"],
+        "current_title": row["current_title"],
+        "titles": _json_or_empty(row["titles"]),
+        "years_experience": row["years_experience"],
+        "skills": _json_or_empty(row["skills"]),
+        "domains": _json_or_empty(row["domains"]),
+        "locations": _json_or_empty(row["locations"]),
+        "timezone": row["timezone"],
+        "remote_preference": (
+            bool(row["remote_preference"])
+            if row["remote_preference"] is not None
+            else None
+        ),
+        "stage_preferences": _json_or_empty(row["stage_preferences"]),
+        "linkedin_url": row["linkedin_url"],
+        "email": row["email"],
+        "created_at": row["created_at"],
+    }
+
+
+def _startup_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "stage": row["stage"],
+        "domains": _json_or_empty(row["domains"]),
+        "location": row["location"],
+        "description": row["description"],
+        "website": row["website"],
+        "mission": row["mission"],
+        "stack": _json_or_empty(row["stack"]),
+        "created_at": row["created_at"],
+    }
+
+
+def _role_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "startup_id": row["startup_id"],
+        "title": row["title"],
+        "required_skills": _json_or_empty(row["required_skills"]),
+        "nice_to_have_skills": _json_or_empty(row["nice_to_have_skills"]),
+        "min_years_experience": row["min_years_experience"],
+        "responsibilities": _json_or_empty(row["responsibilities"]),
+        "seniority": row["seniority"],
+        "location_preference": row["location_preference"],
+        "remote_ok": bool(row["remote_ok"]),
+        "compensation_range": row["compensation_range"],
+        "recruiter_notes": row["recruiter_notes"],
+        "created_at": row["created_at"],
+    }
+
+
+def _optional_bool(raw: Any) -> Optional[bool]:
+    return bool(raw) if raw is not None else None
+
+
+def _json_object(raw: Any) -> Any:
+    return json.loads(raw or "{}")
+
+
+def _compressed_json_object(raw: Any) -> Any:
+    return json.loads(decompress_text(raw) or "{}")
+
+
+# Per-column conversions for projected reads; other columns pass through.
+# Compressed columns are only decompressed when a read selects them.
+_COLUMN_DECODERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "candidates": {
+        **dict.fromkeys(
+            ("titles", "skills", "domains", "locations", "stage_preferences"),
+            _json_or_empty,
+        ),
+        "remote_preference": _optional_bool,
+    },
+    "startups": dict.fromkeys(("domains", "stack"), _json_or_empty),
+    "roles": {
+        **dict.fromkeys(
+            ("required_skills", "nice_to_have_skills", "responsibilities"),
+            _json_or_empty,
+        ),
+        "remote_ok": bool,
+    },
+    "interactions": {"body": decompress_text, "metadata": _json_object},
+    "profile_sources": {"notes": decompress_text},
+    "audit_logs": {"detail": _compressed_json_object},
+}
+
+
+def _scorecard_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "role_id": row["role_id"],
+        "summary": row["summary"],
+        "must_haves": _json_or_empty(row["must_haves"]),
+        "nice_to_haves": _json_or_empty(row["nice_to_haves"]),
+        "evaluation_points": _json_or_empty(row["evaluation_points"]),
+        "created_at": row["created_at"],
+    }
+
+
+def _profile_source_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "candidate_id": row["candidate_id"],
+        "source": row["source"],
+        "handle": row["handle"],
+        "url": row["url"],
+        "notes": decompress_text(row["notes"]),
+        "company": row["company"],
+        "imported_at": row["imported_at"],
+    }
+
+
+def _interaction_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "candidate_id": row["candidate_id"],
+        "channel": row["channel"],
+        "direction": row["direction"],
+        "subject": row["subject"],
+        "body": decompress_text(row["body"]),
+        "status": row["status"],
+        "outcome": row["outcome"],
+        "metadata": _json_object(row["metadata"]),
+        "occurred_at": row["occurred_at"],
+    }
+
+
+def _sequence_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "role_id": row["role_id"],
+        "name": row["name"],
+        "steps": _json_or_empty(row["steps"]),
+        "active": bool(row["active"]),
+        "created_at": row["created_at"],
+    }
+
+
+def _stage_event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "candidate_id": row["candidate_id"],
+        "role_id": row["role_id"],
+        "stage": row["stage"],
+        "status": row["status"],
+        "notes": row["notes"],
+        "occurred_at": row["occurred_at"],
+    }
+
+
+def _consent_event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "contact": row["contact"],
+        "candidate_id": row["candidate_id"],
+        "status": row["status"],
+        "source": row["source"],
+        "notes": row["notes"],
+        "recorded_at": row["recorded_at"],
+    }
+
+
+def _audit_event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "event_type": row["event_type"],
+        "subject_id": row["subject_id"],
+        "detail": _compressed_json_object(row["detail"]),
+        "created_at": row["created_at"],
+    }
+
+
+# Full-row decoders behind `DataStore.row_decoder`.
+_ROW_DECODERS: Dict[str, Callable[[sqlite3.Row], Dict[str, Any]]] = {
+    "candidates": _candidate_from_row,
+    "startups": _startup_from_row,
+    "roles": _role_from_row,
+    "scorecards": _scorecard_from_row,
+    "profile_sources": _profile_source_from_row,
+    "interactions": _interaction_from_row,
+    "sequences": _sequence_from_row,
+    "stage_events": _stage_event_from_row,
+    "consent_events": _consent_event_from_row,
+    "audit_logs": _audit_event_from_row,
+}
+
+
+def latest_snapshot(directory: Path | str) -> Optional[Path]:
+    """Return the most recently written `*.db` snapshot in `directory`."""
+    candidates = [p for p in Path(directory).glob("*.db") if p.is_file()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: (p.stat().st_mtime, p.name))
+
+
+def _locked(method: F) -> F:
+    """Serialize a write method on the store's connection lock."""
+
+    @wraps(method)
+    def wrapper(self: "DataStore", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return cast(F, wrapper)
+
+
 class DataStore:
     def __init__(
         self,
@@ -42,49 +350,250 @@ class DataStore:
         *,
         run_migrations: bool = True,
         migrations_dir=DEFAULT_MIGRATIONS_DIR,
+        use_template: bool = True,
     ) -> None:
+        """Open the store; in-memory stores clone a pre-migrated template.
+
+        Set `use_template=False` to run the migration scripts directly.
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path)
+        # Writers from other threads (e.g. the audit sink) share this
+        # connection; `_lock` serializes them.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON")
-        if run_migrations:
+        self.conn.create_function("casefold", 1, _casefold, deterministic=True)
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._audit_sink: Optional[AuditSink] = None
+        # Buffered events the sink wrote into the open transaction; they go
+        # back to the sink if it rolls back.
+        self._flushed_in_tx: List[BufferedEvent] = []
+        self.commit_count = 0
+        self.commit_seconds = 0.0
+        self.query_stats: Optional[QueryStats] = None
+        self._compressed: FrozenSet[str] = frozenset()
+        self._compress_min_size = 128
+        self._compress_level = 6
+        self._zdicts: Dict[str, bytes] = {}
+        self._table_columns: Dict[str, FrozenSet[str]] = {}
+        if run_migrations and use_template and db_path == ":memory:":
+            clone_migrated_template(self.conn, migrations_dir)
+        elif run_migrations:
             apply_migrations(
                 self.db_path, migrations_dir=migrations_dir, connection=self.conn
             )
+        if run_migrations:
+            self._register_dictionaries()
+            add_dictionary_source(self._load_dictionary)
+
+    # --- transactions ---
+    @contextmanager
+    def transaction(self) -> Iterator["DataStore"]:
+        """Group writes into a single commit.
+
+        The outermost block owns the transaction and commits once on exit; nested
+        blocks run inside savepoints so an inner failure only rolls back its own
+        writes. Any exception escaping the outermost block rolls everything back.
+        """
+        with self._lock:
+            depth = self._tx_depth
+            flushed = len(self._flushed_in_tx)
+            savepoint = f"sp_{depth}"
+            if depth == 0:
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN")
+            else:
+                self.conn.execute(f"SAVEPOINT {savepoint}")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if depth == 0:
+                    self.conn.rollback()
+                else:
+                    self.conn.execute(f"ROLLBACK TO {savepoint}")
+                    self.conn.execute(f"RELEASE {savepoint}")
+                if self._audit_sink is not None and self._flushed_in_tx[flushed:]:
+                    self._audit_sink.requeue(self._flushed_in_tx[flushed:])
+                del self._flushed_in_tx[flushed:]
+                raise
+            self._tx_depth -= 1
+            if depth == 0:
+                self._flushed_in_tx.clear()
+                self._commit()
+            else:
+                self.conn.execute(f"RELEASE {savepoint}")
+
+    def _commit(self) -> None:
+        if self._tx_depth:
+            return
+        started = time.perf_counter()
+        self.conn.commit()
+        self.commit_count += 1
+        self.commit_seconds += time.perf_counter() - started
+
+    def commit_stats(self) -> Dict[str, float]:
+        """Return commit count and cumulative commit latency for this store."""
+        return {
+            "commits": self.commit_count,
+            "commit_seconds": self.commit_seconds,
+        }
+
+    # --- column compression ---
+    def enable_compression(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        *,
+        min_size: int = 128,
+        level: int = 6,
+    ) -> FrozenSet[str]:
+        """Compress new values of `table.column` names (default: all eligible).
+
+        Values shorter than `min_size` characters are stored as plain text, and
+        the newest trained dictionary for a column is used when one exists.
+        Reads decode both forms, so enabling this never breaks existing rows; use
+        `src.jobs.recompress` to shrink rows written before it was enabled.
+        """
+        selected = frozenset(columns) if columns is not None else all_columns()
+        unknown = selected - all_columns()
+        if unknown:
+            raise ValueError(f"columns not compressible: {sorted(unknown)}")
+        self._compressed = selected
+        self._compress_min_size = min_size
+        self._compress_level = level
+        self._zdicts = {}
+        for column in selected:
+            zdict = self.compression_dictionary(column)
+            if zdict:
+                self._zdicts[column] = zdict
+        return selected
+
+    def compression_dictionary(self, column: str) -> Optional[bytes]:
+        """Newest preset dictionary stored for `table.column`, if any."""
+        row = self.conn.execute(
+            "SELECT zdict FROM compression_dicts WHERE column_name = ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (column,),
+        ).fetchone()
+        return bytes(row["zdict"]) if row else None
+
+    @_locked
+    def train_compression_dictionary(
+        self, column: str, *, sample_size: int = 1000
+    ) -> Optional[bytes]:
+        """Train and store a dictionary from recent values of `table.column`.
+
+        Returns None when the samples share too little text to be useful.
+        """
+        if column not in all_columns():
+            raise ValueError(f"column not compressible: {column}")
+        table, name = column.split(".")
+        self.flush_audit_buffer()
+        rows = self.conn.execute(
+            f"SELECT {name} FROM {table} WHERE {name} IS NOT NULL "
+            "ORDER BY rowid DESC LIMIT ?",
+            (sample_size,),
+        ).fetchall()
+        zdict = train_dictionary(decompress_text(row[0]) for row in rows)
+        if not zdict:
+            return None
+        self.conn.execute(
+            "INSERT OR IGNORE INTO compression_dicts (id, column_name, zdict, "
+            "created_at) VALUES (?, ?, ?, ?)",
+            (dictionary_id(zdict).hex(), column, zdict, _now()),
+        )
+        self._commit()
+        register_dictionary(zdict)
+        if column in self._compressed:
+            self._zdicts[column] = zdict
+        return zdict
+
+    def _register_dictionaries(self) -> None:
+        for row in self.conn.execute("SELECT zdict FROM compression_dicts"):
+            register_dictionary(bytes(row["zdict"]))
+
+    def _load_dictionary(self, key: bytes) -> Optional[bytes]:
+        # A dictionary trained by another process after this store opened.
+        row = self.conn.execute(
+            "SELECT zdict FROM compression_dicts WHERE id = ?", (key.hex(),)
+        ).fetchone()
+        return bytes(row["zdict"]) if row else None
+
+    def _pack(self, column: str, value: Any) -> Any:
+        if column not in self._compressed:
+            return value
+        return compress_text(
+            value,
+            min_size=self._compress_min_size,
+            level=self._compress_level,
+            zdict=self._zdicts.get(column),
+        )
+
+    # --- query instrumentation ---
+    def enable_query_stats(
+        self, slow_ms: float = 50.0, *, stats: Optional[QueryStats] = None
+    ) -> QueryStats:
+        """Time every statement and log those slower than `slow_ms`.
+
+        Disabled stores talk to the raw connection, so the timing proxy costs
+        nothing until this is called. Pass `stats` to aggregate several stores
+        into one collector.
+        """
+        with self._lock:
+            if self.query_stats is None:
+                self.query_stats = stats or QueryStats(slow_ms=slow_ms)
+                self.conn = cast(
+                    sqlite3.Connection, TimedConnection(self.conn, self.query_stats)
+                )
+            self.query_stats.slow_ms = slow_ms
+            return self.query_stats
+
+    def disable_query_stats(self) -> None:
+        with self._lock:
+            self.conn = unwrap(self.conn)
+            self.query_stats = None
 
     # --- candidate CRUD ---
+    @_locked
     def create_candidate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        candidate_id = payload.get("id", str(uuid4()))
+        row = self.conn.execute(
+            _CANDIDATE_INSERT_SQL + " RETURNING *",
+            _candidate_params(payload, payload.get("id", str(uuid4())), _now()),
+        ).fetchone()
+        self._commit()
+        return _candidate_from_row(row)
+
+    @_locked
+    def create_candidates(self, payloads: Iterable[Dict[str, Any]]) -> List[str]:
+        """Insert many candidates with one `executemany` and one commit.
+
+        Returns the new ids in payload order; rows are not read back. A failing
+        row (e.g. a duplicate email) rolls the whole batch back.
+        """
         now = _now()
-        self.conn.execute(
-            """
-            INSERT INTO candidates (
-                id, full_name, current_title, titles, years_experience, skills,
-                domains, locations, timezone, remote_preference, stage_preferences,
-                linkedin_url, email, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                candidate_id,
-                payload["full_name"],
-                payload.get("current_title"),
-                _dump_list(payload.get("titles")),
-                int(payload.get("years_experience", 0)),
-                _dump_list(payload.get("skills")),
-                _dump_list(payload.get("domains")),
-                _dump_list(payload.get("locations")),
-                payload.get("timezone"),
-                int(payload["remote_preference"])
-                if payload.get("remote_preference") is not None
-                else None,
-                _dump_list(payload.get("stage_preferences")),
-                payload.get("linkedin_url"),
-                payload.get("email"),
-                now,
-            ),
-        )
-        self.conn.commit()
-        return self.get_candidate(candidate_id) or {}
+        params = [
+            _candidate_params(payload, payload.get("id", str(uuid4())), now)
+            for payload in payloads
+        ]
+        with self.transaction():
+            self.conn.executemany(_CANDIDATE_INSERT_SQL, params)
+        return [row[0] for row in params]
+
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Lower-cased members of `emails` that some candidate already uses."""
+        wanted = sorted({email.strip().lower() for email in emails if email})
+        found: Set[str] = set()
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start : start + 500]
+            rows = self.conn.execute(
+                "SELECT lower(email) FROM candidates WHERE email IS NOT NULL "
+                f"AND lower(email) IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
 
     def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -92,31 +601,178 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "full_name": row["full_name"],
-            "current_title": row["current_title"],
-            "titles": _json_or_empty(row["titles"]),
-            "years_experience": row["years_experience"],
-            "skills": _json_or_empty(row["skills"]),
-            "domains": _json_or_empty(row["domains"]),
-            "locations": _json_or_empty(row["locations"]),
-            "timezone": row["timezone"],
-            "remote_preference": (
-                bool(row["remote_preference"])
-                if row["remote_preference"] is not None
-                else None
-            ),
-            "stage_preferences": _json_or_empty(row["stage_preferences"]),
-            "linkedin_url": row["linkedin_url"],
-            "email": row["email"],
-            "created_at": row["created_at"],
-        }
+        return _candidate_from_row(row)
 
     def list_candidates(self) -> List[Dict[str, Any]]:
-        rows = self.conn.execute("SELECT * FROM candidates").fetchall()
+        rows = self.conn.execute("SELECT id FROM candidates").fetchall()
         return [self.get_candidate(row["id"]) or {} for row in rows]
 
+    def page_candidates(
+        self,
+        *,
+        after: int = 0,
+        limit: int = 50,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Up to `limit` candidates after key `after`, in insertion order.
+
+        Returns the rows plus the `after` key for the next page (None on the
+        last page). Keys are rowids, so each page is an index range scan.
+        With `columns`, only those columns are read and decoded.
+        """
+        return self._page("candidates", _candidate_from_row, after, limit, columns)
+
+    def _columns_of(self, table: str) -> FrozenSet[str]:
+        known = self._table_columns.get(table)
+        if known is None:
+            rows = self.conn.execute(f"PRAGMA table_info({table})").fetchall()
+            known = self._table_columns[table] = frozenset(row[1] for row in rows)
+        return known
+
+    def row_decoder(self, table: str) -> Callable[[sqlite3.Row], Dict[str, Any]]:
+        """Turn a `SELECT *` row of `table` into the dict the store's reads return.
+
+        For callers that run their own queries, e.g. exports on a separate
+        read-only connection.
+        """
+        try:
+            return _ROW_DECODERS[table]
+        except KeyError:
+            raise ValueError(f"no row decoder for table {table!r}") from None
+
+    def _projection(
+        self,
+        table: str,
+        decode: Callable[[sqlite3.Row], Dict[str, Any]],
+        columns: Optional[Sequence[str]],
+    ) -> Tuple[str, Callable[[sqlite3.Row], Dict[str, Any]]]:
+        """Select list and row decoder for `columns` (all columns when None)."""
+        if not columns:
+            return "*", decode
+        columns = list(dict.fromkeys(columns))
+        unknown = set(columns) - self._columns_of(table)
+        if unknown:
+            raise ValueError(f"unknown {table} columns: {sorted(unknown)}")
+        converters = _COLUMN_DECODERS.get(table, {})
+        plan = [(name, converters.get(name)) for name in columns]
+
+        def project(row: sqlite3.Row) -> Dict[str, Any]:
+            return {
+                name: convert(row[name]) if convert else row[name]
+                for name, convert in plan
+            }
+
+        return ", ".join(columns), project
+
+    def _page(
+        self,
+        table: str,
+        decode: Callable[[sqlite3.Row], Dict[str, Any]],
+        after: int,
+        limit: int,
+        columns: Optional[Sequence[str]] = None,
+        where: str = "",
+        params: Tuple[Any, ...] = (),
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        selected, decode = self._projection(table, decode, columns)
+        rows = self.conn.execute(
+            f"SELECT rowid AS page_key, {selected} FROM {table} "
+            f"WHERE rowid > ?{where} ORDER BY rowid LIMIT ?",
+            (after, *params, limit + 1),
+        ).fetchall()
+        if len(rows) <= limit:
+            return [decode(row) for row in rows], None
+        rows = rows[:limit]
+        return [decode(row) for row in rows], rows[-1]["page_key"]
+
+    def search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Case-insensitive search mirroring `InMemoryRepo.search_candidates`.
+
+        All `skills` must be present; any of `titles` (past or current) and any
+        of `domains` match; `location` must equal one of the candidate locations.
+        Every word of `text` must appear as a substring of the name, current
+        title or past titles (no typo tolerance or ranking; this scans).
+        """
+        sql, params = self._search_sql(skills, titles, domains, location, text)
+        rows = self.conn.execute(sql, params).fetchall()
+        return [_candidate_from_row(row) for row in rows]
+
+    def explain_search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> List[str]:
+        """`EXPLAIN QUERY PLAN` detail lines for `search_candidates`."""
+        sql, params = self._search_sql(skills, titles, domains, location, text)
+        rows = self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return [row["detail"] for row in rows]
+
+    @staticmethod
+    def _search_sql(
+        skills: Optional[List[str]],
+        titles: Optional[List[str]],
+        domains: Optional[List[str]],
+        location: Optional[str],
+        text: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        def norm(values: Optional[List[str]]) -> List[str]:
+            return sorted({v.strip().lower() for v in (values or []) if v})
+
+        def any_of(column: str, count: int) -> str:
+            marks = ", ".join("?" * count)
+            return (
+                f"EXISTS (SELECT 1 FROM json_each(candidates.{column}) "
+                f"WHERE lower(trim(value)) IN ({marks}))"
+            )
+
+        for skill in norm(skills):
+            clauses.append(any_of("skills", 1))
+            params.append(skill)
+        wanted_titles = norm(titles)
+        if wanted_titles:
+            marks = ", ".join("?" * len(wanted_titles))
+            clauses.append(
+                f"({any_of('titles', len(wanted_titles))} "
+                f"OR lower(trim(current_title)) IN ({marks}))"
+            )
+            params.extend(wanted_titles * 2)
+        wanted_domains = norm(domains)
+        if wanted_domains:
+            clauses.append(any_of("domains", len(wanted_domains)))
+            params.extend(wanted_domains)
+        loc = (location or "").strip().lower()
+        if loc:
+            clauses.append(any_of("locations", 1))
+            params.append(loc)
+        for word in dict.fromkeys(re.findall(r"\w+", (text or "").casefold())):
+            # casefold(), not lower(): SQLite's lower() only folds ASCII.
+            # Titles are matched per element; the JSON text escapes non-ASCII.
+            clauses.append(
+                "(casefold(full_name) LIKE ? ESCAPE '\\' "
+                "OR casefold(current_title) LIKE ? ESCAPE '\\' "
+                "OR EXISTS (SELECT 1 FROM json_each(candidates.titles) "
+                "WHERE casefold(value) LIKE ? ESCAPE '\\'))"
+            )
+            pattern = "%" + word.replace("_", r"\_") + "%"
+            params.extend([pattern] * 3)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return f"SELECT * FROM candidates{where}", params
+
+    @_locked
     def update_candidate(
         self, candidate_id: str, updates: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -151,26 +807,81 @@ class DataStore:
             return self.get_candidate(candidate_id)
 
         values.append(candidate_id)
-        self.conn.execute(
-            f"UPDATE candidates SET {', '.join(fields)} WHERE id = ?", values
-        )
-        self.conn.commit()
-        return self.get_candidate(candidate_id)
+        row = self.conn.execute(
+            f"UPDATE candidates SET {', '.join(fields)} WHERE id = ? RETURNING *",
+            values,
+        ).fetchone()
+        self._commit()
+        return _candidate_from_row(row) if row else None
+
+    @_locked
+    def add_candidate_skills(
+        self, candidate_id: str, skills: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Append skills not already present, patching the JSON array in SQLite."""
+        additions = list(dict.fromkeys(skills))
+        row = self.conn.execute(
+            """
+            UPDATE candidates SET skills = (
+                SELECT json_group_array(value) FROM (
+                    SELECT 0 AS part, CAST(key AS INTEGER) AS pos, value
+                    FROM json_each(candidates.skills)
+                    UNION ALL
+                    SELECT 1, CAST(new.key AS INTEGER), new.value
+                    FROM json_each(?) AS new
+                    WHERE new.value NOT IN (
+                        SELECT value FROM json_each(candidates.skills)
+                    )
+                    ORDER BY part, pos
+                )
+            )
+            WHERE id = ?
+            RETURNING *
+            """,
+            (json.dumps(additions), candidate_id),
+        ).fetchone()
+        self._commit()
+        return _candidate_from_row(row) if row else None
+
+    @_locked
+    def remove_candidate_skills(
+        self, candidate_id: str, skills: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Drop the given skills, patching the JSON array in SQLite."""
+        row = self.conn.execute(
+            """
+            UPDATE candidates SET skills = (
+                SELECT json_group_array(value) FROM (
+                    SELECT value FROM json_each(candidates.skills)
+                    WHERE value NOT IN (SELECT value FROM json_each(?))
+                    ORDER BY CAST(key AS INTEGER)
+                )
+            )
+            WHERE id = ?
+            RETURNING *
+            """,
+            (json.dumps(list(skills)), candidate_id),
+        ).fetchone()
+        self._commit()
+        return _candidate_from_row(row) if row else None
 
+    @_locked
     def delete_candidate(self, candidate_id: str) -> None:
         self.conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
-        self.conn.commit()
+        self._commit()
 
     # --- startup / role / scorecard ---
+    @_locked
     def create_startup(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         startup_id = payload.get("id", str(uuid4()))
         now = _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO startups (
                 id, name, stage, domains, location, description, website,
                 mission, stack, created_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 startup_id,
@@ -184,9 +895,9 @@ class DataStore:
                 _dump_list(payload.get("stack")),
                 now,
             ),
-        )
-        self.conn.commit()
-        return self.get_startup(startup_id) or {}
+        ).fetchone()
+        self._commit()
+        return _startup_from_row(row)
 
     def get_startup(self, startup_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -194,23 +905,27 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "stage": row["stage"],
-            "domains": _json_or_empty(row["domains"]),
-            "location": row["location"],
-            "description": row["description"],
-            "website": row["website"],
-            "mission": row["mission"],
-            "stack": _json_or_empty(row["stack"]),
-            "created_at": row["created_at"],
-        }
+        return _startup_from_row(row)
 
+    def list_startups(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT id FROM startups").fetchall()
+        return [self.get_startup(row["id"]) or {} for row in rows]
+
+    def page_startups(
+        self,
+        *,
+        after: int = 0,
+        limit: int = 50,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Keyset page of startups; see `page_candidates`."""
+        return self._page("startups", _startup_from_row, after, limit, columns)
+
+    @_locked
     def create_role(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         role_id = payload.get("id", str(uuid4()))
         now = _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO roles (
                 id, startup_id, title, required_skills, nice_to_have_skills,
@@ -218,6 +933,7 @@ class DataStore:
                 location_preference, remote_ok, compensation_range, recruiter_notes,
                 created_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 role_id,
@@ -234,9 +950,9 @@ class DataStore:
                 payload.get("recruiter_notes"),
                 now,
             ),
-        )
-        self.conn.commit()
-        return self.get_role(role_id) or {}
+        ).fetchone()
+        self._commit()
+        return _role_from_row(row)
 
     def get_role(self, role_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -244,31 +960,39 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "startup_id": row["startup_id"],
-            "title": row["title"],
-            "required_skills": _json_or_empty(row["required_skills"]),
-            "nice_to_have_skills": _json_or_empty(row["nice_to_have_skills"]),
-            "min_years_experience": row["min_years_experience"],
-            "responsibilities": _json_or_empty(row["responsibilities"]),
-            "seniority": row["seniority"],
-            "location_preference": row["location_preference"],
-            "remote_ok": bool(row["remote_ok"]),
-            "compensation_range": row["compensation_range"],
-            "recruiter_notes": row["recruiter_notes"],
-            "created_at": row["created_at"],
-        }
+        return _role_from_row(row)
 
     def list_roles(self, startup_id: Optional[str] = None) -> List[Dict[str, Any]]:
         if startup_id:
             rows = self.conn.execute(
-                "SELECT * FROM roles WHERE startup_id = ?", (startup_id,)
+                "SELECT id FROM roles WHERE startup_id = ?", (startup_id,)
             ).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM roles").fetchall()
+            rows = self.conn.execute("SELECT id FROM roles").fetchall()
         return [self.get_role(row["id"]) or {} for row in rows]
 
+    def page_roles(
+        self,
+        startup_id: Optional[str] = None,
+        *,
+        after: int = 0,
+        limit: int = 50,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Keyset page of roles, optionally for one startup; see `page_candidates`."""
+        if startup_id:
+            return self._page(
+                "roles",
+                _role_from_row,
+                after,
+                limit,
+                columns,
+                " AND startup_id = ?",
+                (startup_id,),
+            )
+        return self._page("roles", _role_from_row, after, limit, columns)
+
+    @_locked
     def update_role(
         self, role_id: str, updates: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -297,23 +1021,28 @@ class DataStore:
         if not fields:
             return self.get_role(role_id)
         values.append(role_id)
-        self.conn.execute(f"UPDATE roles SET {', '.join(fields)} WHERE id = ?", values)
-        self.conn.commit()
-        return self.get_role(role_id)
+        row = self.conn.execute(
+            f"UPDATE roles SET {', '.join(fields)} WHERE id = ? RETURNING *", values
+        ).fetchone()
+        self._commit()
+        return _role_from_row(row) if row else None
 
+    @_locked
     def delete_role(self, role_id: str) -> None:
         self.conn.execute("DELETE FROM roles WHERE id = ?", (role_id,))
-        self.conn.commit()
+        self._commit()
 
+    @_locked
     def create_scorecard(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         scorecard_id = payload.get("id", str(uuid4()))
         now = _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO scorecards (
                 id, role_id, summary, must_haves, nice_to_haves, evaluation_points,
                 created_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 scorecard_id,
@@ -324,9 +1053,9 @@ class DataStore:
                 _dump_list(payload.get("evaluation_points")),
                 now,
             ),
-        )
-        self.conn.commit()
-        return self.get_scorecard(scorecard_id) or {}
+        ).fetchone()
+        self._commit()
+        return _scorecard_from_row(row)
 
     def get_scorecard(self, scorecard_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -334,34 +1063,29 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "role_id": row["role_id"],
-            "summary": row["summary"],
-            "must_haves": _json_or_empty(row["must_haves"]),
-            "nice_to_haves": _json_or_empty(row["nice_to_haves"]),
-            "evaluation_points": _json_or_empty(row["evaluation_points"]),
-            "created_at": row["created_at"],
-        }
+        return _scorecard_from_row(row)
 
     def list_scorecards(self, role_id: Optional[str] = None) -> List[Dict[str, Any]]:
         if role_id:
             rows = self.conn.execute(
-                "SELECT * FROM scorecards WHERE role_id = ?", (role_id,)
+                "SELECT id FROM scorecards WHERE role_id = ?", (role_id,)
             ).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM scorecards").fetchall()
+            rows = self.conn.execute("SELECT id FROM scorecards").fetchall()
         return [self.get_scorecard(row["id"]) or {} for row in rows]
 
     # --- sourcing and outreach primitives ---
+    @_locked
     def add_profile_source(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         source_id = payload.get("id", str(uuid4()))
         now = payload.get("imported_at") or _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO profile_sources (
-                id, candidate_id, source, handle, url, notes, imported_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                id, candidate_id, source, handle, url, notes, company,
+                imported_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 source_id,
@@ -369,12 +1093,13 @@ class DataStore:
                 payload["source"],
                 payload.get("handle"),
                 payload.get("url"),
-                payload.get("notes"),
+                self._pack("profile_sources.notes", payload.get("notes")),
+                payload.get("company"),
                 now,
             ),
-        )
-        self.conn.commit()
-        return self.get_profile_source(source_id) or {}
+        ).fetchone()
+        self._commit()
+        return _profile_source_from_row(row)
 
     def get_profile_source(self, source_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -382,16 +1107,9 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "candidate_id": row["candidate_id"],
-            "source": row["source"],
-            "handle": row["handle"],
-            "url": row["url"],
-            "notes": row["notes"],
-            "imported_at": row["imported_at"],
-        }
+        return _profile_source_from_row(row)
 
+    @_locked
     def log_interaction(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         candidate_id = payload["candidate_id"]
         candidate = self.get_candidate(candidate_id)
@@ -415,12 +1133,13 @@ class DataStore:
 
         interaction_id = payload.get("id", str(uuid4()))
         occurred_at = payload.get("occurred_at") or _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO interactions (
                 id, candidate_id, channel, direction, subject, body, status,
                 outcome, metadata, occurred_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 interaction_id,
@@ -428,15 +1147,15 @@ class DataStore:
                 payload["channel"],
                 payload["direction"],
                 payload.get("subject"),
-                payload.get("body"),
+                self._pack("interactions.body", payload.get("body")),
                 payload.get("status"),
                 payload.get("outcome"),
                 _dump_dict(payload.get("metadata")),
                 occurred_at,
             ),
-        )
-        self.conn.commit()
-        return self.get_interaction(interaction_id) or {}
+        ).fetchone()
+        self._commit()
+        return _interaction_from_row(row)
 
     def get_interaction(self, interaction_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -444,40 +1163,38 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "candidate_id": row["candidate_id"],
-            "channel": row["channel"],
-            "direction": row["direction"],
-            "subject": row["subject"],
-            "body": row["body"],
-            "status": row["status"],
-            "outcome": row["outcome"],
-            "metadata": json.loads(row["metadata"] or "{}"),
-            "occurred_at": row["occurred_at"],
-        }
+        return _interaction_from_row(row)
 
     def list_interactions(
-        self, candidate_id: Optional[str] = None
+        self,
+        candidate_id: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
+        """Interactions by time; leave `body` out of `columns` to skip decoding it."""
+        selected, decode = self._projection(
+            "interactions", _interaction_from_row, columns
+        )
         if candidate_id:
             rows = self.conn.execute(
-                "SELECT * FROM interactions WHERE candidate_id = ? ORDER BY occurred_at",
+                f"SELECT {selected} FROM interactions WHERE candidate_id = ? "
+                "ORDER BY occurred_at",
                 (candidate_id,),
             ).fetchall()
         else:
             rows = self.conn.execute(
-                "SELECT * FROM interactions ORDER BY occurred_at"
+                f"SELECT {selected} FROM interactions ORDER BY occurred_at"
             ).fetchall()
-        return [self.get_interaction(row["id"]) or {} for row in rows]
+        return [decode(row) for row in rows]
 
+    @_locked
     def create_sequence(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         sequence_id = payload.get("id", str(uuid4()))
         now = payload.get("created_at") or _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO sequences (id, role_id, name, steps, active, created_at)
             VALUES (?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 sequence_id,
@@ -487,9 +1204,9 @@ class DataStore:
                 int(payload.get("active", True)),
                 now,
             ),
-        )
-        self.conn.commit()
-        return self.get_sequence(sequence_id) or {}
+        ).fetchone()
+        self._commit()
+        return _sequence_from_row(row)
 
     def get_sequence(self, sequence_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -497,32 +1214,27 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "role_id": row["role_id"],
-            "name": row["name"],
-            "steps": _json_or_empty(row["steps"]),
-            "active": bool(row["active"]),
-            "created_at": row["created_at"],
-        }
+        return _sequence_from_row(row)
 
     def list_sequences(self, role_id: Optional[str] = None) -> List[Dict[str, Any]]:
         if role_id:
             rows = self.conn.execute(
-                "SELECT * FROM sequences WHERE role_id = ?", (role_id,)
+                "SELECT id FROM sequences WHERE role_id = ?", (role_id,)
             ).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM sequences").fetchall()
+            rows = self.conn.execute("SELECT id FROM sequences").fetchall()
         return [self.get_sequence(row["id"]) or {} for row in rows]
 
+    @_locked
     def record_stage_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         event_id = payload.get("id", str(uuid4()))
         occurred_at = payload.get("occurred_at") or _now()
-        self.conn.execute(
+        row = self.conn.execute(
             """
             INSERT INTO stage_events (
                 id, candidate_id, role_id, stage, status, notes, occurred_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
             """,
             (
                 event_id,
@@ -533,9 +1245,9 @@ class DataStore:
                 payload.get("notes"),
                 occurred_at,
             ),
-        )
-        self.conn.commit()
-        return self.get_stage_event(event_id) or {}
+        ).fetchone()
+        self._commit()
+        return _stage_event_from_row(row)
 
     def get_stage_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         row = self.conn.execute(
@@ -543,41 +1255,34 @@ class DataStore:
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "candidate_id": row["candidate_id"],
-            "role_id": row["role_id"],
-            "stage": row["stage"],
-            "status": row["status"],
-            "notes": row["notes"],
-            "occurred_at": row["occurred_at"],
-        }
+        return _stage_event_from_row(row)
 
     def list_stage_events(self, candidate_id: str) -> List[Dict[str, Any]]:
         rows = self.conn.execute(
-            "SELECT * FROM stage_events WHERE candidate_id = ? ORDER BY occurred_at",
+            "SELECT id FROM stage_events WHERE candidate_id = ? ORDER BY occurred_at",
             (candidate_id,),
         ).fetchall()
         return [self.get_stage_event(row["id"]) or {} for row in rows]
 
     # --- suppression and consent scaffolding ---
+    @_locked
     def suppress_contact(
         self, contact: str, reason: str | None = None, source: str | None = None
     ) -> None:
         now = _now()
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO suppression_list (contact, reason, source, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (contact.lower(), reason, source, now),
-        )
-        self.conn.commit()
-        self.record_audit_event(
-            event_type="suppression_added",
-            subject_id=contact.lower(),
-            detail={"reason": reason, "source": source},
-        )
+        with self.transaction():
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO suppression_list (contact, reason, source, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (contact.lower(), reason, source, now),
+            )
+            self.record_audit_event(
+                event_type="suppression_added",
+                subject_id=contact.lower(),
+                detail={"reason": reason, "source": source},
+            )
 
     def is_suppressed(self, contact: str) -> bool:
         row = self.conn.execute(
@@ -585,6 +1290,7 @@ class DataStore:
         ).fetchone()
         return bool(row)
 
+    @_locked
     def record_consent_event(
         self,
         *,
@@ -594,42 +1300,32 @@ class DataStore:
         source: Optional[str] = None,
         notes: Optional[str] = None,
     ) -> Dict[str, Any]:
-        event_id = str(uuid4())
-        recorded_at = _now()
-        self.conn.execute(
-            """
-            INSERT INTO consent_events (id, contact, candidate_id, status, source, notes, recorded_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_id,
-                contact.lower(),
-                candidate_id,
-                status,
-                source,
-                notes,
-                recorded_at,
-            ),
+        params = (
+            str(uuid4()),
+            contact.lower(),
+            candidate_id,
+            status,
+            source,
+            notes,
+            _now(),
         )
-        self.conn.commit()
-        return self.get_consent_event(event_id) or {}
+        if self._audit_sink is not None and not self._tx_depth:
+            self._audit_sink.submit("consent_events", params)
+            return dict(zip(_CONSENT_COLUMNS, params))
+        row = self.conn.execute(_CONSENT_INSERT_SQL + " RETURNING *", params).fetchone()
+        self._commit()
+        return _consent_event_from_row(row)
 
     def get_consent_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        self.flush_audit_buffer()
         row = self.conn.execute(
             "SELECT * FROM consent_events WHERE id = ?", (event_id,)
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "contact": row["contact"],
-            "candidate_id": row["candidate_id"],
-            "status": row["status"],
-            "source": row["source"],
-            "notes": row["notes"],
-            "recorded_at": row["recorded_at"],
-        }
+        return _consent_event_from_row(row)
 
+    @_locked
     def record_audit_event(
         self,
         *,
@@ -637,45 +1333,219 @@ class DataStore:
         subject_id: Optional[str],
         detail: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        audit_id = str(uuid4())
-        created_at = _now()
-        self.conn.execute(
-            """
-            INSERT INTO audit_logs (id, event_type, subject_id, detail, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (audit_id, event_type, subject_id, _dump_dict(detail), created_at),
+        detail_json = _dump_dict(detail)
+        params = (
+            str(uuid4()),
+            event_type,
+            subject_id,
+            self._pack("audit_logs.detail", detail_json),
+            _now(),
         )
-        self.conn.commit()
-        return self.get_audit_event(audit_id) or {}
+        if self._audit_sink is not None and not self._tx_depth:
+            self._audit_sink.submit("audit_logs", params)
+            return {
+                **dict(zip(_AUDIT_COLUMNS, params)),
+                "detail": json.loads(detail_json),
+            }
+        row = self.conn.execute(_AUDIT_INSERT_SQL + " RETURNING *", params).fetchone()
+        self._commit()
+        return _audit_event_from_row(row)
 
     def get_audit_event(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        self.flush_audit_buffer()
         row = self.conn.execute(
             "SELECT * FROM audit_logs WHERE id = ?", (audit_id,)
         ).fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "event_type": row["event_type"],
-            "subject_id": row["subject_id"],
-            "detail": json.loads(row["detail"] or "{}"),
-            "created_at": row["created_at"],
-        }
+        return _audit_event_from_row(row)
 
     def list_audit_events(
-        self, event_type: Optional[str] = None
+        self,
+        event_type: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
+        """Newest first; leave `detail` out of `columns` to skip decoding it."""
+        self.flush_audit_buffer()
+        selected, decode = self._projection(
+            "audit_logs", _audit_event_from_row, columns
+        )
         if event_type:
             rows = self.conn.execute(
-                "SELECT * FROM audit_logs WHERE event_type = ? ORDER BY created_at DESC",
+                f"SELECT {selected} FROM audit_logs WHERE event_type = ? "
+                "ORDER BY created_at DESC",
                 (event_type,),
             ).fetchall()
         else:
             rows = self.conn.execute(
-                "SELECT * FROM audit_logs ORDER BY created_at DESC"
+                f"SELECT {selected} FROM audit_logs ORDER BY created_at DESC"
             ).fetchall()
-        return [self.get_audit_event(row["id"]) or {} for row in rows]
+        return [decode(row) for row in rows]
+
+    # --- change data capture ---
+    def changes_since(self, seq: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """Return outbox entries with `seq` greater than the given cursor.
+
+        Callers pass the last `seq` they processed and advance to the final entry
+        returned; an empty list means they are caught up.
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM changes WHERE seq > ? ORDER BY seq LIMIT ?",
+            (seq, limit),
+        ).fetchall()
+        return [
+            {
+                "seq": row["seq"],
+                "table": row["table_name"],
+                "row_id": row["row_id"],
+                "op": row["op"],
+                "changed_at": row["changed_at"],
+            }
+            for row in rows
+        ]
+
+    def get_consumer_offset(self, consumer: str) -> int:
+        row = self.conn.execute(
+            "SELECT last_seq FROM change_consumers WHERE consumer = ?", (consumer,)
+        ).fetchone()
+        return row["last_seq"] if row else 0
+
+    @_locked
+    def commit_consumer_offset(self, consumer: str, seq: int) -> int:
+        """Advance a consumer's offset; offsets never move backwards."""
+        row = self.conn.execute(
+            """
+            INSERT INTO change_consumers (consumer, last_seq, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (consumer) DO UPDATE SET
+                last_seq = max(last_seq, excluded.last_seq),
+                updated_at = excluded.updated_at
+            RETURNING last_seq
+            """,
+            (consumer, seq, _now()),
+        ).fetchone()
+        self._commit()
+        return row["last_seq"]
+
+    @_locked
+    def prune_changes(self) -> int:
+        """Delete outbox entries every registered consumer has already processed."""
+        cursor = self.conn.execute(
+            """
+            DELETE FROM changes
+            WHERE seq <= (SELECT min(last_seq) FROM change_consumers)
+            """
+        )
+        self._commit()
+        return cursor.rowcount
+
+    # --- buffered audit / consent writes ---
+    def enable_audit_buffer(
+        self,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+    ) -> AuditSink:
+        """Route audit and consent events through a write-behind sink.
+
+        Events are queued and flushed in batches by a background thread; reads of
+        audit/consent data flush first so callers always see their own events.
+        Inside `transaction()` events are written with it instead, so they commit
+        or roll back with the caller's other writes.
+        """
+        if self._audit_sink is None:
+            self._audit_sink = AuditSink(
+                self,
+                max_queue=max_queue,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+            )
+        return self._audit_sink
+
+    def flush_audit_buffer(self) -> int:
+        """Write any buffered audit/consent events; returns the number written."""
+        if self._audit_sink is None:
+            return 0
+        return self._audit_sink.flush()
+
+    def _write_buffered_events(self, batch: List[Tuple[str, Tuple[Any, ...]]]) -> None:
+        grouped: Dict[str, List[Tuple[Any, ...]]] = {}
+        for table, params in batch:
+            grouped.setdefault(table, []).append(params)
+        with self.transaction():
+            if grouped.get("audit_logs"):
+                self.conn.executemany(_AUDIT_INSERT_SQL, grouped["audit_logs"])
+            if grouped.get("consent_events"):
+                self.conn.executemany(_CONSENT_INSERT_SQL, grouped["consent_events"])
+        if self._tx_depth:
+            # A read inside the caller's transaction flushed these into it.
+            self._flushed_in_tx.extend(batch)
+
+    # --- snapshots ---
+    def snapshot(
+        self,
+        path: Path | str,
+        pages_per_step: int = 256,
+        *,
+        progress: Optional[Callable[[int, int], None]] = None,
+        pause_seconds: float = 0.0,
+    ) -> Path:
+        """Write a consistent online copy of the database to `path`.
+
+        Uses the SQLite incremental backup API: `pages_per_step` pages are copied
+        per step and the source is only locked while a step runs, so writers keep
+        going in between. `pause_seconds` sleeps after each step to throttle the
+        copy; `progress(copied_pages, total_pages)` is called after every step.
+        The copy lands in a `.partial` file and is renamed into place when done.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = target.with_name(target.name + ".partial")
+
+        def _on_step(status: int, remaining: int, total: int) -> None:
+            if progress is not None:
+                progress(total - remaining, total)
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        self.flush_audit_buffer()
+        dest = sqlite3.connect(partial)
+        try:
+            self.conn.backup(dest, pages=pages_per_step, progress=_on_step)
+        finally:
+            dest.close()
+        os.replace(partial, target)
+        return target
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot_path: Path | str,
+        db_path: str = ":memory:",
+        *,
+        migrations_dir=DEFAULT_MIGRATIONS_DIR,
+    ) -> "DataStore":
+        """Open a store seeded from a snapshot (replacing `db_path` contents).
+
+        Only migrations newer than the snapshot are applied afterwards, so new
+        workers skip replaying the full migration and import history.
+        """
+        source = sqlite3.connect(f"file:{Path(snapshot_path)}?mode=ro", uri=True)
+        store = cls(db_path, run_migrations=False)
+        try:
+            source.backup(store.conn)
+        finally:
+            source.close()
+        apply_migrations(
+            store.db_path, migrations_dir=migrations_dir, connection=store.conn
+        )
+        store._register_dictionaries()
+        return store
 
     def close(self) -> None:
+        if self._audit_sink is not None:
+            self._audit_sink.close()
+            self._audit_sink = None
+        remove_dictionary_source(self._load_dictionary)
         self.conn.close()
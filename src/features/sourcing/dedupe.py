@@ -0,0 +1,414 @@
+"""Fuzzy entity resolution for imported and stored candidates.
+
+Purpose:
+    Exact fingerprints miss near-duplicates such as "Jon Smith, Acme Inc." vs
+    "Jonathan Smith, ACME". `FuzzyDeduper` normalizes names (nicknames,
+    accents, punctuation) and companies (legal suffixes), then finds match
+    candidates through
+    - blocking keys: exact email, and first initial + last name, and
+    - MinHash/LSH over name trigrams, company and skills,
+    so each record is compared with a bounded number of earlier records and
+    resolution stays roughly linear. Candidate pairs are confirmed with a
+    weighted name/company/skills similarity against `DedupeConfig.threshold`.
+    `merge_records` collapses a cluster with a survivor policy.
+Dependencies:
+    Standard library only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+import struct
+import unicodedata
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .importer import ImportedCandidate
+
+# Common English nicknames -> canonical first name.
+NICKNAMES = {
+    "abby": "abigail",
+    "alex": "alexander",
+    "andy": "andrew",
+    "ben": "benjamin",
+    "beth": "elizabeth",
+    "bill": "william",
+    "bob": "robert",
+    "bobby": "robert",
+    "chris": "christopher",
+    "dan": "daniel",
+    "danny": "daniel",
+    "dave": "david",
+    "drew": "andrew",
+    "ed": "edward",
+    "greg": "gregory",
+    "jen": "jennifer",
+    "jenny": "jennifer",
+    "jim": "james",
+    "jimmy": "james",
+    "joe": "joseph",
+    "jon": "jonathan",
+    "kate": "katherine",
+    "katie": "katherine",
+    "liz": "elizabeth",
+    "matt": "matthew",
+    "meg": "margaret",
+    "mike": "michael",
+    "nick": "nicholas",
+    "pat": "patrick",
+    "rich": "richard",
+    "rick": "richard",
+    "rob": "robert",
+    "sam": "samuel",
+    "steve": "steven",
+    "sue": "susan",
+    "ted": "edward",
+    "tom": "thomas",
+    "tony": "anthony",
+    "will": "william",
+}
+_COMPANY_NOISE = frozenset(
+    "ag bv co company corp corporation gmbh inc incorporated llc ltd limited "
+    "plc sa the".split()
+)
+MERGE_POLICIES = ("first", "most_complete")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    return _WORD_RE.findall("".join(c for c in folded if not unicodedata.combining(c)))
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase ascii-folded name with the first name de-nicknamed.
+
+    Single-letter middle initials are dropped.
+    """
+    parts = _tokens(name)
+    if len(parts) > 2:
+        parts = [parts[0]] + [p for p in parts[1:-1] if len(p) > 1] + [parts[-1]]
+    if parts:
+        parts[0] = NICKNAMES.get(parts[0], parts[0])
+    return " ".join(parts)
+
+
+def normalize_company(company: Optional[str]) -> str:
+    return " ".join(t for t in _tokens(company) if t not in _COMPANY_NOISE)
+
+
+def _grams(text: str) -> FrozenSet[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """The fields entity resolution looks at."""
+
+    name: Optional[str]
+    company: Optional[str] = None
+    skills: Tuple[str, ...] = ()
+    email: Optional[str] = None
+
+    @classmethod
+    def from_imported(cls, candidate: ImportedCandidate) -> "Profile":
+        return cls(
+            candidate.full_name,
+            candidate.company,
+            tuple(candidate.skills),
+            candidate.email,
+        )
+
+    @classmethod
+    def from_row(
+        cls, row: Mapping[str, Any], company: Optional[str] = None
+    ) -> "Profile":
+        """Profile for a `DataStore` candidate row (which has no company)."""
+        return cls(
+            row.get("full_name"),
+            company,
+            tuple(row.get("skills") or ()),
+            row.get("email"),
+        )
+
+
+@dataclass(frozen=True)
+class _Features:
+    name: str
+    name_grams: FrozenSet[str]
+    company_grams: FrozenSet[str]
+    skills: FrozenSet[str]
+    email: str
+    blocks: Tuple[Tuple[str, ...], ...]
+    bands: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class DedupeConfig:
+    """Thresholds for `FuzzyDeduper`.
+
+    `threshold` applies to the weighted mean of the name, company and skills
+    similarities present on both sides; pairs whose names are less similar
+    than `min_name_similarity` never match. `bands` x `rows` MinHash values
+    are bucketed per band: more rows per band means fewer, closer candidate
+    pairs. At most `max_bucket` records are kept per bucket and at most
+    `max_candidates` earlier records (those sharing the most buckets) are
+    scored per new record, which keeps the work per record constant.
+    """
+
+    threshold: float = 0.75
+    min_name_similarity: float = 0.6
+    weights: Mapping[str, float] = field(
+        default_factory=lambda: {"name": 0.6, "company": 0.25, "skills": 0.15}
+    )
+    bands: int = 16
+    rows: int = 4
+    max_bucket: int = 100
+    max_candidates: int = 10
+    seed: int = 1
+
+
+class FuzzyDeduper:
+    """Incremental near-duplicate detection; see the module docstring.
+
+    `add` returns the index of the earliest record of the entity the new
+    record duplicates (indexes count every added record), or None when it
+    starts a new entity.
+    """
+
+    def __init__(self, config: Optional[DedupeConfig] = None) -> None:
+        self.config = config or DedupeConfig()
+        count = self.config.bands * self.config.rows
+        self._salt = f"{self.config.seed}:".encode()
+        self._digest_size = 4 * count
+        self._unpack = struct.Struct(f"<{count}I").unpack
+        self._gram_cache: Dict[str, Tuple[int, ...]] = {}
+        self._features: List[_Features] = []
+        self._roots: List[int] = []
+        self._buckets: Dict[Any, List[int]] = {}
+        self.comparisons = 0
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def _hashes(self, shingle: str) -> Tuple[int, ...]:
+        """One 32-bit hash per MinHash function, from a single XOF digest."""
+        data = self._salt + shingle.encode("utf-8")
+        return self._unpack(hashlib.shake_128(data).digest(self._digest_size))
+
+    def _gram_hashes(self, gram: str) -> Tuple[int, ...]:
+        # Name trigrams come from a small vocabulary, so they are cached;
+        # companies are mostly unique and hashed on the fly.
+        cached = self._gram_cache.get(gram)
+        if cached is None:
+            cached = self._gram_cache[gram] = self._hashes(gram)
+        return cached
+
+    def _featurize(self, profile: Profile) -> _Features:
+        name = normalize_name(profile.name)
+        company = normalize_company(profile.company)
+        skills = frozenset(s.strip().casefold() for s in profile.skills if s.strip())
+        email = (profile.email or "").strip().lower()
+        name_grams = _grams(name) if name else frozenset()
+        blocks: List[Tuple[str, ...]] = []
+        if email:
+            blocks.append(("email", email))
+        parts = name.split()
+        if parts:
+            blocks.append(("name", parts[0][0], parts[-1]))
+        # Skills stay out of the signature: a small shared vocabulary would
+        # make unrelated people collide in the LSH bands.
+        hashed = list(map(self._gram_hashes, name_grams))
+        if company:
+            hashed.append(self._hashes(f"c:{company}"))
+        bands: List[int] = []
+        if hashed:
+            signature = list(map(min, zip(*hashed)))
+            rows = self.config.rows
+            for band in range(self.config.bands):
+                bands.append(hash((band, *signature[band * rows : (band + 1) * rows])))
+        company_grams = _grams(company) if company else frozenset()
+        return _Features(
+            name, name_grams, company_grams, skills, email, tuple(blocks), tuple(bands)
+        )
+
+    def similarity(self, a: Profile, b: Profile) -> float:
+        """Weighted similarity in [0, 1] used to confirm a candidate pair."""
+        return self._score(self._featurize(a), self._featurize(b))
+
+    def _score(self, a: _Features, b: _Features) -> float:
+        if a.email and a.email == b.email:
+            return 1.0
+        name = _jaccard(a.name_grams, b.name_grams)
+        if name < self.config.min_name_similarity:
+            return 0.0
+        weights = self.config.weights
+        parts = [(weights["name"], name)]
+        if a.company_grams and b.company_grams:
+            company = _jaccard(a.company_grams, b.company_grams)
+            parts.append((weights["company"], company))
+        if a.skills and b.skills:
+            parts.append((weights["skills"], _jaccard(a.skills, b.skills)))
+        total = sum(weight for weight, _ in parts)
+        return sum(weight * value for weight, value in parts) / total
+
+    def add(self, profile: Profile) -> Optional[int]:
+        features = self._featurize(profile)
+        index = len(self._features)
+        # Rank earlier records by shared buckets (a blocking key outranks any
+        # number of bands) and confirm only the best `max_candidates`.
+        votes: Dict[int, int] = {}
+        for key in features.blocks:
+            for other in self._buckets.get(key, ()):
+                votes[other] = votes.get(other, 0) + self.config.bands
+        for key in features.bands:
+            for other in self._buckets.get(key, ()):
+                votes[other] = votes.get(other, 0) + 1
+        if len(votes) > self.config.max_candidates:
+            ranked = heapq.nlargest(
+                self.config.max_candidates, votes, key=votes.__getitem__
+            )
+        else:
+            ranked = list(votes)
+        self.comparisons += len(ranked)
+        best: Optional[int] = None
+        best_score = self.config.threshold
+        for other in ranked:
+            score = self._score(features, self._features[other])
+            if score >= best_score and (best is None or score > best_score):
+                best, best_score = other, score
+        self._features.append(features)
+        root = index if best is None else self._roots[best]
+        self._roots.append(root)
+        for key in (*features.blocks, *features.bands):
+            bucket = self._buckets.setdefault(key, [])
+            if len(bucket) < self.config.max_bucket:
+                bucket.append(index)
+        return None if best is None else root
+
+    def add_imported(self, candidate: ImportedCandidate) -> Optional[int]:
+        return self.add(Profile.from_imported(candidate))
+
+    def clusters(self) -> List[List[int]]:
+        """Indexes grouped by entity, for entities with more than one record."""
+        groups: Dict[int, List[int]] = {}
+        for index, root in enumerate(self._roots):
+            groups.setdefault(root, []).append(index)
+        return [group for group in groups.values() if len(group) > 1]
+
+
+def find_duplicates(
+    profiles: Iterable[Profile], config: Optional[DedupeConfig] = None
+) -> List[List[int]]:
+    """Clusters of near-duplicate profile indexes, each in input order."""
+    deduper = FuzzyDeduper(config)
+    for profile in profiles:
+        deduper.add(profile)
+    return deduper.clusters()
+
+
+def _filled(value: Any) -> bool:
+    return value not in (None, "", [], (), {})
+
+
+def merge_records(
+    records: Sequence[Mapping[str, Any]],
+    policy: str = "first",
+    list_fields: Iterable[str] = ("skills",),
+) -> Tuple[int, Dict[str, Any]]:
+    """Pick a survivor for one cluster and merge the others into it.
+
+    `policy` is "first" (earliest record survives) or "most_complete" (the
+    record with the most filled fields; earliest on ties). The survivor's
+    empty fields are filled from the other records in order and
+    `list_fields` become order-preserving unions. Returns the survivor's
+    position in `records` and the merged values.
+    """
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"unknown merge policy {policy!r}")
+    if policy == "first":
+        survivor = 0
+    else:
+        survivor = max(
+            range(len(records)),
+            key=lambda i: (sum(map(_filled, records[i].values())), -i),
+        )
+    merged = dict(records[survivor])
+    others = [r for i, r in enumerate(records) if i != survivor]
+    list_fields = set(list_fields)
+    for key in list_fields:
+        if key in merged:
+            values = list(merged[key] or [])
+            for record in others:
+                values.extend(record.get(key) or [])
+            merged[key] = list(dict.fromkeys(values))
+    for record in others:
+        for key, value in record.items():
+            if (
+                key not in list_fields
+                and not _filled(merged.get(key))
+                and _filled(value)
+            ):
+                merged[key] = value
+    return survivor, merged
+
+
+def dedupe_imported(
+    candidates: Sequence[ImportedCandidate],
+    config: Optional[DedupeConfig] = None,
+    policy: str = "first",
+) -> List[ImportedCandidate]:
+    """Collapse near-duplicate imported candidates, keeping input order.
+
+    Each cluster becomes one merged candidate placed at its first record.
+    """
+    clusters = find_duplicates(map(Profile.from_imported, candidates), config)
+    replaced: Dict[int, ImportedCandidate] = {}
+    dropped = set()
+    for cluster in clusters:
+        _, merged = merge_records(
+            [candidates[i].to_dict() for i in cluster], policy, ("skills",)
+        )
+        replaced[cluster[0]] = ImportedCandidate(**merged)
+        dropped.update(cluster[1:])
+    return [
+        replaced.get(i, candidate)
+        for i, candidate in enumerate(candidates)
+        if i not in dropped
+    ]
+
+
+__all__ = [
+    "DedupeConfig",
+    "FuzzyDeduper",
+    "MERGE_POLICIES",
+    "Profile",
+    "dedupe_imported",
+    "find_duplicates",
+    "merge_records",
+    "normalize_company",
+    "normalize_name",
+]
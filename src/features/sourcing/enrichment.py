@@ -0,0 +1,278 @@
+"""Concurrent enrichment stage for imported candidates.
+
+Purpose:
+    Enrichers usually wait on lookup services, so running them inline per row
+    makes imports I/O bound. `EnrichmentStage` runs each candidate's enricher
+    chain on a bounded thread pool while yielding results in input order.
+    Each enricher gets its own concurrency limit, optional timeout (the
+    candidate passes through unchanged when it fires), and LRU cache keyed by
+    the candidate fingerprint. The cache keeps only what the enricher changed
+    and applies it on top of each later row. Input is consumed through a
+    bounded window, so the stage streams like `iter_candidates_from_csv`.
+    Benchmark with
+    `python -m src.features.sourcing.enrichment --rows 200 --latency-ms 20`.
+Dependencies:
+    Standard library only (concurrent.futures, threading).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .importer import Enricher, ImportedCandidate, _fingerprint
+
+DEFAULT_WORKERS = 8
+DEFAULT_CACHE_SIZE = 10_000
+
+
+@dataclass
+class EnricherSpec:
+    """One enricher plus its limits; `name` defaults to the function name."""
+
+    enricher: Enricher
+    max_concurrency: int = 4
+    timeout: Optional[float] = None  # seconds per call
+    cache_size: int = DEFAULT_CACHE_SIZE  # 0 disables caching
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.name is None:
+            self.name = getattr(self.enricher, "__name__", repr(self.enricher))
+
+
+@dataclass
+class EnricherStats:
+    calls: int = 0
+    cache_hits: int = 0
+    timeouts: int = 0
+
+
+def _copy(candidate: ImportedCandidate) -> ImportedCandidate:
+    # Enrichers may mutate in place; a timed-out call keeps running, so it
+    # must never touch the object the pipeline carries on with.
+    return replace(candidate, skills=list(candidate.skills), raw=dict(candidate.raw))
+
+
+_SCALARS = ("full_name", "current_title", "company", "email", "location")
+
+
+@dataclass(frozen=True)
+class _Delta:
+    """What one enricher call changed: cached instead of the whole row."""
+
+    fields: Dict[str, Any]
+    skills: Tuple[str, ...]  # appended skills
+    raw: Dict[str, Any]  # added or changed raw keys
+
+    @classmethod
+    def between(cls, before: ImportedCandidate, after: ImportedCandidate) -> "_Delta":
+        fields = {
+            name: getattr(after, name)
+            for name in _SCALARS
+            if getattr(after, name) != getattr(before, name)
+        }
+        known = set(before.skills)
+        skills = tuple(s for s in after.skills if s not in known)
+        raw = {k: v for k, v in after.raw.items() if before.raw.get(k) != v}
+        return cls(fields, skills, raw)
+
+    def apply(self, candidate: ImportedCandidate) -> ImportedCandidate:
+        merged = _copy(candidate)
+        for name, value in self.fields.items():
+            setattr(merged, name, value)
+        merged.skills.extend(s for s in self.skills if s not in merged.skills)
+        merged.raw.update(self.raw)
+        return merged
+
+
+class _Runner:
+    """Calls one enricher with its cache, concurrency limit and timeout.
+
+    A semaphore admits at most `max_concurrency` calls, and its pool has that
+    many threads, so a call starts as soon as it is submitted and the timeout
+    measures the call itself rather than time spent queued.
+    """
+
+    def __init__(self, spec: EnricherSpec) -> None:
+        self.spec = spec
+        self.stats = EnricherStats()
+        self._cache: "OrderedDict[str, _Delta]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(spec.max_concurrency)
+        self._pool = ThreadPoolExecutor(
+            max_workers=spec.max_concurrency,
+            thread_name_prefix=f"enrich-{spec.name}",
+        )
+
+    def __call__(self, candidate: ImportedCandidate) -> ImportedCandidate:
+        key = _fingerprint(candidate) if self.spec.cache_size > 0 else None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.stats.cache_hits += 1
+            if cached is not None:
+                return cached.apply(candidate)
+        with self._lock:
+            self.stats.calls += 1
+        before = _copy(candidate)
+        self._slots.acquire()
+        future = self._pool.submit(self.spec.enricher, _copy(candidate))
+        # Released when the call ends, even after a timeout: a call still
+        # running keeps its slot.
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            enriched = future.result(timeout=self.spec.timeout)
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self.stats.timeouts += 1
+            return candidate
+        if key is not None:
+            delta = _Delta.between(before, enriched)
+            with self._lock:
+                self._cache[key] = delta
+                while len(self._cache) > self.spec.cache_size:
+                    self._cache.popitem(last=False)
+        return enriched
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class EnrichmentStage:
+    """Run enricher chains concurrently across candidates, preserving order.
+
+    Enrichers still run in sequence for a given candidate (each sees the
+    previous one's output). Up to `max_workers` candidates are in flight and
+    at most `window` are buffered ahead of the consumer. Exceptions raised by
+    an enricher surface when its candidate is reached. Caches and statistics
+    live on the stage, so reusing it across imports reuses the caches; call
+    `close` (or use it as a context manager) to release the threads.
+    """
+
+    def __init__(
+        self,
+        enrichers: Sequence[Enricher | EnricherSpec],
+        max_workers: int = DEFAULT_WORKERS,
+        window: Optional[int] = None,
+    ) -> None:
+        specs = [
+            e if isinstance(e, EnricherSpec) else EnricherSpec(e) for e in enrichers
+        ]
+        self._runners: List[_Runner] = [_Runner(spec) for spec in specs]
+        self.max_workers = max_workers
+        self.window = window or max_workers * 4
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="enrich"
+        )
+
+    @property
+    def stats(self) -> Dict[str, EnricherStats]:
+        return {runner.spec.name: runner.stats for runner in self._runners}
+
+    def _enrich(self, candidate: ImportedCandidate) -> ImportedCandidate:
+        for runner in self._runners:
+            candidate = runner(candidate)
+        return candidate
+
+    def run(
+        self, candidates: Iterable[ImportedCandidate]
+    ) -> Iterator[ImportedCandidate]:
+        """Yield enriched `candidates` in input order."""
+        pending: Deque[Future] = deque()
+        try:
+            for candidate in candidates:
+                pending.append(self._pool.submit(self._enrich, candidate))
+                if len(pending) >= self.window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for runner in self._runners:
+            runner.close()
+
+    def __enter__(self) -> "EnrichmentStage":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def latency_stub(latency: float) -> Enricher:
+    """Enricher that sleeps `latency` seconds, standing in for a lookup call."""
+
+    def lookup(candidate: ImportedCandidate) -> ImportedCandidate:
+        time.sleep(latency)
+        candidate.raw["looked_up"] = "yes"
+        return candidate
+
+    return lookup
+
+
+def bench_stage(
+    rows: int = 200, latency: float = 0.02, workers: Sequence[int] = (1, 4, 16)
+) -> Dict[str, Any]:
+    """Rows per second through a latency-injected stub at each worker count."""
+    candidates = [
+        ImportedCandidate(full_name=f"Person {i}", email=f"p{i}@example.com")
+        for i in range(rows)
+    ]
+    results: Dict[str, Any] = {"rows": rows, "latency_ms": latency * 1000}
+    for count in workers:
+        spec = EnricherSpec(latency_stub(latency), max_concurrency=count)
+        with EnrichmentStage([spec], max_workers=count) as stage:
+            started = time.perf_counter()
+            done = sum(1 for _ in stage.run(candidates))
+            elapsed = time.perf_counter() - started
+        results[f"workers_{count}"] = {
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(done / elapsed),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entrypoint: enrichment throughput against the latency stub."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the enrichment stage.")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args(argv)
+    report = bench_stage(args.rows, args.latency_ms / 1000, args.workers)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+__all__ = ["EnricherSpec", "EnricherStats", "EnrichmentStage"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
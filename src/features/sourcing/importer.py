@@ -3,9 +3,26 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import sqlite3
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+if TYPE_CHECKING:
+    from ...data.store import DataStore
+    from .dedupe import FuzzyDeduper
+    from .enrichment import EnrichmentStage
 
 
 @dataclass
@@ -42,27 +59,80 @@ def _fingerprint(candidate: ImportedCandidate) -> str:
 
 Enricher = Callable[[ImportedCandidate], ImportedCandidate]
 
+# Fingerprint hashes held in memory before `SeenFingerprints` spills to disk.
+DEFAULT_MAX_IN_MEMORY = 1_000_000
 
-def import_candidates_from_csv(
-    path: Path | str,
-    dedupe: bool = True,
-    enrichers: Optional[Iterable[Enricher]] = None,
-) -> List[ImportedCandidate]:
-    """Import candidates from CSV, dedupe, and run optional enrichers.
 
-    Expected headers (case-insensitive):
-        full_name, current_title, company, email, skills, location
-    Unrecognized columns are preserved in the `raw` dict for later use.
+class SeenFingerprints:
+    """Set of candidate fingerprints with bounded memory.
+
+    Stores a 64-bit hash per fingerprint rather than the string (collisions
+    are negligible below billions of rows). Past `max_in_memory` hashes the
+    set moves to a temporary on-disk SQLite table and keeps filling memory
+    again, so huge files dedupe without holding every key in RAM.
     """
-    candidates: Dict[str, ImportedCandidate] = {}
-    enrichers = list(enrichers or [])
 
+    def __init__(self, max_in_memory: int = DEFAULT_MAX_IN_MEMORY) -> None:
+        self.max_in_memory = max_in_memory
+        self._recent: Set[int] = set()
+        self._disk: Optional[sqlite3.Connection] = None
+        self.spilled = 0
+
+    @staticmethod
+    def _hash(fingerprint: str) -> int:
+        digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)  # fits SQLite INTEGER
+
+    def add(self, fingerprint: str) -> bool:
+        """Record `fingerprint`; False if it was already seen."""
+        key = self._hash(fingerprint)
+        if key in self._recent:
+            return False
+        if self._disk is not None and self._on_disk(key):
+            return False
+        self._recent.add(key)
+        if len(self._recent) >= self.max_in_memory:
+            self._spill()
+        return True
+
+    def _on_disk(self, key: int) -> bool:
+        query = "SELECT 1 FROM seen WHERE fp = ?"
+        return self._disk.execute(query, (key,)).fetchone() is not None
+
+    def _spill(self) -> None:
+        if self._disk is None:
+            # An empty filename is a private temporary database, removed on close.
+            self._disk = sqlite3.connect("")
+            self._disk.execute("PRAGMA journal_mode = OFF")
+            self._disk.execute("PRAGMA synchronous = OFF")
+            self._disk.execute("CREATE TABLE seen (fp INTEGER PRIMARY KEY)")
+        with self._disk:
+            self._disk.executemany(
+                "INSERT OR IGNORE INTO seen (fp) VALUES (?)",
+                ((key,) for key in self._recent),
+            )
+        self.spilled += len(self._recent)
+        self._recent.clear()
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._recent)
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+        self._recent.clear()
+
+
+def _read_candidates(
+    path: Path | str, enrichers: List[Enricher]
+) -> Iterator[ImportedCandidate]:
     with open(path, newline="", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         for row in reader:
             normalized_row = {k.lower().strip(): v for k, v in row.items()}
             candidate = ImportedCandidate(
-                full_name=normalized_row.get("full_name", "").strip(),
+                full_name=(normalized_row.get("full_name") or "").strip(),
                 current_title=normalized_row.get("current_title")
                 or normalized_row.get("title"),
                 company=normalized_row.get("company"),
@@ -73,11 +143,113 @@ def import_candidates_from_csv(
             )
             for enricher in enrichers:
                 candidate = enricher(candidate)
-            if dedupe:
-                candidates.setdefault(_fingerprint(candidate), candidate)
-            else:
-                candidates[f"{_fingerprint(candidate)}|{len(candidates)}"] = candidate
-    return list(candidates.values())
+            yield candidate
+
+
+def iter_candidates_from_csv(
+    path: Path | str,
+    dedupe: bool = True,
+    enrichers: Optional[Iterable[Enricher]] = None,
+    raw_columns: Optional[Iterable[str]] = None,
+    seen: Optional[SeenFingerprints] = None,
+    stage: Optional["EnrichmentStage"] = None,
+    fuzzy: Optional["FuzzyDeduper"] = None,
+) -> Iterator[ImportedCandidate]:
+    """Yield candidates from CSV one row at a time, deduped and enriched.
+
+    Memory stays bounded by the fingerprint set, not the file: the first
+    candidate per fingerprint is yielded as soon as its row is read.
+    `raw_columns` limits which (lowercased) columns stay in `raw` after the
+    enrichers ran (None keeps every column, an empty list none). Pass `seen`
+    to tune spilling or to dedupe across several files; otherwise a private
+    set is created and closed with the generator. A `stage` runs its
+    enrichers concurrently after the inline `enrichers`, keeping row order.
+    With `fuzzy`, near-duplicates of an earlier yielded candidate are dropped
+    too (first one wins; use `dedupe.dedupe_imported` to merge instead).
+    """
+    enrichers = list(enrichers or [])
+    keep = None if raw_columns is None else {c.lower().strip() for c in raw_columns}
+    owns_seen = seen is None and dedupe
+    if owns_seen:
+        seen = SeenFingerprints()
+    try:
+        rows = _read_candidates(path, enrichers)
+        if stage is not None:
+            rows = stage.run(rows)
+        for candidate in rows:
+            if dedupe and not seen.add(_fingerprint(candidate)):
+                continue
+            if fuzzy is not None and fuzzy.add_imported(candidate) is not None:
+                continue
+            if keep is not None:
+                candidate.raw = {k: v for k, v in candidate.raw.items() if k in keep}
+            yield candidate
+    finally:
+        if owns_seen:
+            seen.close()
+
+
+def import_candidates_from_csv(
+    path: Path | str,
+    dedupe: bool = True,
+    enrichers: Optional[Iterable[Enricher]] = None,
+    stage: Optional["EnrichmentStage"] = None,
+) -> List[ImportedCandidate]:
+    """Import candidates from CSV, dedupe, and run optional enrichers.
+
+    Expected headers (case-insensitive):
+        full_name, current_title, company, email, skills, location
+    Unrecognized columns are preserved in the `raw` dict for later use.
+    Pass an `EnrichmentStage` as `stage` to run slow enrichers concurrently.
+    Loads the whole file; use `iter_candidates_from_csv` for large exports.
+    """
+    return list(
+        iter_candidates_from_csv(path, dedupe=dedupe, enrichers=enrichers, stage=stage)
+    )
+
+
+def persist_imported_candidates(
+    store: "DataStore",
+    candidates: Iterable[ImportedCandidate],
+    source: str = "csv",
+) -> List[Dict[str, Any]]:
+    """Write imported candidates, their profile source, and an audit event.
+
+    All rows share one transaction (one commit); each candidate runs in its own
+    savepoint so a duplicate email only skips that row.
+    """
+    created: List[Dict[str, Any]] = []
+    with store.transaction():
+        for candidate in candidates:
+            try:
+                with store.transaction():
+                    row = store.create_candidate(
+                        {
+                            "full_name": candidate.full_name,
+                            "current_title": candidate.current_title,
+                            "skills": candidate.skills,
+                            "locations": [candidate.location]
+                            if candidate.location
+                            else [],
+                            "email": candidate.email,
+                        }
+                    )
+                    store.add_profile_source(
+                        {
+                            "candidate_id": row["id"],
+                            "source": source,
+                            "company": candidate.company,
+                        }
+                    )
+                    store.record_audit_event(
+                        event_type="candidate_imported",
+                        subject_id=row["id"],
+                        detail={"source": source},
+                    )
+            except sqlite3.IntegrityError:
+                continue
+            created.append(row)
+    return created
 
 
 def basic_enricher(candidate: ImportedCandidate) -> ImportedCandidate:
@@ -92,4 +264,11 @@ def basic_enricher(candidate: ImportedCandidate) -> ImportedCandidate:
     return candidate
 
 
-__all__ = ["import_candidates_from_csv", "ImportedCandidate", "basic_enricher"]
+__all__ = [
+    "import_candidates_from_csv",
+    "iter_candidates_from_csv",
+    "SeenFingerprints",
+    "persist_imported_candidates",
+    "ImportedCandidate",
+    "basic_enricher",
+]
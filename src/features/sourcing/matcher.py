@@ -0,0 +1,158 @@
+"""Compiled multi-pattern matcher for scorecard competency signals.
+
+Purpose:
+    Build the matching structures for a scorecard once and reuse them for
+    every candidate in every batch. `ScorecardMatcher` maps each distinct
+    lowercased signal to the competencies that list it and finds all signals
+    present in a text with an Aho–Corasick automaton: one pass over the text
+    regardless of how many signals there are. With `word_boundaries=True`
+    the automaton runs over word tokens, so "go" no longer matches inside
+    "google" and the scan takes one step per word rather than per character.
+    For substring matching with few signals, CPython's `in` (a C-level
+    search per signal) beats a Python-level character scan; `strategy="auto"`
+    switches to the automaton from `AUTOMATON_MIN_SIGNALS` signals upward.
+Dependencies:
+    Standard library plus the intake scorecard schema.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from ..intake.schema import ScorecardCompetency
+
+# Crossover for substring matching, measured on ~550-character profiles.
+AUTOMATON_MIN_SIGNALS = 250
+STRATEGIES = ("auto", "automaton", "substring")
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Word tokens plus standalone punctuation ("on-call" -> on, -, call)."""
+    return _TOKEN_RE.findall(text)
+
+
+class Automaton:
+    """Aho–Corasick automaton over symbol sequences (characters or tokens).
+
+    `find` returns the ids (positions in `patterns`) of every pattern that
+    occurs in the scanned symbols, overlapping matches included.
+    """
+
+    def __init__(self, patterns: Sequence[Sequence[str]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for symbol in pattern:
+                nxt = goto[state].get(symbol)
+                if nxt is None:
+                    nxt = goto[state][symbol] = len(goto)
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            if pattern:
+                out[state] += (pattern_id,)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in goto[state].items():
+                queue.append(nxt)
+                back = fail[state]
+                while back and symbol not in goto[back]:
+                    back = fail[back]
+                fail[nxt] = goto[back].get(symbol, 0)
+                out[nxt] += out[fail[nxt]]
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def find(self, symbols: Iterable[str]) -> Set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        state = 0
+        for symbol in symbols:
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class ScorecardMatcher:
+    """Signals of a scorecard compiled once; see the module docstring.
+
+    Matching is case-insensitive (`str.lower`, like the ranker's text blob).
+    Evidence lists each competency's hits in the scorecard's signal order.
+    """
+
+    def __init__(
+        self,
+        scorecard: Sequence[ScorecardCompetency],
+        word_boundaries: bool = False,
+        strategy: str = "auto",
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}")
+        self.scorecard = list(scorecard)
+        self.word_boundaries = word_boundaries
+        ids: Dict[str, int] = {}
+        # Per competency: (original signal, distinct-signal id) in order.
+        self._signals: List[List[Tuple[str, int]]] = []
+        for competency in self.scorecard:
+            self._signals.append(
+                [
+                    (signal, ids.setdefault(signal.lower(), len(ids)))
+                    for signal in competency.signals
+                ]
+            )
+        self.patterns = list(ids)
+        total = sum(item.weight for item in self.scorecard) or 1.0
+        self._weights = [item.weight / total for item in self.scorecard]
+        if word_boundaries:
+            self._automaton = Automaton([tokenize(p) for p in self.patterns])
+        elif strategy == "automaton" or (
+            strategy == "auto" and len(self.patterns) >= AUTOMATON_MIN_SIGNALS
+        ):
+            self._automaton = Automaton(self.patterns)
+        else:
+            self._automaton = None
+
+    def find(self, text: str) -> Set[int]:
+        """Ids (positions in `patterns`) of the signals present in `text`."""
+        text = text.lower()
+        if self.word_boundaries:
+            return self._automaton.find(tokenize(text))
+        if self._automaton is not None:
+            return self._automaton.find(text)
+        return {i for i, p in enumerate(self.patterns) if p and p in text}
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Competency name -> signals found in `text`."""
+        found = self.find(text)
+        return {
+            competency.name: [signal for signal, i in signals if i in found]
+            for competency, signals in zip(self.scorecard, self._signals)
+        }
+
+    def score(self, text: str) -> Tuple[float, Dict[str, List[str]]]:
+        """Weighted signal coverage in [0, 1] plus the evidence per competency."""
+        found = self.find(text)
+        evidence: Dict[str, List[str]] = {}
+        total = 0.0
+        for weight, competency, signals in zip(
+            self._weights, self.scorecard, self._signals
+        ):
+            hits = [signal for signal, i in signals if i in found]
+            evidence[competency.name] = hits
+            if signals:
+                total += weight * len(hits) / len(signals)
+        return total, evidence
+
+
+__all__ = ["Automaton", "ScorecardMatcher", "tokenize"]
@@ -3,15 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from ..intake.schema import ScorecardCompetency
 from .importer import ImportedCandidate
-
-
-def _normalize_weights(scorecard: Sequence[ScorecardCompetency]) -> List[float]:
-    total = sum(item.weight for item in scorecard) or 1.0
-    return [item.weight / total for item in scorecard]
+from .matcher import ScorecardMatcher
 
 
 def _collect_text(candidate: ImportedCandidate) -> str:
@@ -22,19 +18,13 @@ def _collect_text(candidate: ImportedCandidate) -> str:
     ]
     if candidate.skills:
         fields.append(" ".join(candidate.skills))
-    raw_values = candidate.raw.values() if candidate.raw else []
-    return " ".join(fields + list(raw_values)).lower()
-
-
-def _score_competency(
-    text_blob: str, competency: ScorecardCompetency
-) -> Tuple[float, List[str]]:
-    hits: List[str] = []
-    for signal in competency.signals:
-        if signal.lower() in text_blob:
-            hits.append(signal)
-    coverage = len(hits) / len(competency.signals) if competency.signals else 0.0
-    return coverage, hits
+    for value in (candidate.raw or {}).values():
+        # Enrichers may store lists (e.g. `evidence`) next to the CSV strings.
+        if isinstance(value, str):
+            fields.append(value)
+        elif isinstance(value, list):
+            fields.extend(v for v in value if isinstance(v, str))
+    return " ".join(fields)
 
 
 @dataclass
@@ -45,20 +35,23 @@ class RankedCandidate:
 
 
 def rank_candidates(
-    candidates: Iterable[ImportedCandidate], scorecard: Sequence[ScorecardCompetency]
+    candidates: Iterable[ImportedCandidate],
+    scorecard: Sequence[ScorecardCompetency],
+    matcher: Optional[ScorecardMatcher] = None,
+    word_boundaries: bool = False,
 ) -> List[RankedCandidate]:
-    """Return ordered candidates with evidence for each scorecard competency."""
-    weights = _normalize_weights(scorecard)
+    """Return ordered candidates with evidence for each scorecard competency.
+
+    Signals are compiled into a `ScorecardMatcher` once per call; pass a
+    prebuilt `matcher` to reuse it across batches (`scorecard` and
+    `word_boundaries` are then ignored).
+    """
+    if matcher is None:
+        matcher = ScorecardMatcher(scorecard, word_boundaries=word_boundaries)
     ranked: List[RankedCandidate] = []
 
     for candidate in candidates:
-        text_blob = _collect_text(candidate)
-        evidence: Dict[str, List[str]] = {}
-        total_score = 0.0
-        for weight, competency in zip(weights, scorecard):
-            comp_score, hits = _score_competency(text_blob, competency)
-            evidence[competency.name] = hits
-            total_score += comp_score * weight
+        total_score, evidence = matcher.score(_collect_text(candidate))
         ranked.append(
             RankedCandidate(
                 candidate=candidate, score=round(total_score, 4), evidence=evidence
@@ -0,0 +1,159 @@
+"""Dedupe job: find and merge near-duplicate candidates in the DataStore.
+
+Purpose:
+    Run `FuzzyDeduper` over the candidates table, reading it page by page.
+    Candidates carry no company column, so the company a profile source
+    reported (`profile_sources.company`) is used when present. Without
+    `--apply` the job only reports clusters. With it, each cluster collapses
+    into a survivor chosen by the merge policy, in its own short transaction:
+    - the survivor's empty fields are filled and its list fields unioned,
+    - interactions, stage events, profile sources and consent events of the
+      duplicates move to the survivor,
+    - the duplicates are deleted and a `candidate_merged` audit event is
+      recorded.
+Dependencies:
+    Standard library only plus the local DataStore and sourcing dedupe.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..data.store import DataStore
+from ..features.sourcing.dedupe import (
+    MERGE_POLICIES,
+    DedupeConfig,
+    FuzzyDeduper,
+    Profile,
+    merge_records,
+)
+
+# Tables whose candidate_id moves to the survivor before duplicates are deleted.
+CHILD_TABLES = ("profile_sources", "interactions", "stage_events", "consent_events")
+LIST_FIELDS = ("titles", "skills", "domains", "locations", "stage_preferences")
+# Columns `update_candidate` accepts.
+MERGED_FIELDS = (
+    "full_name",
+    "current_title",
+    "years_experience",
+    "timezone",
+    "remote_preference",
+    "linkedin_url",
+    "email",
+    *LIST_FIELDS,
+)
+
+
+def _companies(store: DataStore, candidate_ids: Sequence[str]) -> Dict[str, str]:
+    """candidate id -> company its profile sources report (latest wins)."""
+    marks = ", ".join("?" * len(candidate_ids))
+    rows = store.conn.execute(
+        "SELECT candidate_id, company FROM profile_sources "
+        f"WHERE candidate_id IN ({marks}) AND company IS NOT NULL "
+        "ORDER BY imported_at",
+        tuple(candidate_ids),
+    ).fetchall()
+    return {row["candidate_id"]: row["company"] for row in rows}
+
+
+def find_candidate_duplicates(
+    store: DataStore,
+    config: Optional[DedupeConfig] = None,
+    page_size: int = 1000,
+) -> Dict[str, Any]:
+    """Clusters of near-duplicate candidate ids, oldest first in each."""
+    deduper = FuzzyDeduper(config)
+    ids: List[str] = []
+    after: Optional[int] = 0
+    while after is not None:
+        rows, after = store.page_candidates(after=after, limit=page_size)
+        companies = _companies(store, [row["id"] for row in rows])
+        for row in rows:
+            ids.append(row["id"])
+            deduper.add(Profile.from_row(row, companies.get(row["id"])))
+    clusters = [[ids[i] for i in cluster] for cluster in deduper.clusters()]
+    return {
+        "candidates": len(ids),
+        "comparisons": deduper.comparisons,
+        "clusters": clusters,
+    }
+
+
+def merge_cluster(
+    store: DataStore, candidate_ids: List[str], policy: str = "first"
+) -> Optional[str]:
+    """Merge one cluster into its survivor; returns the survivor id."""
+    with store.transaction():
+        rows = [store.get_candidate(cid) for cid in candidate_ids]
+        rows = [row for row in rows if row is not None]
+        if len(rows) < 2:
+            return rows[0]["id"] if rows else None
+        survivor, merged = merge_records(rows, policy, LIST_FIELDS)
+        survivor_id = rows[survivor]["id"]
+        duplicates = [row["id"] for i, row in enumerate(rows) if i != survivor]
+        for table in CHILD_TABLES:
+            store.conn.executemany(
+                f"UPDATE {table} SET candidate_id = ? WHERE candidate_id = ?",
+                [(survivor_id, dup) for dup in duplicates],
+            )
+        # Delete first: the survivor may inherit a duplicate's unique email.
+        for dup in duplicates:
+            store.delete_candidate(dup)
+        updates = {
+            key: merged[key]
+            for key in MERGED_FIELDS
+            if key in merged and (key in LIST_FIELDS or merged[key] is not None)
+        }
+        store.update_candidate(survivor_id, updates)
+        store.record_audit_event(
+            event_type="candidate_merged",
+            subject_id=survivor_id,
+            detail={"merged": duplicates, "policy": policy},
+        )
+    return survivor_id
+
+
+def dedupe_candidates(
+    store: DataStore,
+    config: Optional[DedupeConfig] = None,
+    policy: str = "first",
+    apply: bool = False,
+) -> Dict[str, Any]:
+    """Report near-duplicate clusters and, with `apply`, merge each one."""
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"unknown merge policy {policy!r}")
+    report = find_candidate_duplicates(store, config)
+    report["merged"] = 0
+    if apply:
+        for cluster in report["clusters"]:
+            merge_cluster(store, cluster, policy)
+            report["merged"] += len(cluster) - 1
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find and merge duplicate candidates.")
+    parser.add_argument("--db-path", default=str(Path("data") / "app.db"))
+    parser.add_argument("--threshold", type=float, default=DedupeConfig.threshold)
+    parser.add_argument("--policy", choices=MERGE_POLICIES, default="first")
+    parser.add_argument("--apply", action="store_true", help="Merge clusters.")
+    args = parser.parse_args()
+
+    store = DataStore(args.db_path)
+    try:
+        report = dedupe_candidates(
+            store,
+            DedupeConfig(threshold=args.threshold),
+            policy=args.policy,
+            apply=args.apply,
+        )
+    finally:
+        store.close()
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Recompression job: compress existing rows in designated text columns.
+
+Purpose:
+    `DataStore.enable_compression` only affects new writes. This job walks a
+    table in rowid order and rewrites plain-text values of a compressible
+    column as compressed BLOBs, in short batched transactions with a pause in
+    between (like the retention job) so request traffic can interleave. With
+    `--train-dictionary` it first trains a preset dictionary from recent values
+    and also re-encodes values compressed without it. Pass `--vacuum` to
+    return the freed pages to the filesystem afterwards; VACUUM may renumber
+    the rowids that list cursors are built on, so cursors clients already hold
+    stop being valid. The rewrites are ordinary UPDATEs, so tables tracked by
+    the change feed emit `update` entries for the touched rows.
+Dependencies:
+    Standard library only plus the local DataStore.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict
+
+from ..data.compression import (
+    COMPRESSIBLE_COLUMNS,
+    all_columns,
+    compress_text,
+    compressed_prefix,
+    decompress_text,
+)
+from ..data.store import DataStore
+
+
+def recompress_column(
+    store: DataStore,
+    table: str,
+    column: str,
+    *,
+    min_size: int = 128,
+    level: int = 6,
+    batch_size: int = 500,
+    pause_seconds: float = 0.05,
+    train_dictionary: bool = False,
+    vacuum: bool = False,
+) -> Dict[str, int]:
+    """Compress values of `table.column` not yet in the current encoding.
+
+    Uses the column's newest preset dictionary when one exists. Returns counts
+    of rows scanned and rewritten. `vacuum` invalidates SQLite list cursors
+    issued before it (see `src.services.pagination`).
+    """
+    name = f"{table}.{column}"
+    if name not in all_columns():
+        raise ValueError(f"column not compressible: {name}")
+    store.flush_audit_buffer()
+    if train_dictionary:
+        store.train_compression_dictionary(name)
+    zdict = store.compression_dictionary(name)
+    prefix = compressed_prefix(zdict)
+
+    scanned = 0
+    compressed = 0
+    last_rowid = 0
+    while True:
+        with store.transaction():
+            rows = store.conn.execute(
+                f"SELECT rowid, {column} FROM {table} WHERE rowid > ? AND ("
+                f"(typeof({column}) = 'text' AND length({column}) >= ?) OR "
+                f"(typeof({column}) = 'blob' AND substr({column}, 1, ?) != ?)"
+                ") ORDER BY rowid LIMIT ?",
+                (last_rowid, min_size, len(prefix), prefix, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for rowid, value in rows:
+                text = decompress_text(value)
+                packed = compress_text(
+                    text, min_size=min_size, level=level, zdict=zdict
+                )
+                if packed is not text:
+                    updates.append((packed, rowid))
+            store.conn.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE rowid = ?", updates
+            )
+        scanned += len(rows)
+        compressed += len(updates)
+        last_rowid = rows[-1][0]
+        if len(rows) < batch_size:
+            break
+        time.sleep(pause_seconds)
+    if vacuum:
+        store.conn.execute("VACUUM")
+    return {"scanned": scanned, "compressed": compressed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compress existing text columns.")
+    parser.add_argument("--db-path", default=str(Path("data") / "app.db"))
+    parser.add_argument("--table", choices=sorted(COMPRESSIBLE_COLUMNS), required=True)
+    parser.add_argument("--column", default=None, help="Defaults to the table's.")
+    parser.add_argument("--min-size", type=int, default=128)
+    parser.add_argument("--level", type=int, default=6)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.05)
+    parser.add_argument("--train-dictionary", action="store_true")
+    parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Reclaim space afterwards; invalidates outstanding list cursors.",
+    )
+    args = parser.parse_args()
+
+    store = DataStore(args.db_path)
+    try:
+        result = recompress_column(
+            store,
+            args.table,
+            args.column or COMPRESSIBLE_COLUMNS[args.table][0],
+            min_size=args.min_size,
+            level=args.level,
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+            train_dictionary=args.train_dictionary,
+            vacuum=args.vacuum,
+        )
+    finally:
+        store.close()
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
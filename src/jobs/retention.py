@@ -0,0 +1,163 @@
+"""Retention job: purge or archive old interactions and audit logs.
+
+Purpose:
+    Keep the hot SQLite database small without holding the write lock for long.
+    Rows older than a horizon are handled in small batches, each in its own
+    short transaction, with a pause between batches so request traffic can
+    interleave. When an archive directory is given, rows are first copied into
+    per-month archive databases (`<archive_dir>/<YYYY-MM>.archive.db`) as
+    zlib-compressed JSON, then deleted from the hot database.
+Dependencies:
+    Standard library only plus the local DataStore.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..data.compression import decompress_text
+from ..data.store import DataStore
+
+# table -> timestamp column used for the horizon (both are indexed).
+RETENTION_TABLES = {"interactions": "occurred_at", "audit_logs": "created_at"}
+
+
+def _cutoff(horizon_days: int, now: Optional[datetime] = None) -> str:
+    moment = (now or datetime.now(tz=timezone.utc)) - timedelta(days=horizon_days)
+    return moment.replace(microsecond=0).isoformat()
+
+
+def _archive_path(archive_dir: Path, timestamp: str) -> Path:
+    return archive_dir / f"{timestamp[:7]}.archive.db"
+
+
+def _open_archive(path: Path, table: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            ts TEXT NOT NULL,
+            payload BLOB NOT NULL
+        )
+        """
+    )
+    return conn
+
+
+def _archive_rows(archive_dir: Path, table: str, rows: List[sqlite3.Row]) -> None:
+    ts_column = RETENTION_TABLES[table]
+    by_month: Dict[Path, List[tuple]] = {}
+    for row in rows:
+        # Decode compressed columns first; the archive compresses whole rows.
+        values = {key: decompress_text(row[key]) for key in row.keys()}
+        payload = zlib.compress(json.dumps(values).encode("utf-8"))
+        by_month.setdefault(_archive_path(archive_dir, row[ts_column]), []).append(
+            (row["id"], row[ts_column], payload)
+        )
+    for path, values in by_month.items():
+        conn = _open_archive(path, table)
+        try:
+            # OR IGNORE keeps re-runs idempotent if a previous run died between
+            # archiving and deleting.
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} (id, ts, payload) VALUES (?, ?, ?)",
+                values,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def purge_expired(
+    store: DataStore,
+    table: str,
+    horizon_days: int,
+    *,
+    batch_size: int = 500,
+    pause_seconds: float = 0.05,
+    archive_dir: Optional[Path] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """Delete (and optionally archive) rows older than `horizon_days`.
+
+    Returns counts of rows removed and batches run.
+    """
+    if table not in RETENTION_TABLES:
+        raise ValueError(f"retention not supported for table {table!r}")
+    ts_column = RETENTION_TABLES[table]
+    cutoff = _cutoff(horizon_days, now)
+    if archive_dir is not None:
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+    removed = 0
+    batches = 0
+    while True:
+        with store.transaction():
+            rows = store.conn.execute(
+                f"SELECT * FROM {table} WHERE {ts_column} < ? "
+                f"ORDER BY {ts_column} LIMIT ?",
+                (cutoff, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            if archive_dir is not None:
+                _archive_rows(archive_dir, table, rows)
+            store.conn.executemany(
+                f"DELETE FROM {table} WHERE id = ?", [(row["id"],) for row in rows]
+            )
+        removed += len(rows)
+        batches += 1
+        if len(rows) < batch_size:
+            break
+        # Yield the write lock between batches so request traffic can proceed.
+        time.sleep(pause_seconds)
+    return {"removed": removed, "batches": batches}
+
+
+def read_archive(path: Path | str, table: str) -> Iterator[Dict[str, Any]]:
+    """Yield decoded rows from an archive file written by `purge_expired`."""
+    conn = sqlite3.connect(path)
+    try:
+        for (payload,) in conn.execute(f"SELECT payload FROM {table} ORDER BY ts"):
+            yield json.loads(zlib.decompress(payload))
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Purge or archive old rows.")
+    parser.add_argument("--db-path", default=str(Path("data") / "app.db"))
+    parser.add_argument("--table", choices=sorted(RETENTION_TABLES), required=True)
+    parser.add_argument("--days", type=int, required=True, help="Retention horizon.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.05)
+    parser.add_argument(
+        "--archive-dir", default=None, help="Archive rows here before deleting."
+    )
+    args = parser.parse_args()
+
+    store = DataStore(args.db_path)
+    try:
+        result = purge_expired(
+            store,
+            args.table,
+            args.days,
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+            archive_dir=Path(args.archive_dir) if args.archive_dir else None,
+        )
+    finally:
+        store.close()
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
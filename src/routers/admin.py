@@ -0,0 +1,20 @@
+"""Operational endpoints for inspecting the storage backend."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from ..services.repositories import repo
+
+
+router = APIRouter()
+
+
+@router.get("/admin/query-stats")
+def query_stats() -> Dict[str, Any]:
+    """Per-fingerprint statement timings when the SQLite store is instrumented."""
+    store = getattr(repo, "store", None)
+    stats = getattr(store, "query_stats", None)
+    if stats is None:
+        return {"enabled": False, "slow_ms": None, "statements": {}}
+    return {"enabled": True, "slow_ms": stats.slow_ms, "statements": stats.snapshot()}
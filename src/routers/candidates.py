@@ -1,10 +1,14 @@
 """Candidates CRUD endpoints."""
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 
-from ..services.repositories import repo
+from ..services.ingest import DEFAULT_BATCH_SIZE, CandidateIngest
+from ..services.repositories import DuplicateEmailError, repo
 from ..models.candidate import Candidate, CandidateCreate
+from .paging import CursorQuery, FieldsQuery, LimitQuery, paged_response, wants_page
 
 
 router = APIRouter()
@@ -12,11 +16,20 @@ router = APIRouter()
 
 @router.post("/", response_model=Candidate)
 def create_candidate(payload: CandidateCreate) -> Candidate:
-    return repo.create_candidate(payload)
+    try:
+        return repo.create_candidate(payload)
+    except DuplicateEmailError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
 @router.get("/", response_model=List[Candidate])
-def list_candidates() -> List[Candidate]:
+def list_candidates(
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+) -> Any:
+    if wants_page(limit, cursor, fields):
+        return paged_response(repo.page_candidates, Candidate, limit, cursor, fields)
     return repo.list_candidates()
 
 
@@ -26,16 +39,27 @@ def search_candidates(
     titles: Optional[str] = Query(None, description="Comma-separated titles"),
     domains: Optional[str] = Query(None, description="Comma-separated domains"),
     location: Optional[str] = Query(None, description="Exact location match"),
-) -> List[Candidate]:
+    q: Optional[str] = Query(
+        None, description="Prefix/typo-tolerant name and title search, ranked"
+    ),
+    explain: bool = Query(False, description="Return {plan, results} for debugging"),
+) -> Any:
     def split_csv(v: Optional[str]) -> List[str]:
         return [x.strip() for x in v.split(",")] if v else []
 
-    return repo.search_candidates(
-        skills=split_csv(skills),
-        titles=split_csv(titles),
-        domains=split_csv(domains),
-        location=location,
-    )
+    filters = {
+        "skills": split_csv(skills),
+        "titles": split_csv(titles),
+        "domains": split_csv(domains),
+        "location": location,
+        "q": q,
+    }
+    if explain:
+        results, plan = repo.explain_search_candidates(**filters)
+        return JSONResponse(
+            {"plan": plan, "results": [c.model_dump(mode="json") for c in results]}
+        )
+    return repo.search_candidates(**filters)
 
 
 @router.get("/{candidate_id}", response_model=Candidate)
@@ -48,7 +72,24 @@ def get_candidate(candidate_id: str) -> Candidate:
 
 @router.post("/bulk", response_model=List[Candidate])
 def bulk_create(candidates: List[CandidateCreate]) -> List[Candidate]:
-    created: List[Candidate] = []
-    for payload in candidates:
-        created.append(repo.create_candidate(payload))
-    return created
+    try:
+        return repo.bulk_create_candidates(candidates)
+    except DuplicateEmailError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+@router.post("/ingest")
+async def ingest_candidates(
+    request: Request,
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=10_000),
+) -> Dict[str, Any]:
+    """Stream `application/x-ndjson` candidates, one `CandidateCreate` per line.
+
+    Lines are validated and written in batches as the body arrives. Returns
+    counts plus the line numbers of duplicates (by email) and invalid lines.
+    """
+    ingest = CandidateIngest(repo, batch_size=batch_size)
+    async for chunk in request.stream():
+        if chunk:
+            await run_in_threadpool(ingest.feed, chunk)
+    return await run_in_threadpool(ingest.finish)
@@ -0,0 +1,36 @@
+"""Streaming table export endpoint."""
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ..data.export import EXPORT_TABLES, FORMATS, export_table
+from ..services.repositories import repo
+
+
+router = APIRouter()
+
+
+@router.get("/export/{table}")
+def export(
+    table: str,
+    format: str = Query("ndjson"),
+    since: Optional[str] = Query(None),
+    chunk_size: int = Query(500, ge=1, le=10_000),
+) -> StreamingResponse:
+    store = getattr(repo, "store", None)
+    if store is None:
+        raise HTTPException(
+            status_code=501, detail="Export requires the sqlite repository backend"
+        )
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail="Unknown export table")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail="format must be ndjson or csv")
+    filename = f"{table}.{format}.gz"
+    return StreamingResponse(
+        export_table(store, table, fmt=format, since=since, chunk_size=chunk_size),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
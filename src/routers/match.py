@@ -13,9 +13,12 @@ router = APIRouter()
 
 @router.post("/match", response_model=MatchResponse)
 def post_match(payload: MatchRequest) -> MatchResponse:
+    # One consistent view for every lookup, even if writes land meanwhile
+    view = repo.read_view()
+
     # Resolve role (by id or inline)
     if payload.role_id:
-        role = repo.get_role(payload.role_id)
+        role = view.get_role(payload.role_id)
         if not role:
             raise HTTPException(status_code=404, detail="Role not found")
     elif payload.role:
@@ -24,12 +27,12 @@ def post_match(payload: MatchRequest) -> MatchResponse:
         raise HTTPException(status_code=400, detail="Provide role_id or role payload")
 
     # Resolve startup context for stage/domains
-    startup = repo.get_startup(role.startup_id)
+    startup = view.get_startup(role.startup_id)
     startup_domains: List[str] = startup.domains if startup else []
     startup_stage = startup.stage.value if startup else None
 
     # Candidate scope
-    candidates = repo.list_candidates(ids=payload.candidate_ids)
+    candidates = view.list_candidates(ids=payload.candidate_ids)
     ranked = rank_candidates(
         candidates, role, startup_domains=startup_domains, startup_stage=startup_stage
     )
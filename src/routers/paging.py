@@ -0,0 +1,52 @@
+"""Shared cursor/field-projection handling for list endpoints."""
+
+from typing import Any, Callable, Optional, Type
+
+from fastapi import HTTPException, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from ..services.pagination import DEFAULT_LIMIT, MAX_LIMIT, parse_fields
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+LimitQuery = Query(
+    None,
+    ge=1,
+    le=MAX_LIMIT,
+    description=f"Page size (default {DEFAULT_LIMIT} when paging)",
+)
+CursorQuery = Query(None, description=f"{NEXT_CURSOR_HEADER} of the previous page")
+FieldsQuery = Query(None, description="Comma-separated attributes to return")
+
+
+def wants_page(
+    limit: Optional[int], cursor: Optional[str], fields: Optional[str]
+) -> bool:
+    """Any paging parameter switches a list route from the full list to pages."""
+    return limit is not None or cursor is not None or fields is not None
+
+
+def paged_response(
+    page: Callable[..., Any],
+    model: Type[BaseModel],
+    limit: Optional[int],
+    cursor: Optional[str],
+    fields: Optional[str],
+    **filters: Any,
+) -> JSONResponse:
+    """Call a repo `page_*` method and return its rows with the next cursor.
+
+    The body stays a JSON list; `X-Next-Cursor` is set while more pages exist.
+    """
+    try:
+        rows, next_cursor = page(
+            limit=limit or DEFAULT_LIMIT,
+            cursor=cursor,
+            fields=parse_fields(fields, model),
+            **filters,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return JSONResponse(content=rows, headers=headers)
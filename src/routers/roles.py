@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional
 from fastapi import APIRouter, HTTPException
 
 from ..services.repositories import repo
 from ..models.role import Role, RoleCreate
+from .paging import CursorQuery, FieldsQuery, LimitQuery, paged_response, wants_page
 
 
 router = APIRouter()
@@ -21,7 +22,16 @@ def create_role(payload: RoleCreate) -> Role:
 
 
 @router.get("/", response_model=List[Role])
-def list_roles(startup_id: Optional[str] = None) -> List[Role]:
+def list_roles(
+    startup_id: Optional[str] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+) -> Any:
+    if wants_page(limit, cursor, fields):
+        return paged_response(
+            repo.page_roles, Role, limit, cursor, fields, startup_id=startup_id
+        )
     return repo.list_roles(startup_id)
 
 
@@ -1,10 +1,11 @@
 """Startups CRUD endpoints."""
 
-from typing import List
+from typing import Any, List, Optional
 from fastapi import APIRouter, HTTPException
 
 from ..services.repositories import repo
 from ..models.startup import Startup, StartupCreate
+from .paging import CursorQuery, FieldsQuery, LimitQuery, paged_response, wants_page
 
 
 router = APIRouter()
@@ -16,7 +17,13 @@ def create_startup(payload: StartupCreate) -> Startup:
 
 
 @router.get("/", response_model=List[Startup])
-def list_startups() -> List[Startup]:
+def list_startups(
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+) -> Any:
+    if wants_page(limit, cursor, fields):
+        return paged_response(repo.page_startups, Startup, limit, cursor, fields)
     return repo.list_startups()
 
 
@@ -0,0 +1,272 @@
+"""Micro-benchmarks for the in-memory repository.
+
+Purpose:
+    Measure repository workloads at demo scale, e.g.
+    `python -m src.services.bench snapshot --candidates 500000` or
+    `python -m src.services.bench memory --candidates 200000`,
+    `python -m src.services.bench ingest --candidates 100000`,
+    `python -m src.services.bench text --candidates 1000000`, or
+    `python -m src.services.bench writes --candidates 200000`.
+Dependencies:
+    Standard library only plus the local repositories and models.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..models.candidate import Candidate, CandidateCreate
+from ..models.common import Stage
+from ..models.role import RoleCreate
+from ..models.startup import StartupCreate
+from .compact import CandidateRecord
+from .ingest import CandidateIngest
+from .repositories import InMemoryRepo, SqliteRepo
+from .text_index import TextIndex
+
+_SKILLS = ["python", "go", "rust", "aws", "gcp", "kubernetes", "sql", "react", "ml"]
+_TITLES = [
+    "CTO",
+    "VP Engineering",
+    "Head of Data",
+    "Staff Engineer",
+    "Director",
+    "Platform Engineer",
+    "Engineering Manager",
+    "Data Scientist",
+    "Site Reliability Engineer",
+    "Product Manager",
+]
+_FIRST_NAMES = [
+    "Ada", "Alan", "Grace", "Linus", "Barbara", "Ken", "Margaret", "Dennis",
+    "Frances", "John", "Radia", "Guido", "Katherine", "Donald", "Hedy", "Tim",
+]  # fmt: skip
+_SYLLABLES = [
+    "lo", "ve", "la", "tu", "ri", "ng", "ho", "pper", "tor", "val", "ds",
+    "lis", "kov", "ham", "rit", "chie", "per", "son", "ber", "ner",
+]  # fmt: skip
+_DOMAINS = ["fintech", "health", "devtools", "climate", "security", "ai"]
+_LOCATIONS = ["NYC", "San Francisco", "London", "Berlin", "Remote", "Austin"]
+
+
+def synthetic_candidates(count: int, seed: int = 7) -> List[CandidateCreate]:
+    rng = random.Random(seed)
+    return [
+        CandidateCreate(
+            full_name=" ".join(
+                (
+                    rng.choice(_FIRST_NAMES),
+                    "".join(rng.choice(_SYLLABLES) for _ in range(3)).title(),
+                )
+            ),
+            current_title=rng.choice(_TITLES),
+            titles=rng.sample(_TITLES, 2),
+            years_experience=rng.randint(3, 25),
+            skills=rng.sample(_SKILLS, 4),
+            domains=rng.sample(_DOMAINS, 2),
+            locations=[rng.choice(_LOCATIONS)],
+            stage_preferences=[Stage.seed, Stage.series_a],
+            linkedin_url=f"https://www.linkedin.com/in/candidate-{i}",
+            email=f"candidate{i}@example.com",
+        )
+        for i in range(count)
+    ]
+
+
+def seeded_repo(candidates: int) -> InMemoryRepo:
+    repo = InMemoryRepo()
+    repo.bulk_create_candidates(synthetic_candidates(candidates))
+    startup = repo.create_startup(StartupCreate(name="Acme", stage=Stage.seed))
+    repo.create_role(RoleCreate(startup_id=startup.id, title="CTO"))
+    return repo
+
+
+def bench_snapshot(candidates: int = 100_000) -> Dict[str, Any]:
+    """Cold start from a snapshot file vs re-validating the same payloads."""
+    payloads = synthetic_candidates(candidates)
+    started = time.perf_counter()
+    repo = InMemoryRepo()
+    repo.bulk_create_candidates(payloads)
+    validate_seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "repo.snap"
+        started = time.perf_counter()
+        repo.save_snapshot(path)
+        save_seconds = time.perf_counter() - started
+        size = path.stat().st_size
+
+        started = time.perf_counter()
+        restored = InMemoryRepo()
+        restored.load_snapshot(path)
+        load_seconds = time.perf_counter() - started
+    assert len(restored.list_candidates()) == candidates
+    return {
+        "candidates": candidates,
+        "validate_seconds": validate_seconds,
+        "save_seconds": save_seconds,
+        "load_seconds": load_seconds,
+        "file_bytes": size,
+    }
+
+
+def bench_memory(candidates: int = 100_000) -> Dict[str, Any]:
+    """Bytes per candidate held as Pydantic models vs compact records.
+
+    Both forms are built from JSON lines, like API ingest, so no string is
+    shared up front; only what each form keeps alive is counted.
+    """
+    lines = [
+        Candidate(id=f"cand-{i:08d}", **p.model_dump()).model_dump_json()
+        for i, p in enumerate(synthetic_candidates(candidates))
+    ]
+
+    def footprint(build: Any) -> float:
+        tracemalloc.start()
+        try:
+            held = {}
+            for line in lines:
+                item = build(Candidate.model_validate_json(line))
+                held[item.id] = item
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del held
+        return size / candidates
+
+    models = footprint(lambda cand: cand)
+    records = footprint(CandidateRecord.from_model)
+    return {
+        "candidates": candidates,
+        "model_bytes_per_candidate": round(models),
+        "record_bytes_per_candidate": round(records),
+        "reduction": round(models / records, 2),
+    }
+
+
+def bench_ingest(
+    candidates: int = 100_000, chunk_bytes: int = 64 * 1024
+) -> Dict[str, Any]:
+    """NDJSON ingest throughput into each repo backend, fed in network-size chunks."""
+    body = b"".join(
+        p.model_dump_json().encode("utf-8") + b"\n"
+        for p in synthetic_candidates(candidates)
+    )
+    report: Dict[str, Any] = {"candidates": candidates, "body_bytes": len(body)}
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            "memory": InMemoryRepo(),
+            "sqlite": SqliteRepo.from_path(str(Path(tmp) / "ingest.db")),
+        }
+        for name, repo in backends.items():
+            ingest = CandidateIngest(repo)
+            started = time.perf_counter()
+            for offset in range(0, len(body), chunk_bytes):
+                ingest.feed(body[offset : offset + chunk_bytes])
+            result = ingest.finish()
+            seconds = time.perf_counter() - started
+            assert result["created"] == candidates, result["error_count"]
+            report[f"{name}_records_per_second"] = round(candidates / seconds)
+        backends["sqlite"].store.close()
+    return report
+
+
+def bench_text(candidates: int = 1_000_000, repeat: int = 20) -> Dict[str, Any]:
+    """Trigram index build time and `q=` latency per query shape."""
+    documents = [
+        (str(i), (p.full_name, p.current_title, *p.titles))
+        for i, p in enumerate(synthetic_candidates(candidates))
+    ]
+    started = time.perf_counter()
+    index = TextIndex().with_documents(documents)
+    report: Dict[str, Any] = {
+        "candidates": candidates,
+        "build_seconds": round(time.perf_counter() - started, 2),
+        "vocabulary": len(index.postings),
+    }
+    surname = documents[0][1][0].split()[1]
+    queries = {
+        "exact_name": documents[0][1][0],
+        "surname_prefix": surname[:4],
+        "typo_surname": surname[:-1] + "x",
+        "title_prefix": "plat eng",
+        "typo_title": "enginer managr",
+    }
+    for name, query in queries.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            hits = index.search(query)
+        elapsed = (time.perf_counter() - started) / repeat
+        report[name] = {
+            "query": query,
+            "ms": round(elapsed * 1000, 2),
+            "hits": len(hits),
+        }
+    return report
+
+
+def bench_writes(candidates: int = 200_000, writes: int = 2000) -> Dict[str, Any]:
+    """Latency of single `create_candidate` calls into a pre-seeded repo."""
+    repo = seeded_repo(candidates)
+    gc.freeze()  # keep full collections over the seed out of the timings
+    payloads = synthetic_candidates(writes, seed=11)
+    timings = []
+    for payload in payloads:
+        started = time.perf_counter()
+        repo.create_candidate(payload)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "candidates": candidates,
+        "writes": writes,
+        "mean_ms": round(statistics.mean(timings), 3),
+        "median_ms": round(timings[len(timings) // 2], 3),
+        "p99_ms": round(timings[int(len(timings) * 0.99)], 3),
+        "max_ms": round(timings[-1], 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory repo.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    snapshot = sub.add_parser("snapshot", help="Cold start from a snapshot file.")
+    snapshot.add_argument("--candidates", type=int, default=100_000)
+
+    memory = sub.add_parser("memory", help="Bytes per stored candidate.")
+    memory.add_argument("--candidates", type=int, default=100_000)
+
+    ingest = sub.add_parser("ingest", help="NDJSON ingest throughput.")
+    ingest.add_argument("--candidates", type=int, default=100_000)
+
+    text = sub.add_parser("text", help="Trigram text search latency.")
+    text.add_argument("--candidates", type=int, default=1_000_000)
+
+    writes = sub.add_parser("writes", help="Single-create latency.")
+    writes.add_argument("--candidates", type=int, default=200_000)
+
+    args = parser.parse_args()
+    if args.bench == "snapshot":
+        report = bench_snapshot(args.candidates)
+    elif args.bench == "memory":
+        report = bench_memory(args.candidates)
+    elif args.bench == "ingest":
+        report = bench_ingest(args.candidates)
+    elif args.bench == "text":
+        report = bench_text(args.candidates)
+    elif args.bench == "writes":
+        report = bench_writes(args.candidates)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Compact in-memory candidate records.
+
+Purpose:
+    Hold large candidate pools in a fraction of the memory a Pydantic model
+    per candidate needs. `CandidateRecord` is a `__slots__` object (no
+    per-instance dict); list fields are tuples of interned strings, so each
+    distinct title, skill, domain, or location is stored once per process;
+    stage preference tuples are interned too, so each distinct combination
+    exists once; LinkedIn URLs stay plain strings.
+    Pydantic `Candidate` views are built only when a record leaves the
+    repository (`to_model`).
+Dependencies:
+    Standard library plus the local Pydantic models.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic_core import Url
+
+from ..models.candidate import Candidate
+from ..models.common import Stage
+
+_stage_tuples: Dict[Tuple[Stage, ...], Tuple[Stage, ...]] = {}
+
+
+def intern_stages(stages: Iterable[Stage]) -> Tuple[Stage, ...]:
+    """The shared tuple for an ordered stage list (duplicates kept)."""
+    # `Stage` is a str enum, so plain values find the shared tuple too.
+    key = stages if type(stages) is tuple else tuple(stages)
+    shared = _stage_tuples.get(key)
+    if shared is None:
+        shared = tuple(map(Stage, key))
+        _stage_tuples[shared] = shared
+    return shared
+
+
+def _interned(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(map(sys.intern, values))
+
+
+def _maybe_interned(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def trusted_construct(model: Type[BaseModel], values: Dict[str, Any]) -> Any:
+    """`model.model_construct(**values)` without its per-call overhead.
+
+    Only for fully populated, already-validated data (repository records and
+    snapshot rows); on pydantic 2.9 this is ~5x cheaper than `model_construct`.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+class CandidateRecord:
+    """Slotted storage form of `Candidate`; field names match the model."""
+
+    __slots__ = (
+        "id",
+        "full_name",
+        "current_title",
+        "titles",
+        "years_experience",
+        "skills",
+        "domains",
+        "locations",
+        "timezone",
+        "remote_preference",
+        "stage_preferences",
+        "linkedin_url",
+        "email",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        full_name: str,
+        current_title: Optional[str],
+        titles: Tuple[str, ...],
+        years_experience: int,
+        skills: Tuple[str, ...],
+        domains: Tuple[str, ...],
+        locations: Tuple[str, ...],
+        timezone: Optional[str],
+        remote_preference: Optional[bool],
+        stage_preferences: Tuple[Stage, ...],
+        linkedin_url: Optional[str],
+        email: Optional[str],
+    ) -> None:
+        self.id = id
+        self.full_name = full_name
+        self.current_title = current_title
+        self.titles = titles
+        self.years_experience = years_experience
+        self.skills = skills
+        self.domains = domains
+        self.locations = locations
+        self.timezone = timezone
+        self.remote_preference = remote_preference
+        self.stage_preferences = intern_stages(stage_preferences)
+        self.linkedin_url = linkedin_url
+        self.email = email
+
+    @classmethod
+    def from_model(cls, cand: Candidate) -> "CandidateRecord":
+        return cls(
+            cand.id,
+            cand.full_name,
+            _maybe_interned(cand.current_title),
+            _interned(cand.titles),
+            cand.years_experience,
+            _interned(cand.skills),
+            _interned(cand.domains),
+            _interned(cand.locations),
+            _maybe_interned(cand.timezone),
+            cand.remote_preference,
+            cand.stage_preferences,
+            str(cand.linkedin_url) if cand.linkedin_url is not None else None,
+            cand.email,
+        )
+
+    def project(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """JSON-ready values of `fields` (all by default), without a model."""
+        out: Dict[str, Any] = {}
+        for name in fields or self.__slots__:
+            value = getattr(self, name)
+            if name == "stage_preferences":
+                value = [stage.value for stage in value]
+            elif isinstance(value, tuple):
+                value = list(value)
+            out[name] = value
+        return out
+
+    def to_model(self) -> Candidate:
+        """Materialize the API-facing model (no re-validation)."""
+        return trusted_construct(
+            Candidate,
+            {
+                "id": self.id,
+                "full_name": self.full_name,
+                "current_title": self.current_title,
+                "titles": list(self.titles),
+                "years_experience": self.years_experience,
+                "skills": list(self.skills),
+                "domains": list(self.domains),
+                "locations": list(self.locations),
+                "timezone": self.timezone,
+                "remote_preference": self.remote_preference,
+                "stage_preferences": list(self.stage_preferences),
+                "linkedin_url": (
+                    Url(self.linkedin_url) if self.linkedin_url is not None else None
+                ),
+                "email": self.email,
+            },
+        )
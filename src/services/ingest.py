@@ -0,0 +1,114 @@
+"""Streaming NDJSON candidate ingest.
+
+Purpose:
+    Accept arbitrarily large candidate uploads one JSON object per line.
+    Bytes are fed in as they arrive; each complete line is validated through a
+    cached `TypeAdapter` and buffered, and every `batch_size` valid records are
+    written with one `bulk_create_unique_candidates` call (one published
+    version / one transaction). Emails are deduplicated case-insensitively
+    against stored candidates and the upload itself. Memory stays bounded by
+    one batch plus the capped per-line error and duplicate reports; totals
+    are counted past the caps.
+Dependencies:
+    Pydantic plus the local candidate model and repositories.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from ..models.candidate import CandidateCreate
+
+# Building an adapter compiles a validator; do it once per process.
+CANDIDATE_ADAPTER: TypeAdapter[CandidateCreate] = TypeAdapter(CandidateCreate)
+
+DEFAULT_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+MAX_REPORTED_DUPLICATES = 1000
+
+
+def describe_error(exc: ValidationError) -> str:
+    parts = []
+    for error in exc.errors(include_url=False):
+        loc = ".".join(str(part) for part in error["loc"])
+        parts.append(f"{loc}: {error['msg']}" if loc else error["msg"])
+    return "; ".join(parts)
+
+
+class CandidateIngest:
+    """Incremental NDJSON parser/writer; call `feed` per chunk, then `finish`.
+
+    Line numbers in the report are 1-based; blank lines are skipped but
+    counted. Not thread-safe: feed one upload from one thread at a time.
+    """
+
+    def __init__(
+        self,
+        repo: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_errors: int = MAX_REPORTED_ERRORS,
+        max_duplicates: int = MAX_REPORTED_DUPLICATES,
+    ) -> None:
+        self.repo = repo
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_duplicates = max_duplicates
+        self._partial = b""
+        self._pending: List[Tuple[int, CandidateCreate]] = []
+        self.lines = 0
+        self.created = 0
+        self.duplicates: List[int] = []
+        self.duplicate_count = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.error_count = 0
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._partial + chunk if self._partial else chunk
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._line(line)
+
+    def finish(self) -> Dict[str, Any]:
+        if self._partial:
+            self._line(self._partial)
+            self._partial = b""
+        self._flush()
+        return {
+            "lines": self.lines,
+            "created": self.created,
+            "duplicates": self.duplicates,
+            "duplicate_count": self.duplicate_count,
+            "errors": self.errors,
+            "error_count": self.error_count,
+        }
+
+    def _line(self, raw: bytes) -> None:
+        self.lines += 1
+        if not raw.strip():
+            return
+        try:
+            payload = CANDIDATE_ADAPTER.validate_json(raw)
+        except ValidationError as exc:
+            self.error_count += 1
+            if len(self.errors) < self.max_errors:
+                self.errors.append({"line": self.lines, "error": describe_error(exc)})
+            return
+        self._pending.append((self.lines, payload))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        results = self.repo.bulk_create_unique_candidates([p for _, p in batch])
+        for (line, _), created in zip(batch, results):
+            if created is None:
+                self.duplicate_count += 1
+                if len(self.duplicates) < self.max_duplicates:
+                    self.duplicates.append(line)
+            else:
+                self.created += 1
@@ -0,0 +1,247 @@
+"""Structurally shared collections for the copy-on-write in-memory state.
+
+Purpose:
+    `_MemoryState` publishes a new immutable version on every write, so copying
+    whole dicts and postings per version made a single write O(N). These maps
+    keep a large base that versions share plus a small tier of recent writes:
+    a new version copies only that tier, and the tier is folded into a fresh
+    base once it outgrows about the square root of the base. A write then
+    costs O(sqrt N) amortized while reads stay one or two dict lookups.
+    - `LayeredMap`: key -> value, newer values replace older ones.
+    - `LayeredIndex`: key -> frozenset of ids, where writes only add ids. The
+      recent tier keeps each key's added ids as a tuple of runs, so a write
+      never copies a posting; a read of a touched key merges the runs into
+      the base posting once per version and memoizes the result.
+    - `SharedLog`: append-only sequence of keys plus each key's position, so
+      pages can seek to the entry after a cursor key instead of counting.
+Dependencies:
+    Standard library only.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    overload,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Smallest recent tier worth keeping apart from the base.
+MIN_TIER = 256
+# A write to a `LayeredIndex` tier copies only its key dict, not postings, so
+# the tier can grow further before the (posting-copying) fold.
+INDEX_TIER_FACTOR = 8
+
+_MISSING = object()
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _tier_limit(base_size: int, factor: int = 1) -> int:
+    return max(MIN_TIER, factor * math.isqrt(base_size))
+
+
+class LayeredMap(Mapping[K, V]):
+    """Immutable mapping: a shared base dict plus a small dict of recent writes.
+
+    Iterates in insertion order: base keys first, then keys new in the tier.
+    """
+
+    __slots__ = ("_base", "_recent", "_size")
+
+    def __init__(self, items: Optional[Mapping[K, V]] = None) -> None:
+        self._base: Dict[K, V] = dict(items or {})
+        self._recent: Dict[K, V] = {}
+        self._size = len(self._base)
+
+    @classmethod
+    def _make(cls, base: Dict[K, V], recent: Dict[K, V], size: int) -> "LayeredMap":
+        layered = cls.__new__(cls)
+        layered._base, layered._recent, layered._size = base, recent, size
+        return layered
+
+    def __getitem__(self, key: K) -> V:
+        recent = self._recent
+        if key in recent:
+            return recent[key]
+        return self._base[key]
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        value = self._recent.get(key, _MISSING)
+        if value is _MISSING:
+            return self._base.get(key, default)
+        return value  # type: ignore[return-value]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._recent or key in self._base
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[K]:
+        yield from self._base
+        base = self._base
+        for key in self._recent:
+            if key not in base:
+                yield key
+
+    def updated(self, items: Iterable[Tuple[K, V]]) -> "LayeredMap[K, V]":
+        """A new version with `items` set; this one is left unchanged."""
+        base = self._base
+        recent = dict(self._recent)
+        size = self._size
+        for key, value in items:
+            if key not in recent and key not in base:
+                size += 1
+            recent[key] = value
+        if len(recent) > _tier_limit(len(base)):
+            base, recent = {**base, **recent}, {}
+        return self._make(base, recent, size)
+
+
+class LayeredIndex(Mapping[str, FrozenSet[str]]):
+    """Immutable key -> frozenset index that only ever gains ids.
+
+    `get` and `[]` return the full posting; see the module docstring for how
+    recent additions are merged.
+    """
+
+    __slots__ = ("_base", "_recent", "_base_ids", "_recent_ids", "_merged")
+
+    def __init__(self, items: Optional[Mapping[str, AbstractSet[str]]] = None) -> None:
+        self._base: Dict[str, FrozenSet[str]] = {
+            key: frozenset(ids) for key, ids in (items or {}).items()
+        }
+        self._recent: Dict[str, Tuple[FrozenSet[str], ...]] = {}
+        self._base_ids = sum(len(ids) for ids in self._base.values())
+        self._recent_ids = 0
+        self._merged: Dict[str, FrozenSet[str]] = {}
+
+    def __getitem__(self, key: str) -> FrozenSet[str]:
+        posting = self.get(key)
+        if posting is None:
+            raise KeyError(key)
+        return posting
+
+    def get(  # type: ignore[override]
+        self, key: str, default: Optional[FrozenSet[str]] = None
+    ) -> Optional[FrozenSet[str]]:
+        runs = self._recent.get(key)
+        if runs is None:
+            return self._base.get(key, default)
+        merged = self._merged.get(key)
+        if merged is None:
+            # Versions are immutable, so concurrent readers may both compute
+            # this; either result is the same set.
+            merged = self._base.get(key, _EMPTY).union(*runs)
+            self._merged[key] = merged
+        return merged
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._recent or key in self._base
+
+    def __len__(self) -> int:
+        base = self._base
+        return len(base) + sum(1 for key in self._recent if key not in base)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        base = self._base
+        for key in self._recent:
+            if key not in base:
+                yield key
+
+    def with_added(self, added: Mapping[str, AbstractSet[str]]) -> "LayeredIndex":
+        """A new version with `added` ids unioned into their keys' postings."""
+        if not added:
+            return self
+        base = self._base
+        recent = dict(self._recent)
+        recent_ids = self._recent_ids
+        for key, ids in added.items():
+            recent[key] = (*recent.get(key, ()), frozenset(ids))
+            recent_ids += len(ids)
+        layered = LayeredIndex.__new__(LayeredIndex)
+        if recent_ids > _tier_limit(self._base_ids, INDEX_TIER_FACTOR):
+            base = dict(base)
+            for key, runs in recent.items():
+                base[key] = base.get(key, _EMPTY).union(*runs)
+            layered._base, layered._recent = base, {}
+            layered._base_ids, layered._recent_ids = self._base_ids + recent_ids, 0
+            layered._merged = {}
+        else:
+            layered._base, layered._recent = base, recent
+            layered._base_ids, layered._recent_ids = self._base_ids, recent_ids
+            # Merged postings of keys this write did not touch stay valid.
+            # Readers may be filling the memo; copy it before iterating.
+            memo = self._merged.copy()
+            layered._merged = {
+                key: ids for key, ids in memo.items() if key not in added
+            }
+        return layered
+
+
+class SharedLog(Sequence[K]):
+    """Append-only sequence of distinct keys; `positions` maps key -> index.
+
+    Versions share one list and each sees only its own prefix, so appending
+    is O(appended) and never disturbs readers of older versions. Appending to
+    a version that is not the newest copies its prefix first. Callers must
+    serialize appends (the repository's write lock does).
+    """
+
+    __slots__ = ("_items", "_size", "positions")
+
+    def __init__(self, keys: Iterable[K] = ()) -> None:
+        self._items: List[K] = list(keys)
+        self._size = len(self._items)
+        self.positions: LayeredMap[K, int] = LayeredMap(
+            {key: i for i, key in enumerate(self._items)}
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> K: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[K]: ...
+
+    def __getitem__(self, index):  # type: ignore[no-untyped-def]
+        if isinstance(index, slice):
+            return self._items[slice(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SharedLog index out of range")
+        return self._items[index]
+
+    def appended(self, keys: Iterable[K]) -> "SharedLog[K]":
+        """A new version with `keys` added at the end."""
+        items = self._items
+        if len(items) != self._size:
+            items = items[: self._size]
+        start = len(items)
+        items.extend(keys)
+        log: SharedLog[K] = SharedLog.__new__(SharedLog)
+        log._items, log._size = items, len(items)
+        log.positions = self.positions.updated(
+            (items[i], i) for i in range(start, len(items))
+        )
+        return log
+
+
+__all__ = ["LayeredIndex", "LayeredMap", "SharedLog"]
@@ -0,0 +1,256 @@
+"""Columnar snapshot file for the in-memory repository.
+
+Purpose:
+    Persist candidates, startups, and roles in a compact binary file so a demo
+    worker can boot with a large pool in seconds instead of re-validating every
+    record. Candidates are stored as the repository's compact
+    `CandidateRecord`s; startups and roles as models. Each field is a column:
+    strings are interned into one shared table and referenced by index, lists
+    are offset/value arrays, and integers and booleans are packed arrays.
+    Loading memory-maps the file, reads the columns as typed views, and builds
+    models without re-validation.
+Format:
+    MAGIC, u64 header length, JSON header, then 8-byte aligned sections whose
+    offsets (relative to the end of the header) the header records.
+Dependencies:
+    Standard library plus the local Pydantic models.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+from pydantic_core import Url
+
+from ..models.common import Seniority, Stage
+from ..models.role import Role
+from ..models.startup import Startup
+from .compact import CandidateRecord, trusted_construct
+
+MAGIC = b"SHRSNAP3"
+
+# (field, kind, decoder applied to each stored string) per model. Kinds:
+# "str" optional string, "strs" list of strings, "int", "bool" optional bool.
+# Models are rebuilt with lists; slotted records are called positionally with
+# tuples.
+Column = Tuple[str, str, Optional[Callable[[str], Any]]]
+TABLES: Dict[str, Tuple[type, Tuple[Column, ...]]] = {
+    "candidates": (
+        CandidateRecord,
+        (
+            ("id", "str", None),
+            ("full_name", "str", None),
+            ("current_title", "str", None),
+            ("titles", "strs", None),
+            ("years_experience", "int", None),
+            ("skills", "strs", None),
+            ("domains", "strs", None),
+            ("locations", "strs", None),
+            ("timezone", "str", None),
+            ("remote_preference", "bool", None),
+            ("stage_preferences", "strs", Stage),
+            ("linkedin_url", "str", None),
+            ("email", "str", None),
+        ),
+    ),
+    "startups": (
+        Startup,
+        (
+            ("id", "str", None),
+            ("name", "str", None),
+            ("stage", "str", Stage),
+            ("domains", "strs", None),
+            ("location", "str", None),
+            ("description", "str", None),
+            ("website", "str", Url),
+            ("mission", "str", None),
+            ("stack", "strs", None),
+        ),
+    ),
+    "roles": (
+        Role,
+        (
+            ("id", "str", None),
+            ("startup_id", "str", None),
+            ("title", "str", None),
+            ("required_skills", "strs", None),
+            ("nice_to_have_skills", "strs", None),
+            ("min_years_experience", "int", None),
+            ("responsibilities", "strs", None),
+            ("seniority", "str", Seniority),
+            ("location_preference", "str", None),
+            ("remote_ok", "bool", None),
+            ("compensation_range", "str", None),
+            ("recruiter_notes", "str", None),
+        ),
+    ),
+}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Url):
+        return str(value)
+    return value
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.body = bytearray()
+        # String id 0 is reserved for None.
+        self.strings: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        sid = self.strings.get(value)
+        if sid is None:
+            sid = self.strings[value] = len(self.strings) + 1
+        return sid
+
+    def section(self, data: bytes) -> List[int]:
+        offset = len(self.body)
+        self.body += data
+        self.body += b"\0" * (-len(self.body) % 8)
+        return [offset, len(data)]
+
+
+def write_snapshot(path: Path | str, tables: Dict[str, Sequence[Any]]) -> Path:
+    """Write `{"candidates": [...], "startups": [...], "roles": [...]}` to `path`."""
+    writer = _Writer()
+    header: Dict[str, Any] = {"tables": {}}
+    for name, (_, columns) in TABLES.items():
+        rows = tables.get(name, ())
+        layout: Dict[str, Any] = {}
+        for field, kind, _ in columns:
+            values = [_plain(getattr(row, field)) for row in rows]
+            if kind == "str":
+                data = array("I", (writer.intern(v) for v in values))
+                layout[field] = {"data": writer.section(data.tobytes())}
+            elif kind == "strs":
+                index = array("I", [0])
+                flat = array("I")
+                for items in values:
+                    flat.extend(writer.intern(_plain(v)) for v in items)
+                    index.append(len(flat))
+                layout[field] = {
+                    "index": writer.section(index.tobytes()),
+                    "data": writer.section(flat.tobytes()),
+                }
+            elif kind == "int":
+                layout[field] = {"data": writer.section(array("q", values).tobytes())}
+            else:
+                flags = array("b", (-1 if v is None else int(v) for v in values))
+                layout[field] = {"data": writer.section(flags.tobytes())}
+        header["tables"][name] = {"rows": len(rows), "columns": layout}
+
+    # Offsets are in characters so the loader can decode the blob in one go.
+    ordered = list(writer.strings)
+    char_offsets = array("Q", [0])
+    for value in ordered:
+        char_offsets.append(char_offsets[-1] + len(value))
+    header["strings"] = {
+        "count": len(ordered),
+        "offsets": writer.section(char_offsets.tobytes()),
+        "blob": writer.section("".join(ordered).encode("utf-8")),
+    }
+
+    encoded = json.dumps(header).encode("utf-8")
+    encoded += b" " * (-(len(MAGIC) + 8 + len(encoded)) % 8)
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(target.name + ".partial")
+    with open(partial, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(encoded)))
+        handle.write(encoded)
+        handle.write(writer.body)
+    os.replace(partial, target)
+    return target
+
+
+def read_snapshot(path: Path | str) -> Dict[str, List[Any]]:
+    """Load models written by `write_snapshot`, keyed by table name."""
+    with open(path, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        view = memoryview(mapped)
+        try:
+            if bytes(view[: len(MAGIC)]) != MAGIC:
+                raise ValueError(f"{path} is not a repository snapshot")
+            (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+            start = len(MAGIC) + 8
+            header = json.loads(bytes(view[start : start + header_len]))
+            base = start + header_len
+
+            def section(spec: List[int], fmt: str) -> List[Any]:
+                offset, length = spec
+                chunk = view[base + offset : base + offset + length].cast(fmt)
+                try:
+                    return chunk.tolist()
+                finally:
+                    chunk.release()
+
+            strings_spec = header["strings"]
+            offset, length = strings_spec["blob"]
+            text = str(view[base + offset : base + offset + length], "utf-8")
+            bounds = section(strings_spec["offsets"], "Q")
+            strings = [None, *(text[a:b] for a, b in zip(bounds, bounds[1:]))]
+            return {
+                name: _read_table(header["tables"][name], section, strings, *spec)
+                for name, spec in TABLES.items()
+            }
+        finally:
+            view.release()
+
+
+def _read_table(
+    layout: Dict[str, Any],
+    section: Callable[[List[int], str], List[Any]],
+    strings: List[Optional[str]],
+    model: type,
+    columns: Iterable[Column],
+) -> List[Any]:
+    if not layout["rows"]:
+        return []
+    is_model = issubclass(model, BaseModel)
+    names: List[str] = []
+    decoded: List[List[Any]] = []
+    for field, kind, decode in columns:
+        spec = layout["columns"][field]
+        names.append(field)
+        if kind in ("str", "strs"):
+            ids = section(spec["data"], "I")
+            if decode is None:
+                values = list(map(strings.__getitem__, ids))
+            else:
+                # Decode each distinct string once (enums repeat heavily).
+                table = {
+                    sid: None if sid == 0 else decode(strings[sid]) for sid in set(ids)
+                }
+                values = list(map(table.__getitem__, ids))
+            if kind == "strs":
+                index = section(spec["index"], "I")
+                bounds = zip(index, index[1:])
+                if is_model:
+                    values = [values[a:b] for a, b in bounds]
+                else:
+                    values = [tuple(values[a:b]) for a, b in bounds]
+            decoded.append(values)
+        elif kind == "int":
+            decoded.append(section(spec["data"], "q"))
+        else:
+            flags = (None, False, True)
+            decoded.append([flags[f + 1] for f in section(spec["data"], "b")])
+    if not is_model:
+        return [model(*row) for row in zip(*decoded)]
+    return [trusted_construct(model, dict(zip(names, row))) for row in zip(*decoded)]
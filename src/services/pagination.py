@@ -0,0 +1,63 @@
+"""Cursor and field-projection helpers for list endpoints.
+
+Purpose:
+    Repositories page through their data by keyset: the in-memory repo's key
+    is the last id returned, SQLite's is the last row's rowid (`WHERE rowid >
+    ? ORDER BY rowid`), so inserts and deletes between requests never shift a
+    page. Cursors wrap that key in an opaque URL-safe token so clients only
+    ever echo it back. The paged tables have TEXT ids, so a `VACUUM` may
+    renumber their rowids and invalidates every SQLite cursor issued before
+    it (see `src.jobs.recompress --vacuum`). `parse_fields` validates a
+    `fields=` projection against a model's attributes.
+Dependencies:
+    Standard library plus Pydantic model metadata.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def encode_cursor(key: Any) -> Optional[str]:
+    """Opaque token for a page key; None stays None (no next page)."""
+    if key is None:
+        return None
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Any:
+    """Page key inside `cursor`; raises ValueError for malformed tokens."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def parse_fields(
+    fields: Optional[str | Sequence[str]], model: Type[BaseModel]
+) -> Optional[List[str]]:
+    """Requested attribute names in model order, or None for every field.
+
+    Accepts a comma-separated string or a sequence; raises ValueError naming
+    unknown fields.
+    """
+    if not fields:
+        return None
+    names = fields.split(",") if isinstance(fields, str) else list(fields)
+    wanted = {name.strip() for name in names if name.strip()}
+    unknown = sorted(wanted - set(model.model_fields))
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+    return [name for name in model.model_fields if name in wanted]
@@ -1,39 +1,739 @@
-"""In-memory repositories for candidates, startups, and roles.
+"""Repositories for candidates, startups, and roles.
 
-Thread-safety is not a focus for this demo. For production, replace with a DB
-layer and proper locking/transactions.
+`InMemoryRepo` is the process-local demo backend; it publishes immutable
+copy-on-write versions so concurrent requests read consistent data lock-free,
+and stores candidates as compact `CandidateRecord`s that become `Candidate`
+models only when they are returned.
+`SqliteRepo` exposes the same methods on top of `DataStore` so several workers
+can share one database file. Pick one with `REPO_BACKEND=memory|sqlite`
+(`REPO_DB_PATH` sets the SQLite file; `REPO_SNAPSHOT_DIR` seeds a fresh file
+from the newest snapshot there; `STORE_QUERY_STATS=1` turns on per-statement
+timing with a `STORE_SLOW_QUERY_MS` slow-query log). The memory backend boots
+from `REPO_MEMORY_SNAPSHOT` when that file exists (see `save_snapshot`).
 """
 
 from __future__ import annotations
 
-from typing import Dict, Optional, List
+import gc
+import os
+import sqlite3
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from uuid import uuid4
 
+from ..data.store import DataStore, latest_snapshot
+from .compact import CandidateRecord, trusted_construct
+from .layered import LayeredIndex, LayeredMap, SharedLog
+from .memory_snapshot import read_snapshot, write_snapshot
+from .pagination import DEFAULT_LIMIT, decode_cursor, encode_cursor
+from .query_planner import Predicate, SearchPlan, execute_plan, plan_search
+from .text_index import TextIndex
 from ..models.candidate import Candidate, CandidateCreate
 from ..models.startup import Startup, StartupCreate
 from ..models.role import Role, RoleCreate
 
 
+T = TypeVar("T")
+
+
+class DuplicateEmailError(ValueError):
+    """A created candidate's email is already taken; the API answers 409."""
+
+
+@contextmanager
+def _email_conflicts() -> Iterator[None]:
+    try:
+        yield
+    except sqlite3.IntegrityError as exc:
+        if "candidates.email" not in str(exc):
+            raise
+        raise DuplicateEmailError("candidate email already exists") from exc
+
+
+def _norm(value: str) -> str:
+    return value.strip().lower()
+
+
+def _norm_all(values: Optional[Iterable[str]]) -> Set[str]:
+    return {_norm(v) for v in (values or []) if v and v.strip()}
+
+
+def _email_key(email: Optional[str]) -> Optional[str]:
+    return email.strip().lower() if email and email.strip() else None
+
+
+def _new_candidate(payload: CandidateCreate, cid: Optional[str] = None) -> Candidate:
+    """`Candidate` for an already-validated payload, without validating again."""
+    return trusted_construct(Candidate, {"id": cid or str(uuid4()), **payload.__dict__})
+
+
+def _unique_by_email(
+    payloads: Sequence[CandidateCreate], taken: Callable[[Set[str]], AbstractSet[str]]
+) -> List[bool]:
+    """Keep-flags per payload: False when its email is `taken` or repeated."""
+    keys = [_email_key(p.email) for p in payloads]
+    seen = set(taken({key for key in keys if key}))
+    keep = []
+    for key in keys:
+        keep.append(key is None or key not in seen)
+        if key:
+            seen.add(key)
+    return keep
+
+
+Page = Tuple[List[Dict[str, Any]], Optional[str]]
+
+
+def _page_key(cursor: Optional[str]) -> int:
+    key = decode_cursor(cursor)
+    if key is None:
+        return 0
+    if not isinstance(key, int) or isinstance(key, bool) or key < 0:
+        raise ValueError("invalid cursor")
+    return key
+
+
+def _seek(log: SharedLog[str], cursor: Optional[str]) -> int:
+    """Position in `log` just after the id a memory cursor names."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return 0
+    position = log.positions.get(key) if isinstance(key, str) else None
+    if position is None:
+        raise ValueError("invalid cursor")
+    return position + 1
+
+
+def _page(
+    ids: Sequence[str],
+    start: int,
+    limit: int,
+    project: Callable[[str], Dict[str, Any]],
+) -> Page:
+    """Keyset page of `ids` from `start`; the cursor is the last id returned."""
+    window = ids[start : start + limit + 1]
+    rows = window[:limit]
+    next_cursor = encode_cursor(rows[-1]) if len(window) > limit else None
+    return [project(key) for key in rows], next_cursor
+
+
+def _dump(fields: Optional[List[str]]) -> Callable[[Any], Dict[str, Any]]:
+    include = set(fields) if fields else None
+    return lambda model: model.model_dump(mode="json", include=include)
+
+
+def _row_fields(
+    rows: List[Dict[str, Any]], fields: Optional[List[str]], names: Iterable[str]
+) -> List[Dict[str, Any]]:
+    wanted = list(fields or names)
+    return [{name: row[name] for name in wanted} for row in rows]
+
+
+@dataclass(frozen=True)
+class _MemoryState:
+    """One published version of the in-memory data.
+
+    Never mutated once published: writers build a new state from the previous
+    one and swap it in, so readers holding a state always see a consistent view
+    without locking. The maps share structure between versions (see `layered`),
+    so a write copies only what it touches. Candidates are held as
+    `CandidateRecord`s; read methods return `Candidate` models.
+    """
+
+    version: int = 0
+    candidates: LayeredMap[str, CandidateRecord] = field(default_factory=LayeredMap)
+    startups: LayeredMap[str, Startup] = field(default_factory=LayeredMap)
+    roles: LayeredMap[str, Role] = field(default_factory=LayeredMap)
+    # Secondary indexes: normalized value -> candidate ids.
+    by_skill: LayeredIndex = field(default_factory=LayeredIndex)
+    by_title: LayeredIndex = field(default_factory=LayeredIndex)
+    by_domain: LayeredIndex = field(default_factory=LayeredIndex)
+    by_location: LayeredIndex = field(default_factory=LayeredIndex)
+    roles_by_startup: LayeredMap[str, Tuple[str, ...]] = field(
+        default_factory=LayeredMap
+    )
+    # Ids in creation order, for keyset paging and stable result order.
+    candidate_order: SharedLog[str] = field(default_factory=SharedLog)
+    startup_order: SharedLog[str] = field(default_factory=SharedLog)
+    role_order: SharedLog[str] = field(default_factory=SharedLog)
+    by_email: LayeredMap[str, str] = field(default_factory=LayeredMap)
+    text: TextIndex = field(default_factory=TextIndex)
+
+    # --- copy-on-write updates ---
+    def with_candidates(self, new: Sequence[CandidateRecord]) -> "_MemoryState":
+        emails = ((_email_key(cand.email), cand.id) for cand in new)
+        additions: Dict[str, Dict[str, Set[str]]] = {
+            "by_skill": {},
+            "by_title": {},
+            "by_domain": {},
+            "by_location": {},
+        }
+        # Field values repeat heavily across candidates; normalize each once.
+        normalized: Dict[str, str] = {}
+        for cand in new:
+            cid = cand.id
+            for name, values in (
+                ("by_skill", cand.skills),
+                ("by_title", (*cand.titles, cand.current_title)),
+                ("by_domain", cand.domains),
+                ("by_location", cand.locations),
+            ):
+                postings = additions[name]
+                for value in values:
+                    if not value:
+                        continue
+                    key = normalized.get(value)
+                    if key is None:
+                        key = normalized[value] = _norm(value)
+                    if key:
+                        postings.setdefault(key, set()).add(cid)
+        indexes = {
+            name: getattr(self, name).with_added(added)
+            for name, added in additions.items()
+        }
+        return replace(
+            self,
+            version=self.version + 1,
+            candidates=self.candidates.updated((cand.id, cand) for cand in new),
+            candidate_order=self.candidate_order.appended(cand.id for cand in new),
+            by_email=self.by_email.updated((key, cid) for key, cid in emails if key),
+            text=self.text.with_documents(
+                (cand.id, (cand.full_name, cand.current_title, *cand.titles))
+                for cand in new
+            ),
+            **indexes,
+        )
+
+    def with_startups(self, new: Sequence[Startup]) -> "_MemoryState":
+        return replace(
+            self,
+            version=self.version + 1,
+            startups=self.startups.updated((st.id, st) for st in new),
+            startup_order=self.startup_order.appended(st.id for st in new),
+        )
+
+    def with_roles(self, new: Sequence[Role]) -> "_MemoryState":
+        by_startup: Dict[str, List[str]] = {}
+        for role in new:
+            by_startup.setdefault(role.startup_id, []).append(role.id)
+        known = self.roles_by_startup
+        return replace(
+            self,
+            version=self.version + 1,
+            roles=self.roles.updated((role.id, role) for role in new),
+            role_order=self.role_order.appended(role.id for role in new),
+            roles_by_startup=known.updated(
+                (startup_id, (*known.get(startup_id, ()), *ids))
+                for startup_id, ids in by_startup.items()
+            ),
+        )
+
+    # --- reads ---
+    def get_candidate(self, cid: str) -> Optional[Candidate]:
+        record = self.candidates.get(cid)
+        return record.to_model() if record is not None else None
+
+    def list_candidates(self, ids: Optional[List[str]] = None) -> List[Candidate]:
+        if ids is None:
+            return [record.to_model() for record in self.candidates.values()]
+        found = (self.candidates.get(cid) for cid in dict.fromkeys(ids))
+        return [record.to_model() for record in found if record is not None]
+
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Lower-cased members of `emails` that some candidate already uses."""
+        keys = (_email_key(email) for email in emails)
+        return {key for key in keys if key and key in self.by_email}
+
+    def search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> List[Candidate]:
+        """Planned index search (see `query_planner`).
+
+        Every skill must match; titles (past or current) and domains match if
+        any value does; location must equal one of the candidate's locations.
+        With `q`, results must also match the text query (prefix and typo
+        tolerant over name and titles, see `text_index`) and rank by relevance.
+        """
+        return self._run_search(skills, titles, domains, location, q)[0]
+
+    def explain_search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> Tuple[List[Candidate], Dict[str, Any]]:
+        """`search_candidates` results plus the plan with estimated/actual rows."""
+        results, plan = self._run_search(skills, titles, domains, location, q)
+        explained = plan.explain(len(results))
+        if q:
+            explained["text_query"] = q
+        return results, explained
+
+    def _run_search(
+        self,
+        skills: Optional[List[str]],
+        titles: Optional[List[str]],
+        domains: Optional[List[str]],
+        location: Optional[str],
+        q: Optional[str] = None,
+    ) -> Tuple[List[Candidate], SearchPlan]:
+        empty: FrozenSet[str] = frozenset()
+        # Skills are ANDed, so each one is its own predicate.
+        predicates = [
+            Predicate("skill", (skill,), (self.by_skill.get(skill, empty),))
+            for skill in sorted(_norm_all(skills))
+        ]
+        for name, index, values in (
+            ("title", self.by_title, _norm_all(titles)),
+            ("domain", self.by_domain, _norm_all(domains)),
+            ("location", self.by_location, _norm_all([location] if location else [])),
+        ):
+            if values:
+                ordered = tuple(sorted(values))
+                postings = tuple(index.get(value, empty) for value in ordered)
+                predicates.append(Predicate(name, ordered, postings))
+        plan = plan_search(predicates, len(self.candidates))
+        if q and q.strip():
+            restrict = execute_plan(plan, self.candidates) if plan.predicates else None
+            scores = self.text.search(q, restrict=restrict)
+            order = self.candidate_order.positions
+            ranked = sorted(scores, key=lambda cid: (-scores[cid], order[cid]))
+            return [self.candidates[cid].to_model() for cid in ranked], plan
+        if not plan.predicates:
+            return self.list_candidates(), plan
+        matched = execute_plan(plan, self.candidates)
+        results = [
+            self.candidates[cid].to_model()
+            for cid in sorted(matched, key=self.candidate_order.positions.__getitem__)
+        ]
+        return results, plan
+
+    def page_candidates(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        """`limit` candidates as JSON-ready dicts of `fields`, plus next cursor.
+
+        Records are projected directly; no `Candidate` model is built.
+        """
+        ids = self.candidate_order
+        return _page(
+            ids,
+            _seek(ids, cursor),
+            limit,
+            lambda cid: self.candidates[cid].project(fields),
+        )
+
+    def get_startup(self, sid: str) -> Optional[Startup]:
+        return self.startups.get(sid)
+
+    def list_startups(self) -> List[Startup]:
+        return list(self.startups.values())
+
+    def page_startups(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        dump = _dump(fields)
+        ids = self.startup_order
+        return _page(
+            ids, _seek(ids, cursor), limit, lambda sid: dump(self.startups[sid])
+        )
+
+    def get_role(self, rid: str) -> Optional[Role]:
+        return self.roles.get(rid)
+
+    def list_roles(self, startup_id: Optional[str] = None) -> List[Role]:
+        if startup_id:
+            return [
+                self.roles[rid] for rid in self.roles_by_startup.get(startup_id, ())
+            ]
+        return list(self.roles.values())
+
+    def page_roles(
+        self,
+        startup_id: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        dump = _dump(fields)
+        start = _seek(self.role_order, cursor)
+        ids: Sequence[str] = self.role_order
+        if startup_id:
+            # A startup's role ids are in creation order too: seek by position.
+            ids = self.roles_by_startup.get(startup_id, ())
+            if start:
+                positions = self.role_order.positions
+                start = bisect_right(ids, start - 1, key=positions.__getitem__)
+        return _page(ids, start, limit, lambda rid: dump(self.roles[rid]))
+
+
 class InMemoryRepo:
+    """Process-local repo publishing immutable `_MemoryState` versions.
+
+    Reads grab the current state (a single attribute load) and never lock.
+    Writes validate models outside the lock, then build and swap in a new
+    state under `_write_lock`; `bulk_create_candidates` publishes a whole batch
+    as one version. Concurrent creates are group-committed: records queue in
+    `_pending` and whichever writer takes the lock publishes every queued
+    record as one version, so the others find theirs already visible.
+    """
+
     def __init__(self) -> None:
-        self.candidates: Dict[str, Candidate] = {}
-        self.startups: Dict[str, Startup] = {}
-        self.roles: Dict[str, Role] = {}
+        self._state = _MemoryState()
+        self._write_lock = threading.Lock()
+        self._pending: List[CandidateRecord] = []
+        self._pending_lock = threading.Lock()
+
+    def _take_pending(self) -> List[CandidateRecord]:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def read_view(self) -> _MemoryState:
+        """The current immutable version; use it for multi-step reads."""
+        return self._state
+
+    @property
+    def candidates(self) -> Mapping[str, CandidateRecord]:
+        """Compact records by id; use `get_candidate` for the model."""
+        return MappingProxyType(self._state.candidates)
+
+    @property
+    def startups(self) -> Mapping[str, Startup]:
+        return MappingProxyType(self._state.startups)
+
+    @property
+    def roles(self) -> Mapping[str, Role]:
+        return MappingProxyType(self._state.roles)
 
     # Candidate ops
     def create_candidate(self, payload: CandidateCreate) -> Candidate:
-        cid = str(uuid4())
-        cand = Candidate(id=cid, **payload.model_dump())
-        self.candidates[cid] = cand
+        return self.bulk_create_candidates([payload])[0]
+
+    def bulk_create_candidates(
+        self, payloads: Sequence[CandidateCreate]
+    ) -> List[Candidate]:
+        created = [_new_candidate(p) for p in payloads]
+        records = [CandidateRecord.from_model(cand) for cand in created]
+        with self._pending_lock:
+            self._pending.extend(records)
+        with self._write_lock:
+            pending = self._take_pending()
+            if pending:
+                self._state = self._state.with_candidates(pending)
+        return created
+
+    def bulk_create_unique_candidates(
+        self, payloads: Sequence[CandidateCreate]
+    ) -> List[Optional[Candidate]]:
+        """Create payloads whose email is new, as one version.
+
+        Emails compare case-insensitively against stored candidates and earlier
+        payloads in the batch; skipped payloads come back as None.
+        """
+        created = [_new_candidate(p) for p in payloads]
+        records = [CandidateRecord.from_model(cand) for cand in created]
+        with self._write_lock:
+            pending = self._take_pending()
+            state = self._state.with_candidates(pending) if pending else self._state
+            keep = _unique_by_email(payloads, state.existing_emails)
+            self._state = state.with_candidates(
+                [record for record, kept in zip(records, keep) if kept]
+            )
+        return [cand if kept else None for cand, kept in zip(created, keep)]
+
+    def get_candidate(self, cid: str) -> Optional[Candidate]:
+        return self._state.get_candidate(cid)
+
+    def list_candidates(self, ids: Optional[List[str]] = None) -> List[Candidate]:
+        return self._state.list_candidates(ids)
+
+    def search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> List[Candidate]:
+        return self._state.search_candidates(skills, titles, domains, location, q)
+
+    def explain_search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> Tuple[List[Candidate], Dict[str, Any]]:
+        return self._state.explain_search_candidates(
+            skills, titles, domains, location, q
+        )
+
+    def page_candidates(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        return self._state.page_candidates(limit, cursor, fields)
+
+    # Startup ops
+    def create_startup(self, payload: StartupCreate) -> Startup:
+        st = Startup(id=str(uuid4()), **payload.model_dump())
+        with self._write_lock:
+            self._state = self._state.with_startups([st])
+        return st
+
+    def get_startup(self, sid: str) -> Optional[Startup]:
+        return self._state.get_startup(sid)
+
+    def list_startups(self) -> List[Startup]:
+        return self._state.list_startups()
+
+    def page_startups(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        return self._state.page_startups(limit, cursor, fields)
+
+    # Role ops
+    def create_role(self, payload: RoleCreate) -> Role:
+        role = Role(id=str(uuid4()), **payload.model_dump())
+        with self._write_lock:
+            self._state = self._state.with_roles([role])
+        return role
+
+    def get_role(self, rid: str) -> Optional[Role]:
+        return self._state.get_role(rid)
+
+    def list_roles(self, startup_id: Optional[str] = None) -> List[Role]:
+        return self._state.list_roles(startup_id)
+
+    def page_roles(
+        self,
+        startup_id: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        return self._state.page_roles(startup_id, limit, cursor, fields)
+
+    # Persistence
+    def save_snapshot(self, path: Path | str) -> Path:
+        """Write the current version to a columnar snapshot file."""
+        state = self._state
+        return write_snapshot(
+            path,
+            {
+                "candidates": list(state.candidates.values()),
+                "startups": list(state.startups.values()),
+                "roles": list(state.roles.values()),
+            },
+        )
+
+    def load_snapshot(self, path: Path | str) -> None:
+        """Replace the repo contents with a snapshot written by `save_snapshot`.
+
+        Snapshot data is trusted: models are rebuilt without re-validation.
+        """
+        # Millions of fresh, acyclic objects would trigger repeated full GC
+        # passes; pause the collector while building them.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            tables = read_snapshot(path)
+            state = (
+                _MemoryState()
+                .with_candidates(tables["candidates"])
+                .with_startups(tables["startups"])
+                .with_roles(tables["roles"])
+            )
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        with self._write_lock:
+            self._state = replace(state, version=self._state.version + 1)
+
+
+class _LRUCache:
+    """Small thread-safe LRU map used for read-through lookups.
+
+    A load that overlaps a `clear` is not cached: it may have read the data
+    the clear was discarding.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self, key: str, loader: Callable[[str], Optional[T]]
+    ) -> Optional[T]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            generation = self._generation
+        value = loader(key)
+        if value is not None:
+            self.put(key, value, generation)
+        return value
+
+    def put(self, key: str, value: Any, generation: Optional[int] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._generation += 1
+
+
+class SqliteRepo:
+    """`InMemoryRepo` surface backed by the SQLite `DataStore`.
+
+    `get_role`, `get_startup`, and `get_candidate` are served from per-entity LRU
+    caches; writes replace the cached entry for the id they touch. Other
+    workers write the same file through their own connections, so every
+    cached read first checks SQLite's `PRAGMA data_version`, which changes
+    when another connection commits, and drops all caches when it moved.
+    """
+
+    def __init__(self, store: DataStore, cache_size: int = 1024) -> None:
+        self.store = store
+        self._candidate_cache = _LRUCache(cache_size)
+        self._startup_cache = _LRUCache(cache_size)
+        self._role_cache = _LRUCache(cache_size)
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self.store.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _sync_caches(self) -> None:
+        """Drop cached rows when another connection committed since last check."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            for cache in (self._candidate_cache, self._startup_cache, self._role_cache):
+                cache.clear()
+
+    @classmethod
+    def from_path(
+        cls,
+        db_path: str,
+        cache_size: int = 1024,
+        snapshot_dir: Optional[str] = None,
+    ) -> "SqliteRepo":
+        """Open (or create) the store at `db_path`.
+
+        A fresh worker with no local database starts from the newest snapshot in
+        `snapshot_dir` when one exists, instead of an empty migrated schema.
+        """
+        fresh = db_path == ":memory:" or not Path(db_path).exists()
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        snapshot = latest_snapshot(snapshot_dir) if fresh and snapshot_dir else None
+        if snapshot is not None:
+            store = DataStore.from_snapshot(snapshot, db_path)
+        else:
+            store = DataStore(db_path)
+        if db_path != ":memory:":
+            # WAL lets readers in other worker processes proceed during writes.
+            store.conn.execute("PRAGMA journal_mode = WAL")
+            store.conn.execute("PRAGMA busy_timeout = 5000")
+        return cls(store, cache_size=cache_size)
+
+    def read_view(self) -> "SqliteRepo":
+        """Each read sees committed rows; there is no multi-call snapshot."""
+        return self
+
+    # Candidate ops
+    def create_candidate(self, payload: CandidateCreate) -> Candidate:
+        with _email_conflicts():
+            row = self.store.create_candidate(payload.model_dump(mode="json"))
+        cand = Candidate.model_validate(row)
+        self._candidate_cache.put(cand.id, cand)
         return cand
 
+    def bulk_create_candidates(
+        self, payloads: Sequence[CandidateCreate]
+    ) -> List[Candidate]:
+        """Insert the batch with one statement and one commit; all or nothing."""
+        with _email_conflicts(), self.store.transaction():
+            ids = self.store.create_candidates(
+                [payload.model_dump(mode="json") for payload in payloads]
+            )
+        return [_new_candidate(p, cid) for p, cid in zip(payloads, ids)]
+
+    def bulk_create_unique_candidates(
+        self, payloads: Sequence[CandidateCreate]
+    ) -> List[Optional[Candidate]]:
+        """See `InMemoryRepo.bulk_create_unique_candidates`."""
+        with self.store.transaction():
+            keep = _unique_by_email(payloads, self.store.existing_emails)
+            kept = [p for p, flag in zip(payloads, keep) if flag]
+            created = iter(self.bulk_create_candidates(kept))
+        return [next(created) if flag else None for flag in keep]
+
     def get_candidate(self, cid: str) -> Optional[Candidate]:
-        return self.candidates.get(cid)
+        self._sync_caches()
+        return self._candidate_cache.get_or_load(cid, self._load_candidate)
 
     def list_candidates(self, ids: Optional[List[str]] = None) -> List[Candidate]:
         if ids is None:
-            return list(self.candidates.values())
-        return [c for c in self.candidates.values() if c.id in set(ids)]
+            return [Candidate.model_validate(r) for r in self.store.list_candidates()]
+        found = (self.get_candidate(cid) for cid in dict.fromkeys(ids))
+        return [c for c in found if c is not None]
 
     def search_candidates(
         self,
@@ -41,63 +741,131 @@ class InMemoryRepo:
         titles: Optional[List[str]] = None,
         domains: Optional[List[str]] = None,
         location: Optional[str] = None,
+        q: Optional[str] = None,
     ) -> List[Candidate]:
-        skills_s = {s.strip().lower() for s in (skills or []) if s}
-        titles_s = {t.strip().lower() for t in (titles or []) if t}
-        domains_s = {d.strip().lower() for d in (domains or []) if d}
-        loc = (location or "").strip().lower()
-
-        def matches(c: Candidate) -> bool:
-            if skills_s:
-                cand_sk = {s.strip().lower() for s in c.skills}
-                if not skills_s.issubset(cand_sk):
-                    return False
-            if titles_s:
-                cand_titles = [*(c.titles or []), c.current_title or ""]
-                cand_titles_s = {t.strip().lower() for t in cand_titles if t}
-                if not (titles_s & cand_titles_s):
-                    return False
-            if domains_s:
-                cand_domains = {d.strip().lower() for d in c.domains}
-                if not (domains_s & cand_domains):
-                    return False
-            if loc:
-                cand_locs = {loc_value.strip().lower() for loc_value in c.locations}
-                if loc not in cand_locs:
-                    return False
-            return True
-
-        return [c for c in self.candidates.values() if matches(c)]
+        rows = self.store.search_candidates(
+            skills=skills, titles=titles, domains=domains, location=location, text=q
+        )
+        return [Candidate.model_validate(r) for r in rows]
+
+    def explain_search_candidates(
+        self,
+        skills: Optional[List[str]] = None,
+        titles: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> Tuple[List[Candidate], Dict[str, Any]]:
+        """Results plus SQLite's own plan; SQLite keeps no value statistics."""
+        filters = {
+            "skills": skills,
+            "titles": titles,
+            "domains": domains,
+            "location": location,
+        }
+        results = self.search_candidates(**filters, q=q)
+        return results, {
+            "strategy": "sqlite",
+            "sqlite_plan": self.store.explain_search_candidates(**filters, text=q),
+            "estimated_rows": None,
+            "actual_rows": len(results),
+        }
+
+    def page_candidates(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        """Keyset page straight from stored rows; no `Candidate` is built."""
+        rows, key = self.store.page_candidates(
+            after=_page_key(cursor), limit=limit, columns=fields
+        )
+        return _row_fields(rows, fields, Candidate.model_fields), encode_cursor(key)
 
     # Startup ops
     def create_startup(self, payload: StartupCreate) -> Startup:
-        sid = str(uuid4())
-        st = Startup(id=sid, **payload.model_dump())
-        self.startups[sid] = st
+        row = self.store.create_startup(payload.model_dump(mode="json"))
+        st = Startup.model_validate(row)
+        self._startup_cache.put(st.id, st)
         return st
 
     def get_startup(self, sid: str) -> Optional[Startup]:
-        return self.startups.get(sid)
+        self._sync_caches()
+        return self._startup_cache.get_or_load(sid, self._load_startup)
 
     def list_startups(self) -> List[Startup]:
-        return list(self.startups.values())
+        return [Startup.model_validate(r) for r in self.store.list_startups()]
+
+    def page_startups(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        rows, key = self.store.page_startups(
+            after=_page_key(cursor), limit=limit, columns=fields
+        )
+        return _row_fields(rows, fields, Startup.model_fields), encode_cursor(key)
 
     # Role ops
     def create_role(self, payload: RoleCreate) -> Role:
-        rid = str(uuid4())
-        role = Role(id=rid, **payload.model_dump())
-        self.roles[rid] = role
+        row = self.store.create_role(payload.model_dump(mode="json"))
+        role = Role.model_validate(row)
+        self._role_cache.put(role.id, role)
         return role
 
     def get_role(self, rid: str) -> Optional[Role]:
-        return self.roles.get(rid)
+        self._sync_caches()
+        return self._role_cache.get_or_load(rid, self._load_role)
 
     def list_roles(self, startup_id: Optional[str] = None) -> List[Role]:
-        roles = list(self.roles.values())
-        if startup_id:
-            roles = [r for r in roles if r.startup_id == startup_id]
-        return roles
+        return [Role.model_validate(r) for r in self.store.list_roles(startup_id)]
+
+    def page_roles(
+        self,
+        startup_id: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page:
+        rows, key = self.store.page_roles(
+            startup_id, after=_page_key(cursor), limit=limit, columns=fields
+        )
+        return _row_fields(rows, fields, Role.model_fields), encode_cursor(key)
+
+    def _load_candidate(self, cid: str) -> Optional[Candidate]:
+        row = self.store.get_candidate(cid)
+        return Candidate.model_validate(row) if row else None
+
+    def _load_startup(self, sid: str) -> Optional[Startup]:
+        row = self.store.get_startup(sid)
+        return Startup.model_validate(row) if row else None
+
+    def _load_role(self, rid: str) -> Optional[Role]:
+        row = self.store.get_role(rid)
+        return Role.model_validate(row) if row else None
+
+
+def _select_repo() -> InMemoryRepo | SqliteRepo:
+    backend = os.getenv("REPO_BACKEND", "memory").lower()
+    if backend == "sqlite":
+        sqlite_repo = SqliteRepo.from_path(
+            os.getenv("REPO_DB_PATH", str(Path("data") / "app.db")),
+            cache_size=int(os.getenv("REPO_CACHE_SIZE", "1024")),
+            snapshot_dir=os.getenv("REPO_SNAPSHOT_DIR") or None,
+        )
+        if os.getenv("STORE_QUERY_STATS", "").lower() in {"1", "true", "yes"}:
+            sqlite_repo.store.enable_query_stats(
+                slow_ms=float(os.getenv("STORE_SLOW_QUERY_MS", "50"))
+            )
+        return sqlite_repo
+    memory_repo = InMemoryRepo()
+    snapshot = os.getenv("REPO_MEMORY_SNAPSHOT")
+    if snapshot and Path(snapshot).exists():
+        memory_repo.load_snapshot(snapshot)
+    return memory_repo
 
 
-# Single, process-local repo instance for the demo app
-repo = InMemoryRepo()
+# Single, process-wide repo instance for the app (in-memory unless configured)
+repo = _select_repo()
@@ -0,0 +1,181 @@
+"""Trigram text index for prefix and typo-tolerant candidate search.
+
+Purpose:
+    Back the `q=` search over `full_name`, `current_title` and `titles`. Text
+    is split into words; the index keeps word -> candidate ids plus a trigram
+    index over the *vocabulary* (trigram -> words), which stays small because
+    names and titles reuse the same words across many candidates. A query
+    word matches vocabulary words exactly, by prefix ("plat" -> "platform"),
+    or by trigram similarity above a threshold ("enginer" -> "engineer");
+    every query word must match (AND) and results rank by the mean of each
+    query word's best match score. Like the other in-memory indexes it is
+    immutable: `with_documents` returns an updated version that shares
+    structure with this one (see `layered`).
+Dependencies:
+    Standard library plus the local layered maps.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .layered import LayeredIndex
+
+DEFAULT_THRESHOLD = 0.3
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def words(text: str) -> List[str]:
+    return _WORD_RE.findall(text.casefold())
+
+
+def trigrams(word: str) -> FrozenSet[str]:
+    """pg_trgm-style trigrams: two leading blanks, one trailing."""
+    padded = f"  {word} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _prefix_trigrams(prefix: str) -> FrozenSet[str]:
+    # Without the trailing blank: every word starting with `prefix` has these.
+    padded = f"  {prefix}"
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class TextIndex:
+    postings: LayeredIndex = field(default_factory=LayeredIndex)
+    by_trigram: LayeredIndex = field(default_factory=LayeredIndex)
+
+    def with_documents(
+        self, documents: Iterable[Tuple[str, Sequence[Optional[str]]]]
+    ) -> "TextIndex":
+        """Index `(candidate_id, texts)` pairs on top of this version."""
+        added: Dict[str, Set[str]] = {}
+        split: Dict[str, List[str]] = {}  # texts repeat (titles); split once
+        for cid, texts in documents:
+            for text in texts:
+                if not text:
+                    continue
+                parts = split.get(text)
+                if parts is None:
+                    parts = split[text] = words(text)
+                for word in parts:
+                    added.setdefault(word, set()).add(cid)
+        if not added:
+            return self
+        vocabulary: Dict[str, Set[str]] = {}
+        for word in added:
+            if word not in self.postings:
+                for gram in trigrams(word):
+                    vocabulary.setdefault(gram, set()).add(word)
+        return TextIndex(
+            self.postings.with_added(added), self.by_trigram.with_added(vocabulary)
+        )
+
+    def match_word(
+        self, term: str, threshold: float = DEFAULT_THRESHOLD
+    ) -> List[Tuple[str, float]]:
+        """Vocabulary words matching `term` with scores, best first.
+
+        Exact matches score 1.0; prefix matches 0.6-1.0 by how much of the
+        word the prefix covers; otherwise the trigram similarity (Jaccard)
+        when it reaches `threshold`.
+        """
+        scores: Dict[str, float] = {}
+        if term in self.postings:
+            scores[term] = 1.0
+        empty: FrozenSet[str] = frozenset()
+        grams = sorted(
+            (self.by_trigram.get(g, empty) for g in _prefix_trigrams(term)), key=len
+        )
+        if grams and grams[0]:
+            candidates = set(grams[0]).intersection(*grams[1:])
+            for word in candidates:
+                if word.startswith(term) and word != term:
+                    scores[word] = 0.6 + 0.4 * len(term) / len(word)
+        if len(term) >= 3:
+            query = trigrams(term)
+            shared: Counter[str] = Counter()
+            for gram in query:
+                shared.update(self.by_trigram.get(gram, empty))
+            needed = threshold * len(query)
+            for word, count in shared.items():
+                if count < needed or word in scores:
+                    continue
+                similarity = count / (len(query) + len(trigrams(word)) - count)
+                if similarity >= threshold:
+                    scores[word] = similarity
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def search(
+        self,
+        query: str,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        restrict: Optional[AbstractSet[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Candidate id -> score in (0, 1] for ids matching every query word.
+
+        Walks the postings of the most selective query word and intersects
+        them with the other words' postings, so no large union is ever built.
+        Every match is scored; `limit` then keeps the best-scoring ones (ties
+        by id). `restrict` limits matches to those ids (e.g. structured
+        filters).
+        """
+        terms = list(dict.fromkeys(words(query)))
+        if not terms:
+            return {}
+        matches: List[List[Tuple[FrozenSet[str], float]]] = []
+        for term in terms:
+            found = self.match_word(term, threshold)
+            if not found:
+                return {}
+            matches.append([(self.postings[word], score) for word, score in found])
+
+        sizes = [sum(len(posting) for posting, _ in found) for found in matches]
+        driver = min(range(len(terms)), key=sizes.__getitem__)
+        others = [found for i, found in enumerate(matches) if i != driver]
+        scored: Dict[str, float] = {}
+        for posting, driver_score in matches[driver]:
+            pending = posting.difference(scored)
+            if restrict is not None:
+                pending &= restrict
+            totals = dict.fromkeys(pending, driver_score)
+            for found in others:
+                # Best-scoring words first, so each id takes its best score.
+                left = set(totals)
+                for other, score in found:
+                    hit = left & other
+                    for cid in hit:
+                        totals[cid] += score
+                    left -= hit
+                    if not left:
+                        break
+                for cid in left:
+                    del totals[cid]
+                if not totals:
+                    break
+            for cid, total in totals.items():
+                scored[cid] = total / len(terms)
+        if limit is not None and len(scored) > limit:
+            best = heapq.nsmallest(
+                limit, scored.items(), key=lambda item: (-item[1], item[0])
+            )
+            return dict(best)
+        return scored
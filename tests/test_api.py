@@ -88,3 +88,71 @@ def test_end_to_end_match_and_outreach():
     assert out.status_code == 200
     msgs = out.json()["messages"]
     assert any(m["channel"] == "email" for m in msgs)
+
+
+def test_list_candidates_cursor_paging_and_fields():
+    for i in range(3):
+        client.post("/candidates/", json={"full_name": f"Pager {i}", "skills": ["go"]})
+    everyone = client.get("/candidates/").json()
+
+    names, cursor = [], None
+    while True:
+        params = {"limit": 2, "fields": "id,full_name"}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get("/candidates/", params=params)
+        assert r.status_code == 200
+        assert all(set(row) == {"id", "full_name"} for row in r.json())
+        names += [row["full_name"] for row in r.json()]
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert names == [c["full_name"] for c in everyone]
+
+    assert client.get("/candidates/", params={"fields": "nope"}).status_code == 400
+    assert client.get("/candidates/", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/roles/", params={"limit": 0}).status_code == 422
+    assert client.get("/startups/", params={"limit": 1}).status_code == 200
+
+
+def test_ndjson_ingest_endpoint():
+    body = b'{"full_name": "Stream A", "email": "stream-a@example.com"}\n'
+    body += b'{"full_name": "Stream B", "email": "STREAM-A@example.com"}\n'
+    body += b"{oops\n"
+    r = client.post(
+        "/candidates/ingest",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200
+    report = r.json()
+    assert report["created"] == 1
+    assert report["duplicates"] == [2]
+    assert report["errors"][0]["line"] == 3
+
+
+def test_search_explain_reports_plan():
+    client.post("/candidates/", json={"full_name": "Plan Z", "skills": ["zig"]})
+    r = client.get("/candidates/search", params={"skills": "zig", "explain": "true"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["plan"]["actual_rows"] == len(body["results"]) >= 1
+    assert body["plan"]["predicates"][0]["field"] == "skill"
+    assert "estimated_rows" in body["plan"]
+
+
+def test_search_text_query_ranks_matches():
+    client.post(
+        "/candidates/",
+        json={"full_name": "Quinn Zabrowski", "current_title": "Staff Engineer"},
+    )
+    client.post(
+        "/candidates/",
+        json={"full_name": "Zabrowska Ivers", "current_title": "Designer"},
+    )
+    r = client.get("/candidates/search", params={"q": "zabrowski"})
+    assert r.status_code == 200
+    names = [c["full_name"] for c in r.json()]
+    assert names[:2] == ["Quinn Zabrowski", "Zabrowska Ivers"]
+    r = client.get("/candidates/search", params={"q": "zabrowsky staf"})
+    assert [c["full_name"] for c in r.json()] == ["Quinn Zabrowski"]
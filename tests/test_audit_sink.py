@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+
+from src.data.store import DataStore
+
+
+@pytest.fixture()
+def store() -> DataStore:
+    ds = DataStore(db_path=":memory:")
+    yield ds
+    ds.close()
+
+
+def _audit_rows(store: DataStore) -> int:
+    return store.conn.execute("SELECT COUNT(*) FROM audit_logs").fetchone()[0]
+
+
+def test_buffered_events_are_visible_to_reads(store: DataStore) -> None:
+    store.enable_audit_buffer(flush_interval=60)
+    event = store.record_audit_event(
+        event_type="outreach_sent", subject_id="c-1", detail={"channel": "email"}
+    )
+    consent = store.record_consent_event(contact="Person@Example.com", status="granted")
+
+    assert event["detail"] == {"channel": "email"}
+    assert _audit_rows(store) == 0
+
+    listed = store.list_audit_events(event_type="outreach_sent")
+    assert [e["id"] for e in listed] == [event["id"]]
+    assert store.get_consent_event(consent["id"])["contact"] == "person@example.com"
+
+
+def test_background_flush_batches_by_size(store: DataStore) -> None:
+    sink = store.enable_audit_buffer(batch_size=5, flush_interval=60)
+    before = store.commit_stats()["commits"]
+    for i in range(5):
+        store.record_audit_event(event_type="bulk", subject_id=str(i), detail=None)
+
+    for _ in range(200):
+        if sink.stats["written"] == 5:
+            break
+        threading.Event().wait(0.01)
+    assert sink.stats["written"] == 5
+    assert sink.stats["batches"] == 1
+    assert store.commit_stats()["commits"] == before + 1
+
+
+def test_full_queue_falls_back_to_synchronous_write(store: DataStore) -> None:
+    sink = store.enable_audit_buffer(max_queue=2, batch_size=100, flush_interval=60)
+    for i in range(3):
+        store.record_audit_event(event_type="overflow", subject_id=str(i), detail={})
+
+    assert sink.stats["sync_fallbacks"] == 1
+    assert _audit_rows(store) == 3
+    assert sink.pending() == 0
+
+
+def test_close_flushes_pending_events(tmp_path) -> None:
+    db_path = str(tmp_path / "audit.db")
+    store = DataStore(db_path=db_path)
+    store.enable_audit_buffer(flush_interval=60)
+    store.record_audit_event(event_type="shutdown", subject_id=None, detail={})
+    store.close()
+
+    reopened = DataStore(db_path=db_path)
+    assert len(reopened.list_audit_events(event_type="shutdown")) == 1
+    reopened.close()
+
+
+def test_suppressed_interaction_still_audited_when_buffered(store: DataStore) -> None:
+    store.enable_audit_buffer(flush_interval=60)
+    candidate = store.create_candidate({"full_name": "Buffered", "email": "b@x.io"})
+    store.suppress_contact("b@x.io", reason="opt_out")
+
+    with pytest.raises(PermissionError):
+        store.log_interaction(
+            {"candidate_id": candidate["id"], "channel": "email", "direction": "out"}
+        )
+    assert store.list_audit_events(event_type="interaction_blocked")
+
+
+def test_bad_row_is_counted_and_the_rest_of_the_batch_lands(
+    store: DataStore,
+) -> None:
+    sink = store.enable_audit_buffer(batch_size=3, flush_interval=60)
+    store.record_audit_event(event_type="before", subject_id=None, detail={})
+    store.record_consent_event(contact="x@y.io", status="granted", candidate_id="nope")
+    store.record_audit_event(event_type="after", subject_id=None, detail={})
+
+    for _ in range(200):
+        if sink.stats["batches"] == 1:
+            break
+        threading.Event().wait(0.01)
+    assert sink.stats["failed"] == 1
+    assert sink.stats["written"] == 2
+    assert _audit_rows(store) == 2
+
+    # The background thread survived and keeps flushing.
+    assert sink._thread.is_alive()
+    store.record_audit_event(event_type="later", subject_id=None, detail={})
+    assert store.flush_audit_buffer() == 1
+    assert _audit_rows(store) == 3
+
+
+def test_rolled_back_transaction_keeps_earlier_events_and_drops_its_own(
+    store: DataStore,
+) -> None:
+    sink = store.enable_audit_buffer(flush_interval=60)
+    store.record_audit_event(event_type="before", subject_id=None, detail={})
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            # The read flushes the queued event into this transaction.
+            assert [e["event_type"] for e in store.list_audit_events()] == ["before"]
+            store.record_audit_event(event_type="inside", subject_id=None, detail={})
+            raise RuntimeError("boom")
+
+    assert _audit_rows(store) == 0
+    assert sink.pending() == 1
+    assert [e["event_type"] for e in store.list_audit_events()] == ["before"]
+    assert sink.stats["written"] == 1
+
+
+def test_events_inside_a_transaction_commit_with_it(store: DataStore) -> None:
+    sink = store.enable_audit_buffer(flush_interval=60)
+    with store.transaction():
+        store.record_consent_event(contact="a@x.io", status="granted")
+        assert sink.pending() == 0
+    assert store.conn.execute("SELECT COUNT(*) FROM consent_events").fetchone()[0] == 1
@@ -0,0 +1,44 @@
+from src.models.candidate import Candidate
+from src.models.common import Stage
+from src.services.compact import CandidateRecord, intern_stages
+
+
+def test_stage_tuples_keep_order_and_duplicates_and_are_shared() -> None:
+    stages = [Stage.growth, Stage.pre_seed, Stage.growth, Stage.public] * 8
+    assert list(intern_stages(stages)) == stages
+    assert intern_stages([]) == ()
+    assert intern_stages(["seed", "series-a"]) is intern_stages(
+        [Stage.seed, Stage.series_a]
+    )
+
+
+def test_record_round_trips_to_the_same_model() -> None:
+    cand = Candidate(
+        id="c1",
+        full_name="Ada Lovelace",
+        current_title="CTO",
+        titles=["VP Engineering", "CTO"],
+        years_experience=12,
+        skills=["python", "ml"],
+        domains=["fintech"],
+        locations=["London"],
+        remote_preference=False,
+        stage_preferences=["series-a", "seed"],
+        linkedin_url="https://www.linkedin.com/in/ada",
+        email="ada@example.com",
+    )
+    record = CandidateRecord.from_model(cand)
+    view = record.to_model()
+    assert view == cand
+    assert view.model_dump_json() == cand.model_dump_json()
+    assert set(CandidateRecord.__slots__) == set(Candidate.model_fields)
+
+
+def test_records_share_interned_strings() -> None:
+    first = CandidateRecord.from_model(
+        Candidate(id="a", full_name="A", skills=["".join(["py", "thon"])])
+    )
+    second = CandidateRecord.from_model(
+        Candidate(id="b", full_name="B", skills=["".join(["pyt", "hon"])])
+    )
+    assert first.skills[0] is second.skills[0]
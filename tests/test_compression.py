@@ -0,0 +1,184 @@
+import pytest
+
+from src.data import compression
+from src.data.compression import MARKER, compress_text, decompress_text
+from src.data.store import DataStore
+from src.jobs.recompress import recompress_column
+
+BODY = "Hi Ada,\nThanks for your time on the call today.\nBest regards, Sam\n" * 8
+
+
+def _candidate(store):
+    return store.create_candidate({"full_name": "Ada", "email": "ada@x.io"})
+
+
+def _raw(store, sql, *params):
+    return store.conn.execute(sql, params).fetchone()[0]
+
+
+def test_codec_round_trip_and_passthrough() -> None:
+    packed = compress_text(BODY)
+    assert isinstance(packed, bytes) and packed.startswith(MARKER)
+    assert decompress_text(packed) == BODY
+    assert compress_text("short") == "short"
+    assert decompress_text("plain text") == "plain text"
+    assert decompress_text(None) is None
+
+
+def test_enabled_store_compresses_and_reads_old_rows() -> None:
+    store = DataStore()
+    candidate = _candidate(store)
+    old = store.log_interaction(
+        {
+            "candidate_id": candidate["id"],
+            "channel": "email",
+            "direction": "in",
+            "body": BODY,
+        }
+    )
+    store.enable_compression()
+    new = store.log_interaction(
+        {
+            "candidate_id": candidate["id"],
+            "channel": "email",
+            "direction": "out",
+            "body": BODY,
+        }
+    )
+    source = store.add_profile_source(
+        {"candidate_id": candidate["id"], "source": "csv", "notes": BODY}
+    )
+    audit = store.record_audit_event(
+        event_type="note", subject_id=None, detail={"text": BODY}
+    )
+
+    assert (
+        _raw(store, "SELECT typeof(body) FROM interactions WHERE id = ?", old["id"])
+        == "text"
+    )
+    assert (
+        _raw(store, "SELECT typeof(body) FROM interactions WHERE id = ?", new["id"])
+        == "blob"
+    )
+    assert new["body"] == BODY
+    assert store.get_interaction(old["id"])["body"] == BODY
+    assert store.get_interaction(new["id"])["body"] == BODY
+    assert store.get_profile_source(source["id"])["notes"] == BODY
+    assert store.get_audit_event(audit["id"])["detail"] == {"text": BODY}
+    assert audit["detail"] == {"text": BODY}
+
+
+def test_listings_decompress_only_selected_columns(monkeypatch) -> None:
+    store = DataStore()
+    store.enable_compression()
+    candidate = _candidate(store)
+    for direction in ("in", "out"):
+        store.log_interaction(
+            {
+                "candidate_id": candidate["id"],
+                "channel": "email",
+                "direction": direction,
+                "body": BODY,
+            }
+        )
+    calls = []
+    decompress = compression.zlib.decompress
+    monkeypatch.setattr(
+        compression.zlib,
+        "decompress",
+        lambda *args, **kwargs: calls.append(1) or decompress(*args, **kwargs),
+    )
+
+    listed = store.list_interactions(candidate["id"], columns=["id", "direction"])
+
+    assert sorted(row["direction"] for row in listed) == ["in", "out"]
+    assert calls == []
+    assert [row["body"] for row in store.list_interactions(candidate["id"])] == [
+        BODY,
+        BODY,
+    ]
+    assert len(calls) == 2
+
+
+def test_unknown_column_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        DataStore().enable_compression(["candidates.full_name"])
+
+
+def test_recompress_job_trains_dictionary_and_rewrites_rows(
+    tmp_path, monkeypatch
+) -> None:
+    path = str(tmp_path / "app.db")
+    store = DataStore(path)
+    candidate = _candidate(store)
+    ids = [
+        store.log_interaction(
+            {
+                "candidate_id": candidate["id"],
+                "channel": "email",
+                "direction": "out",
+                "body": f"Message {i}\n{BODY}",
+            }
+        )["id"]
+        for i in range(5)
+    ]
+    before = store.conn.execute(
+        "SELECT sum(length(body)) FROM interactions"
+    ).fetchone()[0]
+
+    result = recompress_column(
+        store,
+        "interactions",
+        "body",
+        batch_size=2,
+        pause_seconds=0,
+        train_dictionary=True,
+    )
+    assert result == {"scanned": 5, "compressed": 5}
+    after = store.conn.execute("SELECT sum(length(body)) FROM interactions").fetchone()[
+        0
+    ]
+    assert after * 3 < before
+    assert (
+        recompress_column(store, "interactions", "body", pause_seconds=0)["scanned"]
+        == 0
+    )
+    store.close()
+
+    # A fresh process must find the dictionary in the database.
+    monkeypatch.setattr(compression, "_dictionaries", {})
+    reopened = DataStore(path)
+    assert reopened.get_interaction(ids[3])["body"] == f"Message 3\n{BODY}"
+    reopened.close()
+
+
+def test_reader_loads_a_dictionary_trained_by_another_store(
+    tmp_path, monkeypatch
+) -> None:
+    path = str(tmp_path / "app.db")
+    reader = DataStore(path)
+    candidate = _candidate(reader)
+    ids = [
+        reader.log_interaction(
+            {
+                "candidate_id": candidate["id"],
+                "channel": "email",
+                "direction": "out",
+                "body": f"Message {i}\n{BODY}",
+            }
+        )["id"]
+        for i in range(5)
+    ]
+
+    trainer = DataStore(path)
+    recompress_column(
+        trainer, "interactions", "body", pause_seconds=0, train_dictionary=True
+    )
+    trainer.close()
+    raw = _raw(reader, "SELECT body FROM interactions WHERE id = ?", ids[2])
+    assert raw.startswith(compression.DICT_MARKER)
+    # As if the trainer ran in another process: this one never registered it.
+    monkeypatch.setattr(compression, "_dictionaries", {})
+
+    assert reader.get_interaction(ids[2])["body"] == f"Message 2\n{BODY}"
+    reader.close()
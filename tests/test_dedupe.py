@@ -0,0 +1,72 @@
+from src.features.sourcing.dedupe import (
+    DedupeConfig,
+    FuzzyDeduper,
+    Profile,
+    dedupe_imported,
+    find_duplicates,
+    merge_records,
+    normalize_company,
+    normalize_name,
+)
+from src.features.sourcing.importer import ImportedCandidate, iter_candidates_from_csv
+
+
+def test_normalization() -> None:
+    assert normalize_name("Jon Q. Smith") == "jonathan smith"
+    assert normalize_name("José  Núñez") == "jose nunez"
+    assert normalize_company("ACME, Inc.") == "acme"
+
+
+def test_near_duplicates_cluster_and_namesakes_do_not() -> None:
+    profiles = [
+        Profile("Jon Smith", "Acme Inc.", ("python", "go")),
+        Profile("Jonathan Smith", "ACME"),
+        Profile("Jon Smith", "Globex", ("sql",)),
+        Profile("José Núñez", "Initech"),
+        Profile("Jose Nunez", "Initech LLC"),
+        Profile("Ann Lee", email="ann@example.com"),
+        Profile("Annie Lee-Wong", email="ANN@example.com"),
+    ]
+    assert find_duplicates(profiles) == [[0, 1], [3, 4], [5, 6]]
+    # Same normalized name at another company only merges when loosened.
+    loose = DedupeConfig(threshold=0.55)
+    assert find_duplicates(profiles, loose)[0] == [0, 1, 2]
+
+
+def test_comparisons_stay_bounded_per_record() -> None:
+    deduper = FuzzyDeduper(DedupeConfig(max_candidates=3))
+    for i in range(300):
+        deduper.add(Profile(f"Person {i}", "Same Co", ("python",)))
+    assert 0 < deduper.comparisons <= 300 * 3
+
+
+def test_merge_policies() -> None:
+    records = [
+        {"full_name": "Jon Smith", "email": None, "skills": ["python"]},
+        {"full_name": "Jonathan Smith", "email": "j@x.io", "skills": ["go", "python"]},
+    ]
+    assert merge_records(records) == (
+        0,
+        {"full_name": "Jon Smith", "email": "j@x.io", "skills": ["python", "go"]},
+    )
+    survivor, merged = merge_records(records, "most_complete")
+    assert survivor == 1 and merged["full_name"] == "Jonathan Smith"
+
+
+def test_importer_batch_and_streaming(tmp_path) -> None:
+    candidates = [
+        ImportedCandidate("Jon Smith", company="Acme Inc.", skills=["python"]),
+        ImportedCandidate("Grace Hopper", company="Navy"),
+        ImportedCandidate("Jonathan Smith", company="ACME", email="j@acme.com"),
+    ]
+    merged = dedupe_imported(candidates)
+    assert [c.full_name for c in merged] == ["Jon Smith", "Grace Hopper"]
+    assert merged[0].email == "j@acme.com" and merged[0].skills == ["python"]
+
+    path = tmp_path / "export.csv"
+    path.write_text(
+        "full_name,company\nJon Smith,Acme Inc.\nJonathan Smith,ACME\n",
+        encoding="utf-8",
+    )
+    streamed = iter_candidates_from_csv(path, fuzzy=FuzzyDeduper())
+    assert [c.full_name for c in streamed] == ["Jon Smith"]
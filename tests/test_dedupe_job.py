@@ -0,0 +1,57 @@
+import pytest
+
+from src.data.store import DataStore
+from src.features.sourcing.importer import (
+    ImportedCandidate,
+    persist_imported_candidates,
+)
+from src.jobs.dedupe import dedupe_candidates
+
+
+@pytest.fixture()
+def store() -> DataStore:
+    ds = DataStore(db_path=":memory:")
+    persist_imported_candidates(
+        ds,
+        [
+            ImportedCandidate("Jon Smith", company="Acme Inc.", skills=["python"]),
+            ImportedCandidate(
+                "Jonathan Smith", company="ACME", email="jon@acme.com", skills=["go"]
+            ),
+            ImportedCandidate("Jon Smith", company="Globex"),
+        ],
+    )
+    yield ds
+    ds.close()
+
+
+def test_dry_run_reports_clusters_only(store: DataStore) -> None:
+    report = dedupe_candidates(store)
+    assert report["candidates"] == 3 and report["merged"] == 0
+    assert len(report["clusters"]) == 1 and len(report["clusters"][0]) == 2
+    assert len(store.list_candidates()) == 3
+
+
+def test_free_text_notes_are_not_read_as_company(store: DataStore) -> None:
+    globex = store.page_candidates(limit=3)[0][2]
+    store.add_profile_source(
+        {"candidate_id": globex["id"], "source": "manual", "notes": "ACME"}
+    )
+    clusters = dedupe_candidates(store)["clusters"]
+    assert len(clusters) == 1 and globex["id"] not in clusters[0]
+
+
+def test_apply_merges_into_survivor(store: DataStore) -> None:
+    first, second = dedupe_candidates(store)["clusters"][0]
+    store.log_interaction(
+        {"candidate_id": second, "channel": "email", "direction": "outbound"}
+    )
+    report = dedupe_candidates(store, apply=True)
+    assert report["merged"] == 1
+
+    survivor = store.get_candidate(first)
+    assert store.get_candidate(second) is None
+    assert survivor["email"] == "jon@acme.com"
+    assert survivor["skills"] == ["python", "go"]
+    assert [i["candidate_id"] for i in store.list_interactions()] == [first]
+    assert dedupe_candidates(store)["clusters"] == []
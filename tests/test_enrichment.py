@@ -0,0 +1,153 @@
+import threading
+import time
+
+import pytest
+
+from src.features.sourcing.enrichment import (
+    EnricherSpec,
+    EnrichmentStage,
+    latency_stub,
+)
+from src.features.sourcing.importer import (
+    ImportedCandidate,
+    import_candidates_from_csv,
+)
+
+
+def _people(n, prefix="p"):
+    return [
+        ImportedCandidate(full_name=f"Person {i}", email=f"{prefix}{i}@example.com")
+        for i in range(n)
+    ]
+
+
+def test_stage_preserves_order_and_scales_with_workers() -> None:
+    people = _people(40)
+    started = time.perf_counter()
+    with EnrichmentStage([latency_stub(0.02)], max_workers=1) as stage:
+        serial = list(stage.run(people))
+    serial_time = time.perf_counter() - started
+
+    spec = EnricherSpec(latency_stub(0.02), max_concurrency=10)
+    started = time.perf_counter()
+    with EnrichmentStage([spec], max_workers=10) as stage:
+        parallel = list(stage.run(people))
+    assert time.perf_counter() - started < serial_time / 3
+    assert [c.full_name for c in parallel] == [c.full_name for c in people]
+    assert [c.raw for c in parallel] == [c.raw for c in serial]
+    assert all(c.raw == {"looked_up": "yes"} for c in parallel)
+
+
+def test_per_enricher_concurrency_limit() -> None:
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def tracked(candidate):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return candidate
+
+    spec = EnricherSpec(tracked, max_concurrency=2)
+    with EnrichmentStage([spec], max_workers=8) as stage:
+        assert len(list(stage.run(_people(20)))) == 20
+    assert peak == 2
+
+
+def test_timeout_passes_candidate_through_unchanged() -> None:
+    def slow(candidate):
+        time.sleep(0.2)
+        candidate.skills.append("late")
+        return candidate
+
+    spec = EnricherSpec(slow, timeout=0.01, name="slow")
+    with EnrichmentStage([spec]) as stage:
+        (result,) = stage.run(_people(1))
+        assert stage.stats["slow"].timeouts == 1
+    time.sleep(0.25)
+    assert result.skills == []
+
+
+def test_cache_is_keyed_by_fingerprint_and_reused_across_runs() -> None:
+    def tag(candidate):
+        candidate.skills = ["enriched"]
+        return candidate
+
+    with EnrichmentStage([EnricherSpec(tag, name="tag")], max_workers=1) as stage:
+        list(stage.run(_people(3)))
+        again = list(stage.run(_people(3)))
+        assert stage.stats["tag"].calls == 3
+        assert stage.stats["tag"].cache_hits == 3
+    assert all(c.skills == ["enriched"] for c in again)
+
+
+def test_enricher_errors_surface_in_order() -> None:
+    def boom(candidate):
+        if candidate.email == "p2@example.com":
+            raise RuntimeError("lookup failed")
+        return candidate
+
+    with EnrichmentStage([boom]) as stage:
+        stream = stage.run(_people(5))
+        assert [c.email for c in (next(stream), next(stream))] == [
+            "p0@example.com",
+            "p1@example.com",
+        ]
+        with pytest.raises(RuntimeError, match="lookup failed"):
+            next(stream)
+
+
+def test_importer_runs_stage_before_dedupe(tmp_path) -> None:
+    path = tmp_path / "export.csv"
+    path.write_text(
+        "full_name,email\nAda,ada@example.com\nBob,b@example.com\nAda,ada@example.com\n",
+        encoding="utf-8",
+    )
+    with EnrichmentStage([latency_stub(0.01)]) as stage:
+        imported = import_candidates_from_csv(path, stage=stage)
+    assert [c.full_name for c in imported] == ["Ada", "Bob"]
+    assert imported[0].raw["looked_up"] == "yes"
+
+
+def test_cache_applies_only_the_enricher_delta_to_later_rows() -> None:
+    def tag(candidate):
+        candidate.skills.append("enriched")
+        candidate.raw["source"] = "lookup"
+        return candidate
+
+    first = ImportedCandidate("Ada", current_title="Engineer", email="ada@x.io")
+    later = ImportedCandidate(
+        "Ada Lovelace", current_title="CTO", email="ada@x.io", skills=["rust"]
+    )
+    with EnrichmentStage([EnricherSpec(tag, name="tag")], max_workers=1) as stage:
+        list(stage.run([first]))
+        (result,) = stage.run([later])
+        assert stage.stats["tag"].cache_hits == 1
+    assert (result.full_name, result.current_title) == ("Ada Lovelace", "CTO")
+    assert result.skills == ["rust", "enriched"]
+    assert result.raw == {"source": "lookup"}
+
+
+def test_timeout_counts_call_time_not_queueing() -> None:
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def slowish(candidate):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.06)
+        with lock:
+            active -= 1
+        return candidate
+
+    spec = EnricherSpec(slowish, max_concurrency=2, timeout=0.1, name="slowish")
+    with EnrichmentStage([spec], max_workers=8) as stage:
+        assert len(list(stage.run(_people(40)))) == 40
+        assert stage.stats["slowish"].timeouts == 0
+    assert peak == 2
@@ -0,0 +1,76 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app import app
+from src.data.export import export_table, iter_row_chunks
+from src.data.store import DataStore
+from src.routers import export as export_router
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = DataStore(str(tmp_path / "export.db"))
+    for index in range(7):
+        candidate = store.create_candidate(
+            {"full_name": f"C{index}", "skills": ["python"]}
+        )
+        store.log_interaction(
+            {
+                "candidate_id": candidate["id"],
+                "channel": "email",
+                "direction": "outbound",
+                "occurred_at": f"2024-0{index + 1}-01T00:00:00+00:00",
+            }
+        )
+    yield store
+    store.close()
+
+
+def test_rows_are_streamed_in_chunks(store) -> None:
+    chunks = list(iter_row_chunks(store, "candidates", chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert chunks[0][0]["skills"] == ["python"]
+
+
+def test_ndjson_export_is_gzipped_and_filtered_by_since(store) -> None:
+    payload = b"".join(
+        export_table(store, "interactions", since="2024-05-01", chunk_size=2)
+    )
+    lines = gzip.decompress(payload).decode().splitlines()
+    months = sorted(json.loads(line)["occurred_at"][:7] for line in lines)
+    assert months == ["2024-05", "2024-06", "2024-07"]
+
+
+def test_csv_export_writes_one_header(store) -> None:
+    payload = b"".join(export_table(store, "candidates", fmt="csv", chunk_size=2))
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(payload).decode())))
+    assert len(rows) == 7
+    assert json.loads(rows[0]["skills"]) == ["python"]
+
+
+def test_in_memory_store_export_and_unknown_table() -> None:
+    memory = DataStore()
+    memory.create_candidate({"full_name": "Solo"})
+    payload = b"".join(export_table(memory, "candidates", compress=False))
+    assert json.loads(payload)["full_name"] == "Solo"
+    with pytest.raises(ValueError):
+        list(export_table(memory, "suppression_list"))
+    memory.close()
+
+
+def test_export_endpoint_streams_gzip(store, monkeypatch) -> None:
+    client = TestClient(app)
+    assert client.get("/export/candidates").status_code == 501
+
+    monkeypatch.setattr(export_router, "repo", type("R", (), {"store": store})())
+    assert client.get("/export/nope").status_code == 404
+    resp = client.get("/export/interactions", params={"since": "2024-07-01"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/gzip"
+    lines = gzip.decompress(resp.content).decode().splitlines()
+    assert len(lines) == 1
@@ -0,0 +1,60 @@
+from src.features.sourcing.importer import (
+    SeenFingerprints,
+    basic_enricher,
+    import_candidates_from_csv,
+    iter_candidates_from_csv,
+)
+
+HEADER = "full_name,email,company,title,skills,summary,internal_id\n"
+
+
+def _write(tmp_path, rows):
+    path = tmp_path / "export.csv"
+    path.write_text(HEADER + "".join(rows), encoding="utf-8")
+    return path
+
+
+def test_iter_yields_deduped_candidates_incrementally(tmp_path) -> None:
+    path = _write(
+        tmp_path,
+        [
+            "Ada,ada@example.com,Acme,CTO,python;go,,1\n",
+            "Ada L,ADA@example.com,Acme,CTO,python,,2\n",
+            "Bob,,Beta,VP,rust,,3\n",
+            "bob ,,beta,VP,rust,,4\n",
+        ],
+    )
+    stream = iter_candidates_from_csv(path)
+    first = next(stream)
+    assert (first.full_name, first.skills) == ("Ada", ["python", "go"])
+    assert [c.full_name for c in stream] == ["Bob"]
+    everyone = iter_candidates_from_csv(path, dedupe=False)
+    assert len(list(everyone)) == 4
+    assert [c.to_dict() for c in import_candidates_from_csv(path)] == [
+        c.to_dict() for c in iter_candidates_from_csv(path)
+    ]
+
+
+def test_raw_columns_are_trimmed_after_enrichers(tmp_path) -> None:
+    path = _write(tmp_path, ["Ada,ada@example.com,Acme,CTO,,Built compilers,7\n"])
+    (kept,) = iter_candidates_from_csv(
+        path, enrichers=[basic_enricher], raw_columns=["Internal_ID", "evidence"]
+    )
+    assert kept.raw == {"internal_id": "7", "evidence": ["Built compilers"]}
+    (bare,) = iter_candidates_from_csv(path, raw_columns=[])
+    assert bare.raw == {}
+
+
+def test_seen_fingerprints_spill_to_disk_and_span_files(tmp_path) -> None:
+    seen = SeenFingerprints(max_in_memory=2)
+    assert all(seen.add(f"user{i}@example.com") for i in range(5))
+    assert seen.spilled == 4 and len(seen) == 5
+    assert not seen.add("user0@example.com")
+    assert not seen.add("user4@example.com")
+
+    path = _write(
+        tmp_path, ["Zed,user1@example.com,,,,,\n", "New,n@example.com,,,,,\n"]
+    )
+    assert [c.full_name for c in iter_candidates_from_csv(path, seen=seen)] == ["New"]
+    assert not seen.add("n@example.com")  # caller-owned set stays open
+    seen.close()
@@ -0,0 +1,67 @@
+import json
+
+from src.models.candidate import CandidateCreate
+from src.services.ingest import CandidateIngest
+from src.services.repositories import InMemoryRepo, SqliteRepo
+
+
+def _ndjson(rows):
+    return b"".join(json.dumps(row).encode("utf-8") + b"\n" for row in rows)
+
+
+def _run(repo, body, chunk=7, batch_size=2):
+    ingest = CandidateIngest(repo, batch_size=batch_size)
+    for offset in range(0, len(body), chunk):
+        ingest.feed(body[offset : offset + chunk])
+    return ingest.finish()
+
+
+def test_ingest_validates_dedupes_and_reports_lines() -> None:
+    for repo in (InMemoryRepo(), SqliteRepo.from_path(":memory:")):
+        repo.create_candidate(CandidateCreate(full_name="Old", email="old@x.io"))
+        body = _ndjson(
+            [
+                {"full_name": "Ada", "email": "ada@x.io", "skills": ["python"]},
+                {"full_name": "Dup", "email": " ADA@x.io "},
+                {"email": "missing-name@x.io"},
+                {"full_name": "Existing", "email": "Old@X.io"},
+                {"full_name": "No Email"},
+                {"full_name": "Also No Email"},
+            ]
+        )
+        body += b"\nnot json\n" + b'{"full_name": "Tail", "email": "tail@x.io"}'
+
+        report = _run(repo, body)
+
+        assert report["lines"] == 9
+        assert report["created"] == 4
+        assert report["duplicates"] == [2, 4]
+        assert [e["line"] for e in report["errors"]] == [3, 8]
+        assert "full_name" in report["errors"][0]["error"]
+        names = sorted(c.full_name for c in repo.list_candidates())
+        assert names == ["Ada", "Also No Email", "No Email", "Old", "Tail"]
+        assert repo.search_candidates(skills=["python"])[0].email == "ada@x.io"
+
+
+def test_duplicate_report_is_capped_but_counted() -> None:
+    repo = InMemoryRepo()
+    ingest = CandidateIngest(repo, batch_size=3, max_duplicates=2)
+    ingest.feed(_ndjson([{"full_name": f"P{i}", "email": "p@x.io"} for i in range(6)]))
+
+    report = ingest.finish()
+
+    assert report["created"] == 1
+    assert report["duplicates"] == [2, 3]
+    assert report["duplicate_count"] == 5
+
+
+def test_unique_bulk_create_returns_none_for_skipped() -> None:
+    repo = InMemoryRepo()
+    created = repo.bulk_create_unique_candidates(
+        [
+            CandidateCreate(full_name="A", email="a@x.io"),
+            CandidateCreate(full_name="B", email="A@x.io"),
+        ]
+    )
+    assert created[0].full_name == "A" and created[1] is None
+    assert repo.read_view().existing_emails(["a@X.io", "b@x.io"]) == {"a@x.io"}
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from src.services import layered
+from src.services.layered import LayeredIndex, LayeredMap
+
+
+@pytest.fixture(autouse=True)
+def small_tiers(monkeypatch):
+    # Fold after a handful of writes so the tests cover both tiers.
+    monkeypatch.setattr(layered, "MIN_TIER", 4)
+    monkeypatch.setattr(layered, "INDEX_TIER_FACTOR", 1)
+
+
+def test_layered_map_matches_a_dict_and_keeps_old_versions() -> None:
+    rng = random.Random(5)
+    current, expected = LayeredMap(), {}
+    versions = []
+    for step in range(200):
+        items = [(f"k{rng.randrange(60)}", step) for _ in range(rng.randint(1, 3))]
+        versions.append((current, dict(expected)))
+        current = current.updated(items)
+        expected.update(items)
+        assert dict(current) == expected
+        assert list(current) == list(expected)
+        assert len(current) == len(expected)
+    for version, snapshot in versions:
+        assert dict(version) == snapshot
+    assert current.get("missing", 0) == 0 and "missing" not in current
+
+
+def test_layered_index_unions_added_ids_across_folds() -> None:
+    rng = random.Random(9)
+    current, expected = LayeredIndex(), {}
+    versions = []
+    for step in range(300):
+        added = {}
+        for _ in range(rng.randint(1, 3)):
+            added.setdefault(f"w{rng.randrange(12)}", set()).add(f"id{step}")
+        versions.append((current, {k: set(v) for k, v in expected.items()}))
+        current = current.with_added(added)
+        for key, ids in added.items():
+            expected.setdefault(key, set()).update(ids)
+        # Reading twice exercises the memoized merge.
+        assert {key: current[key] for key in current} == expected
+        assert {key: current.get(key) for key in current} == expected
+        assert len(current) == len(expected)
+    for version, snapshot in versions:
+        assert {key: version[key] for key in version} == snapshot
+    assert current.get("missing") is None
+    with pytest.raises(KeyError):
+        current["missing"]
@@ -0,0 +1,46 @@
+import pytest
+
+from src.features.intake.schema import ScorecardCompetency
+from src.features.sourcing.matcher import Automaton, ScorecardMatcher, tokenize
+
+SCORECARD = [
+    ScorecardCompetency(
+        name="Backend", weight=3, signals=["Go", "distributed systems", "Kafka"]
+    ),
+    ScorecardCompetency(name="Ops", weight=1, signals=["on-call", "kafka"]),
+    ScorecardCompetency(name="Empty", weight=0, signals=[]),
+]
+TEXT = "Built Distributed Systems at Google; owned Kafka on-call rotation."
+
+
+def test_automaton_finds_overlapping_patterns() -> None:
+    patterns = ["he", "she", "his", "hers"]
+    found = Automaton(patterns).find("ushers")
+    assert {patterns[i] for i in found} == {"he", "she", "hers"}
+    assert Automaton(["a", ""]).find("bbb") == set()
+
+
+@pytest.mark.parametrize("strategy", ["substring", "automaton"])
+def test_substring_strategies_agree(strategy) -> None:
+    matcher = ScorecardMatcher(SCORECARD, strategy=strategy)
+    assert matcher.match(TEXT) == {
+        "Backend": ["Go", "distributed systems", "Kafka"],  # "go" in "google"
+        "Ops": ["on-call", "kafka"],
+        "Empty": [],
+    }
+
+
+def test_word_boundaries_and_weighted_score() -> None:
+    matcher = ScorecardMatcher(SCORECARD, word_boundaries=True)
+    assert tokenize("on-call, c++") == ["on", "-", "call", ",", "c", "+", "+"]
+    score, evidence = matcher.score(TEXT)
+    assert evidence["Backend"] == ["distributed systems", "Kafka"]
+    assert score == pytest.approx(0.75 * 2 / 3 + 0.25)
+    # Compiled once, reused across texts.
+    assert matcher.match("go, golang")["Backend"] == ["Go"]
+    assert len(matcher.patterns) == 4  # "Kafka" and "kafka" share one pattern
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        ScorecardMatcher(SCORECARD, strategy="regex")
@@ -0,0 +1,219 @@
+import random
+import threading
+
+import pytest
+
+from src.models.candidate import CandidateCreate
+from src.models.role import RoleCreate
+from src.models.startup import StartupCreate
+from src.services.memory_snapshot import TABLES
+from src.services.pagination import encode_cursor
+from src.services.repositories import InMemoryRepo
+
+SKILLS = ["Python", "Go", "AWS", "Rust", "SQL"]
+TITLES = ["CTO", "VP Engineering", "Staff Engineer"]
+DOMAINS = ["fintech", "health", "devtools"]
+LOCATIONS = ["NYC", "San Francisco", "Remote"]
+
+
+def _brute_force(repo, skills=(), titles=(), domains=(), location=None):
+    def low(values):
+        return {v.strip().lower() for v in values if v}
+
+    out = []
+    for c in repo.list_candidates():
+        if low(skills) and not low(skills) <= low(c.skills):
+            continue
+        if low(titles) and not low(titles) & low([*c.titles, c.current_title]):
+            continue
+        if low(domains) and not low(domains) & low(c.domains):
+            continue
+        if location and location.strip().lower() not in low(c.locations):
+            continue
+        out.append(c.id)
+    return out
+
+
+def _seeded_repo(count=200):
+    rng = random.Random(3)
+    repo = InMemoryRepo()
+    for i in range(count):
+        repo.create_candidate(
+            CandidateCreate(
+                full_name=f"C{i}",
+                current_title=rng.choice(TITLES),
+                titles=rng.sample(TITLES, rng.randint(0, 2)),
+                skills=rng.sample(SKILLS, rng.randint(0, 3)),
+                domains=rng.sample(DOMAINS, rng.randint(0, 2)),
+                locations=rng.sample(LOCATIONS, 1),
+            )
+        )
+    return repo
+
+
+def test_index_search_matches_full_scan() -> None:
+    repo = _seeded_repo()
+    queries = [
+        {"skills": ["python"]},
+        {"skills": ["Python", " aws "]},
+        {"titles": ["cto", "staff engineer"], "location": "nyc"},
+        {"domains": ["FinTech"], "skills": ["go"], "titles": ["VP Engineering"]},
+        {"skills": ["cobol"]},
+        {},
+    ]
+    for query in queries:
+        found = [c.id for c in repo.search_candidates(**query)]
+        assert found == _brute_force(repo, **query), query
+
+
+def test_list_candidates_by_ids_dedupes_and_skips_missing() -> None:
+    repo = _seeded_repo(5)
+    ids = [c.id for c in repo.list_candidates()]
+    picked = repo.list_candidates(ids=[ids[3], "missing", ids[1], ids[3]])
+    assert [c.id for c in picked] == [ids[3], ids[1]]
+
+
+def test_list_roles_uses_startup_index() -> None:
+    repo = InMemoryRepo()
+    acme = repo.create_startup(StartupCreate(name="Acme", stage="seed"))
+    beta = repo.create_startup(StartupCreate(name="Beta", stage="seed"))
+    first = repo.create_role(RoleCreate(startup_id=acme.id, title="CTO"))
+    repo.create_role(RoleCreate(startup_id=beta.id, title="VP"))
+    second = repo.create_role(RoleCreate(startup_id=acme.id, title="Head of Data"))
+
+    assert [r.id for r in repo.list_roles(acme.id)] == [first.id, second.id]
+    assert repo.list_roles("missing") == []
+    assert len(repo.list_roles()) == 3
+
+
+def test_role_pages_seek_past_the_cursor_role() -> None:
+    repo = InMemoryRepo()
+    acme = repo.create_startup(StartupCreate(name="Acme", stage="seed"))
+    beta = repo.create_startup(StartupCreate(name="Beta", stage="seed"))
+    acme_roles = [repo.create_role(RoleCreate(startup_id=acme.id, title="CTO"))]
+    repo.create_role(RoleCreate(startup_id=beta.id, title="VP"))
+    acme_roles.append(repo.create_role(RoleCreate(startup_id=acme.id, title="PM")))
+
+    first, cursor = repo.page_roles(acme.id, limit=1, fields=["id"])
+    # Roles created between pages land after the cursor, never before it.
+    acme_roles.append(repo.create_role(RoleCreate(startup_id=acme.id, title="QA")))
+    rest, end = repo.page_roles(acme.id, limit=5, cursor=cursor, fields=["id"])
+
+    assert [r["id"] for r in first + rest] == [r.id for r in acme_roles]
+    assert end is None
+    with pytest.raises(ValueError):
+        repo.page_candidates(cursor=encode_cursor("missing"))
+
+
+def test_read_view_is_unaffected_by_later_writes() -> None:
+    repo = _seeded_repo(10)
+    view = repo.read_view()
+    repo.bulk_create_candidates(
+        [CandidateCreate(full_name=f"N{i}", skills=["python"]) for i in range(5)]
+    )
+
+    assert len(view.list_candidates()) == 10
+    assert len(repo.list_candidates()) == 15
+    assert repo.read_view().version == view.version + 1
+    assert len(repo.search_candidates(skills=["python"])) == (
+        len(view.search_candidates(skills=["python"])) + 5
+    )
+
+
+def test_concurrent_bulk_writes_and_reads() -> None:
+    repo = InMemoryRepo()
+    errors = []
+    done = threading.Event()
+
+    def writer() -> None:
+        for batch in range(20):
+            repo.bulk_create_candidates(
+                [
+                    CandidateCreate(full_name=f"W{batch}-{i}", skills=["go"])
+                    for i in range(50)
+                ]
+            )
+        done.set()
+
+    def reader() -> None:
+        try:
+            while not done.is_set():
+                view = repo.read_view()
+                # Every batch publishes atomically: counts agree within a view.
+                everyone = view.list_candidates()
+                assert len(everyone) % 50 == 0
+                assert len(view.search_candidates(skills=["go"])) == len(everyone)
+                assert len(repo.candidates) % 50 == 0
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert errors == []
+    assert len(repo.list_candidates()) == 1000
+
+
+def test_concurrent_single_creates_are_visible_on_return() -> None:
+    repo = InMemoryRepo()
+    missing = []
+
+    def writer(n: int) -> None:
+        for i in range(50):
+            created = repo.create_candidate(CandidateCreate(full_name=f"T{n}-{i}"))
+            if repo.get_candidate(created.id) is None:
+                missing.append(created.id)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert missing == []
+    assert len(repo.list_candidates()) == 400
+    # Group commit may publish several queued creates as one version.
+    assert repo.read_view().version <= 400
+
+
+def test_snapshot_round_trip(tmp_path) -> None:
+    repo = _seeded_repo(50)
+    repo.create_candidate(
+        CandidateCreate(
+            full_name="Ada",
+            linkedin_url="https://www.linkedin.com/in/ada",
+            # More entries than a packed 64-bit stage code could hold.
+            stage_preferences=["seed", "series-a"] * 12,
+            remote_preference=False,
+            email="ada@example.com",
+        )
+    )
+    startup = repo.create_startup(
+        StartupCreate(name="Acme", stage="seed", website="https://acme.dev")
+    )
+    role = repo.create_role(
+        RoleCreate(startup_id=startup.id, title="CTO", seniority="cxo")
+    )
+    path = repo.save_snapshot(tmp_path / "repo.snap")
+
+    restored = InMemoryRepo()
+    restored.load_snapshot(path)
+    assert restored.list_candidates() == repo.list_candidates()
+    assert restored.get_startup(startup.id) == startup
+    assert restored.list_roles(startup.id) == [role]
+    assert restored.search_candidates(skills=["python"]) == repo.search_candidates(
+        skills=["python"]
+    )
+    ada = restored.list_candidates()[-1]
+    assert ada.model_dump() == repo.list_candidates()[-1].model_dump()
+    assert ada.model_dump_json()
+
+
+def test_snapshot_columns_cover_every_model_field() -> None:
+    for kind, columns in TABLES.values():
+        expected = getattr(kind, "model_fields", None) or kind.__slots__
+        assert {field for field, _, _ in columns} == set(expected)
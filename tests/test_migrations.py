@@ -0,0 +1,93 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.data import migrations
+from src.data.migrations import (
+    DEFAULT_MIGRATIONS_DIR,
+    apply_migrations,
+    clone_migrated_template,
+)
+from src.data.store import DataStore
+
+
+def _tables(conn: sqlite3.Connection) -> set:
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {row[0] for row in rows}
+
+
+def test_pending_migrations_apply_atomically(tmp_path) -> None:
+    (tmp_path / "001_a.sql").write_text("CREATE TABLE a (id INTEGER);")
+    (tmp_path / "002_b.sql").write_text("CREATE TABLE b (id INTEGER); SELECT nope();")
+    conn = sqlite3.connect(":memory:")
+
+    with pytest.raises(sqlite3.OperationalError):
+        apply_migrations(None, tmp_path, connection=conn)
+    assert "a" not in _tables(conn)
+
+    (tmp_path / "002_b.sql").write_text("CREATE TABLE b (id INTEGER);")
+    apply_migrations(None, tmp_path, connection=conn)
+    assert {"a", "b"} <= _tables(conn)
+    versions = conn.execute(
+        "SELECT version, checksum FROM schema_migrations"
+    ).fetchall()
+    assert [v for v, _ in versions] == ["001_a.sql", "002_b.sql"]
+    assert all(len(checksum) == 64 for _, checksum in versions)
+
+
+def test_edited_migration_is_rejected(tmp_path) -> None:
+    (tmp_path / "001_a.sql").write_text("CREATE TABLE a (id INTEGER);")
+    conn = sqlite3.connect(":memory:")
+    apply_migrations(None, tmp_path, connection=conn)
+
+    (tmp_path / "001_a.sql").write_text("CREATE TABLE a (id INTEGER, x TEXT);")
+    with pytest.raises(ValueError):
+        apply_migrations(None, tmp_path, connection=conn)
+
+
+def test_parsed_migrations_are_cached(tmp_path, monkeypatch) -> None:
+    (tmp_path / "001_a.sql").write_text("CREATE TABLE a (id INTEGER);")
+    first = migrations._load_migrations(tmp_path)
+
+    monkeypatch.setattr(
+        migrations.Path, "read_text", lambda *a, **k: pytest.fail("re-read")
+    )
+    assert migrations._load_migrations(tmp_path) is first
+
+
+def test_template_clone_matches_migrated_schema() -> None:
+    migrated = DataStore(use_template=False)
+    cloned = sqlite3.connect(":memory:")
+    clone_migrated_template(cloned)
+
+    assert _tables(cloned) == _tables(migrated.conn)
+    schema = "SELECT sql FROM sqlite_master WHERE type IN ('index', 'trigger')"
+    assert sorted(r[0] or "" for r in cloned.execute(schema)) == sorted(
+        r[0] or "" for r in migrated.conn.execute(schema)
+    )
+
+    first, second = DataStore(), DataStore()
+    first.create_candidate({"full_name": "Only In First"})
+    assert second.list_candidates() == []
+    assert first.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_change_timestamps_match_store_timestamps(tmp_path) -> None:
+    old_dir = tmp_path / "migrations"
+    old_dir.mkdir()
+    for path in sorted(Path(DEFAULT_MIGRATIONS_DIR).glob("00[1-7]_*.sql")):
+        shutil.copy(path, old_dir)
+    db_path = str(tmp_path / "app.db")
+    before = DataStore(db_path, migrations_dir=old_dir)
+    before.create_candidate({"full_name": "Before"})
+    before.close()
+
+    store = DataStore(db_path)
+    candidate = store.create_candidate({"full_name": "After"})
+    stamps = [change["changed_at"] for change in store.changes_since(0)]
+    assert len(stamps) == 2
+    assert all(stamp.endswith("+00:00") for stamp in stamps)
+    assert len(stamps[1]) == len(candidate["created_at"])
+    store.close()
@@ -0,0 +1,53 @@
+from src.services.query_planner import Predicate, execute_plan, plan_search
+
+IDS = [f"c{i}" for i in range(100)]
+
+
+def _posting(step, offset=0):
+    return frozenset(IDS[offset::step])
+
+
+def test_empty_predicate_short_circuits() -> None:
+    plan = plan_search(
+        [
+            Predicate("skill", ("python",), (_posting(2),)),
+            Predicate("skill", ("cobol",), (frozenset(),)),
+        ],
+        len(IDS),
+    )
+    assert plan.strategy == "empty"
+    assert plan.predicates[0].values == ("cobol",)
+    assert execute_plan(plan, IDS) == set()
+    assert plan.explain(0)["estimated_rows"] == 0
+
+
+def test_predicates_run_most_selective_first() -> None:
+    common = Predicate("skill", ("python",), (_posting(2),))
+    rare = Predicate("location", ("nyc",), (_posting(25),))
+    plan = plan_search([common, rare], len(IDS))
+    assert [p.field for p in plan.predicates] == ["location", "skill"]
+    assert plan.estimated_rows == 2  # 100 * 50/100 * 4/100
+
+
+def test_small_driver_probes_instead_of_materializing_unions() -> None:
+    rare = Predicate("skill", ("rust",), (frozenset(IDS[:3]),))
+    wide = Predicate(
+        "title", ("cto", "vp", "staff"), (_posting(2), _posting(2, 1), _posting(3))
+    )
+    plan = plan_search([wide, rare], len(IDS))
+    assert plan.strategy == "probe"
+    assert execute_plan(plan, IDS) == set(IDS[:3])
+
+
+def test_every_strategy_returns_the_same_ids() -> None:
+    predicates = [
+        Predicate("skill", ("a",), (_posting(2),)),
+        Predicate("title", ("x", "y"), (_posting(3), _posting(5))),
+        Predicate("domain", ("d",), (_posting(7, 1),)),
+    ]
+    plan = plan_search(predicates, len(IDS))
+    expected = {cid for cid in IDS if all(p.matches(cid) for p in predicates)}
+    for strategy in ("intersect", "probe", "full_scan"):
+        plan.strategy = strategy
+        assert execute_plan(plan, IDS) == expected
+    assert plan.explain(len(expected))["actual_rows"] == len(expected)
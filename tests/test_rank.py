@@ -1,5 +1,6 @@
 from src.features.intake.schema import ScorecardCompetency
 from src.features.sourcing.importer import ImportedCandidate
+from src.features.sourcing.matcher import ScorecardMatcher
 from src.features.sourcing.rank import rank_candidates
 
 
@@ -45,3 +46,18 @@ def test_rank_candidates_orders_and_collects_evidence():
     assert ranked[1].candidate.full_name == "Blake Chen"
     assert ranked[0].score > ranked[1].score > ranked[2].score
     assert ranked[0].evidence["Reliability"] == ["incident response"]
+
+
+def test_rank_candidates_reuses_matcher_with_word_boundaries():
+    scorecard = [ScorecardCompetency(name="Go", signals=["go"])]
+    matcher = ScorecardMatcher(scorecard, word_boundaries=True)
+    gopher = ImportedCandidate(full_name="Gia", skills=["go"])
+    googler = ImportedCandidate(
+        full_name="Gus", company="Google", raw={"evidence": ["ex-Google"]}
+    )
+
+    for batch in ([googler, gopher], [gopher]):
+        ranked = rank_candidates(batch, scorecard, matcher=matcher)
+        assert ranked[0].candidate.full_name == "Gia"
+        assert ranked[0].score == 1.0
+    assert rank_candidates([googler], scorecard)[0].score == 1.0  # substring
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.data.store import DataStore
+from src.jobs.retention import purge_expired, read_archive
+
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def store() -> DataStore:
+    ds = DataStore(db_path=":memory:")
+    candidate = ds.create_candidate({"full_name": "Old Thread", "id": "c-1"})
+    for month, count in (("2024-01", 3), ("2024-02", 2), ("2025-05", 2)):
+        for i in range(count):
+            ds.log_interaction(
+                {
+                    "id": f"{month}-{i}",
+                    "candidate_id": candidate["id"],
+                    "channel": "email",
+                    "direction": "outbound",
+                    "body": "hello " * 50,
+                    "metadata": {"thread": i},
+                    "occurred_at": f"{month}-0{i + 1}T00:00:00+00:00",
+                }
+            )
+    yield ds
+    ds.close()
+
+
+def test_purge_deletes_in_small_batches(store: DataStore) -> None:
+    before = store.commit_stats()["commits"]
+    result = purge_expired(
+        store, "interactions", horizon_days=180, batch_size=2, pause_seconds=0, now=NOW
+    )
+
+    assert result == {"removed": 5, "batches": 3}
+    assert store.commit_stats()["commits"] - before == 3
+    assert {i["id"] for i in store.list_interactions()} == {"2025-05-0", "2025-05-1"}
+
+
+def test_purge_archives_rows_per_month(store: DataStore, tmp_path) -> None:
+    purge_expired(
+        store,
+        "interactions",
+        horizon_days=180,
+        batch_size=10,
+        pause_seconds=0,
+        archive_dir=tmp_path,
+        now=NOW,
+    )
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["2024-01.archive.db", "2024-02.archive.db"]
+    archived = list(read_archive(tmp_path / "2024-01.archive.db", "interactions"))
+    assert [row["id"] for row in archived] == ["2024-01-0", "2024-01-1", "2024-01-2"]
+    assert archived[0]["body"].startswith("hello")
+    assert archived[0]["metadata"] == '{"thread": 0}'
+
+
+def test_purge_rejects_unknown_tables(store: DataStore) -> None:
+    with pytest.raises(ValueError):
+        purge_expired(store, "candidates", horizon_days=1)
@@ -0,0 +1,194 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app import app
+from src.models.candidate import CandidateCreate
+from src.models.role import RoleCreate
+from src.models.startup import StartupCreate
+from src.services import repositories
+from src.routers import candidates as candidates_router
+from src.services.repositories import DuplicateEmailError, InMemoryRepo, SqliteRepo
+
+
+def _seed(repo):
+    startup = repo.create_startup(
+        StartupCreate(name="Acme", stage="seed", website="https://acme.dev")
+    )
+    role = repo.create_role(
+        RoleCreate(startup_id=startup.id, title="CTO", required_skills=["python"])
+    )
+    alice = repo.create_candidate(
+        CandidateCreate(
+            full_name="Alice",
+            current_title="VP Engineering",
+            skills=["Python", "AWS"],
+            domains=["fintech"],
+            locations=["San Francisco"],
+            stage_preferences=["seed"],
+            linkedin_url="https://www.linkedin.com/in/alice",
+        )
+    )
+    bob = repo.create_candidate(
+        CandidateCreate(full_name="Bob", titles=["CTO"], skills=["go"])
+    )
+    return startup, role, alice, bob
+
+
+def test_sqlite_repo_matches_in_memory_surface() -> None:
+    memory = InMemoryRepo()
+    sqlite = SqliteRepo.from_path(":memory:")
+    m_startup, m_role, m_alice, m_bob = _seed(memory)
+    s_startup, s_role, s_alice, s_bob = _seed(sqlite)
+
+    assert s_alice.model_dump(exclude={"id"}) == m_alice.model_dump(exclude={"id"})
+    assert sqlite.get_startup(s_startup.id).website == m_startup.website
+    assert sqlite.get_role(s_role.id).model_dump(exclude={"id", "startup_id"}) == (
+        m_role.model_dump(exclude={"id", "startup_id"})
+    )
+    assert [r.id for r in sqlite.list_roles(s_startup.id)] == [s_role.id]
+    assert len(sqlite.list_startups()) == 1
+    assert {c.id for c in sqlite.list_candidates()} == {s_alice.id, s_bob.id}
+    assert [c.id for c in sqlite.list_candidates(ids=[s_bob.id, "missing"])] == [
+        s_bob.id
+    ]
+
+    queries = [
+        {"skills": ["python", "aws"]},
+        {"skills": ["python", "rust"]},
+        {"titles": ["cto"]},
+        {"titles": ["vp engineering"], "domains": ["FinTech"]},
+        {"location": "san francisco"},
+    ]
+    for query in queries:
+        expected = [c.full_name for c in memory.search_candidates(**query)]
+        got = [c.full_name for c in sqlite.search_candidates(**query)]
+        assert sorted(got) == sorted(expected), query
+
+
+def test_sqlite_repo_read_through_cache() -> None:
+    sqlite = SqliteRepo(SqliteRepo.from_path(":memory:").store, cache_size=1)
+    _, role, alice, bob = _seed(sqlite)
+
+    sqlite.get_candidate(alice.id)
+    sqlite.get_candidate(alice.id)
+    assert sqlite._candidate_cache.hits == 1
+    assert sqlite.get_candidate("missing") is None
+    assert sqlite.get_role(role.id) == role
+
+
+def test_cache_drops_rows_another_worker_changed(tmp_path) -> None:
+    db_path = str(tmp_path / "shared.db")
+    worker, other = SqliteRepo.from_path(db_path), SqliteRepo.from_path(db_path)
+    alice = worker.create_candidate(CandidateCreate(full_name="Alice"))
+    assert worker.get_candidate(alice.id).full_name == "Alice"
+
+    other.store.update_candidate(alice.id, {"full_name": "Alice Liddell"})
+
+    assert worker.get_candidate(alice.id).full_name == "Alice Liddell"
+    worker.get_candidate(alice.id)
+    assert worker._candidate_cache.hits == 2
+    worker.store.close()
+    other.store.close()
+
+
+def test_sqlite_repo_survives_restart(tmp_path, monkeypatch) -> None:
+    db_path = str(tmp_path / "nested" / "app.db")
+    monkeypatch.setenv("REPO_BACKEND", "sqlite")
+    monkeypatch.setenv("REPO_DB_PATH", db_path)
+
+    first = repositories._select_repo()
+    assert isinstance(first, SqliteRepo)
+    startup = first.create_startup(StartupCreate(name="Durable", stage="growth"))
+    first.store.close()
+
+    second = repositories._select_repo()
+    assert second.get_startup(startup.id).name == "Durable"
+    second.store.close()
+
+
+def test_fresh_worker_bootstraps_from_latest_snapshot(tmp_path) -> None:
+    primary = SqliteRepo.from_path(str(tmp_path / "primary.db"))
+    startup = primary.create_startup(StartupCreate(name="Seeded", stage="seed"))
+    primary.store.snapshot(tmp_path / "snapshots" / "0001.db")
+    primary.store.close()
+
+    worker = SqliteRepo.from_path(
+        str(tmp_path / "worker.db"), snapshot_dir=str(tmp_path / "snapshots")
+    )
+    assert worker.get_startup(startup.id).name == "Seeded"
+    worker.store.close()
+
+
+def test_paging_matches_in_memory_and_projects_fields() -> None:
+    memory = InMemoryRepo()
+    sqlite = SqliteRepo.from_path(":memory:")
+    for repo in (memory, sqlite):
+        _seed(repo)
+        for i in range(5):
+            repo.create_candidate(CandidateCreate(full_name=f"Extra {i}"))
+
+    for repo in (memory, sqlite):
+        names, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = repo.page_candidates(
+                limit=3, cursor=cursor, fields=["full_name", "stage_preferences"]
+            )
+            names += [row["full_name"] for row in rows]
+            pages += 1
+            if cursor is None:
+                break
+        assert pages == 3
+        assert names == ["Alice", "Bob"] + [f"Extra {i}" for i in range(5)]
+        assert set(rows[0]) == {"full_name", "stage_preferences"}
+
+    m_rows, _ = memory.page_candidates(limit=1)
+    s_rows, _ = sqlite.page_candidates(limit=1)
+    assert {k: v for k, v in m_rows[0].items() if k != "id"} == {
+        k: v for k, v in s_rows[0].items() if k != "id"
+    }
+    assert m_rows[0] == memory.list_candidates()[0].model_dump(mode="json")
+    for repo in (memory, sqlite):
+        roles, cursor = repo.page_roles(limit=5, fields=["title"])
+        assert roles == [{"title": "CTO"}] and cursor is None
+        startups, _ = repo.page_startups(fields=["website"])
+        assert startups == [{"website": "https://acme.dev/"}]
+
+
+def test_explain_search_on_both_backends() -> None:
+    for repo in (InMemoryRepo(), SqliteRepo.from_path(":memory:")):
+        _seed(repo)
+        results, plan = repo.explain_search_candidates(skills=["python"])
+        assert [c.full_name for c in results] == ["Alice"]
+        assert plan["actual_rows"] == 1
+    assert plan["strategy"] == "sqlite" and plan["sqlite_plan"]
+
+
+def test_text_query_on_both_backends() -> None:
+    for repo in (InMemoryRepo(), SqliteRepo.from_path(":memory:")):
+        _seed(repo)
+        assert [c.full_name for c in repo.search_candidates(q="vp eng")] == ["Alice"]
+        assert [c.full_name for c in repo.search_candidates(q="ct")] == ["Bob"]
+        assert repo.search_candidates(q="ali", skills=["go"]) == []
+    # Only the in-memory index tolerates typos.
+    assert [c.full_name for c in repo.search_candidates(q="engineerign")] == []
+
+
+def test_duplicate_email_is_a_conflict(monkeypatch) -> None:
+    sqlite = SqliteRepo.from_path(":memory:")
+    sqlite.create_candidate(CandidateCreate(full_name="Ada", email="ada@x.io"))
+    with pytest.raises(DuplicateEmailError):
+        sqlite.create_candidate(CandidateCreate(full_name="Ada 2", email="ada@x.io"))
+
+    monkeypatch.setattr(candidates_router, "repo", sqlite)
+    client = TestClient(app)
+    resp = client.post("/candidates/", json={"full_name": "Ada", "email": "ada@x.io"})
+    assert resp.status_code == 409
+    resp = client.post(
+        "/candidates/bulk",
+        json=[
+            {"full_name": "New", "email": "new@x.io"},
+            {"full_name": "Ada", "email": "ada@x.io"},
+        ],
+    )
+    assert resp.status_code == 409
+    assert len(sqlite.list_candidates()) == 1
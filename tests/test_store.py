@@ -1,6 +1,12 @@
+import sqlite3
+
 import pytest
 
-from src.data.store import DataStore
+from src.data.store import DataStore, latest_snapshot
+from src.features.sourcing.importer import (
+    ImportedCandidate,
+    persist_imported_candidates,
+)
 
 
 @pytest.fixture()
@@ -112,3 +118,189 @@ def test_suppression_blocks_interactions(store: DataStore) -> None:
 
     audit_events = store.list_audit_events(event_type="interaction_blocked")
     assert audit_events[0]["detail"]["contact"] == candidate["email"]
+
+
+def test_page_reads_only_the_requested_columns(store: DataStore) -> None:
+    store.create_candidate({"full_name": "A", "skills": ["go"], "remote_preference": 0})
+    store.create_candidate({"full_name": "B"})
+
+    rows, key = store.page_candidates(
+        limit=5, columns=["full_name", "skills", "remote_preference"]
+    )
+
+    assert key is None
+    assert rows == [
+        {"full_name": "A", "skills": ["go"], "remote_preference": False},
+        {"full_name": "B", "skills": [], "remote_preference": None},
+    ]
+    with pytest.raises(ValueError):
+        store.page_candidates(columns=["full_name FROM roles --"])
+
+
+def test_row_decoder_matches_the_store_reads(store: DataStore) -> None:
+    candidate = store.create_candidate({"full_name": "A", "skills": ["go"]})
+    row = store.conn.execute(
+        "SELECT * FROM candidates WHERE id = ?", (candidate["id"],)
+    ).fetchone()
+
+    assert store.row_decoder("candidates")(row) == store.get_candidate(candidate["id"])
+    with pytest.raises(ValueError):
+        store.row_decoder("suppression_list")
+
+
+def test_failed_bulk_insert_leaves_no_partial_rows(store: DataStore) -> None:
+    store.create_candidate({"full_name": "Old", "email": "old@x.io"})
+    with pytest.raises(sqlite3.IntegrityError):
+        store.create_candidates(
+            [
+                {"full_name": "A"},
+                {"full_name": "B"},
+                {"full_name": "Dup", "email": "old@x.io"},
+            ]
+        )
+    store.create_startup({"name": "Acme", "stage": "seed"})
+
+    assert not store.conn.in_transaction
+    assert [c["full_name"] for c in store.list_candidates()] == ["Old"]
+
+
+def test_transaction_groups_commits_and_rolls_back(store: DataStore) -> None:
+    before = store.commit_stats()["commits"]
+    with store.transaction():
+        candidate = store.create_candidate({"full_name": "Grouped"})
+        store.add_profile_source({"candidate_id": candidate["id"], "source": "csv"})
+        store.record_audit_event(
+            event_type="grouped", subject_id=candidate["id"], detail={}
+        )
+    assert store.commit_stats()["commits"] == before + 1
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_candidate({"full_name": "Rolled Back", "id": "rb-1"})
+            raise RuntimeError("boom")
+    assert store.get_candidate("rb-1") is None
+    assert store.get_candidate(candidate["id"]) is not None
+
+
+def test_nested_transaction_uses_savepoint(store: DataStore) -> None:
+    with store.transaction():
+        store.create_candidate({"full_name": "Outer", "id": "outer"})
+        with pytest.raises(ValueError):
+            with store.transaction():
+                store.create_candidate({"full_name": "Inner", "id": "inner"})
+                raise ValueError("inner failure")
+    assert store.get_candidate("outer") is not None
+    assert store.get_candidate("inner") is None
+
+
+def test_persist_imported_candidates_skips_duplicates(store: DataStore) -> None:
+    before = store.commit_stats()["commits"]
+    created = persist_imported_candidates(
+        store,
+        [
+            ImportedCandidate(full_name="Ana", email="ana@example.com"),
+            ImportedCandidate(full_name="Ana Again", email="ana@example.com"),
+            ImportedCandidate(full_name="Ben", company="Acme"),
+        ],
+    )
+    assert [c["full_name"] for c in created] == ["Ana", "Ben"]
+    assert store.commit_stats()["commits"] == before + 1
+    assert len(store.list_audit_events(event_type="candidate_imported")) == 2
+
+
+def test_skill_patches_update_json_in_place(store: DataStore) -> None:
+    candidate = store.create_candidate(
+        {"full_name": "Patch Me", "skills": ["python", "sql"]}
+    )
+    added = store.add_candidate_skills(candidate["id"], ["go", "python", "go", "k8s"])
+    assert added["skills"] == ["python", "sql", "go", "k8s"]
+
+    removed = store.remove_candidate_skills(candidate["id"], ["sql", "missing"])
+    assert removed["skills"] == ["python", "go", "k8s"]
+    assert store.get_candidate(candidate["id"])["skills"] == ["python", "go", "k8s"]
+
+    assert store.add_candidate_skills("missing-id", ["go"]) is None
+
+
+def test_writes_return_stored_row_without_reselect(store: DataStore) -> None:
+    statements = []
+    store.conn.set_trace_callback(statements.append)
+    candidate = store.create_candidate({"full_name": "One Trip", "skills": ["a"]})
+    updated = store.update_candidate(candidate["id"], {"current_title": "CTO"})
+    store.conn.set_trace_callback(None)
+
+    assert candidate["created_at"]
+    assert updated["current_title"] == "CTO"
+    assert not any(s.lstrip().upper().startswith("SELECT") for s in statements)
+
+
+def test_change_outbox_tracks_writes_and_consumer_offsets(store: DataStore) -> None:
+    startup = store.create_startup({"name": "CDC", "stage": "seed"})
+    role = store.create_role({"startup_id": startup["id"], "title": "CTO"})
+    candidate = store.create_candidate({"full_name": "Changed"})
+    store.update_candidate(candidate["id"], {"current_title": "VP"})
+    store.record_stage_event(
+        {"candidate_id": candidate["id"], "role_id": role["id"], "stage": "screen"}
+    )
+    store.delete_candidate(candidate["id"])
+
+    changes = store.changes_since(0)
+    assert [(c["table"], c["op"]) for c in changes] == [
+        ("roles", "insert"),
+        ("candidates", "insert"),
+        ("candidates", "update"),
+        ("stage_events", "insert"),
+        ("stage_events", "delete"),
+        ("candidates", "delete"),
+    ]
+    assert [c["seq"] for c in changes] == sorted(c["seq"] for c in changes)
+
+    page = store.changes_since(0, limit=2)
+    assert store.changes_since(page[-1]["seq"]) == changes[2:]
+
+    offset = store.commit_consumer_offset("search-index", changes[3]["seq"])
+    assert offset == changes[3]["seq"]
+    assert store.commit_consumer_offset("search-index", 1) == changes[3]["seq"]
+    assert store.get_consumer_offset("search-index") == changes[3]["seq"]
+    assert store.get_consumer_offset("unknown") == 0
+
+    assert store.prune_changes() == 4
+    assert store.changes_since(0) == changes[4:]
+
+
+def test_snapshot_is_consistent_and_restorable(tmp_path) -> None:
+    live = DataStore(db_path=str(tmp_path / "live.db"))
+    for i in range(200):
+        live.create_candidate({"full_name": f"Snap {i}", "titles": ["x" * 200]})
+
+    steps = []
+    path = live.snapshot(
+        tmp_path / "snaps" / "latest.db",
+        pages_per_step=4,
+        progress=lambda done, total: steps.append((done, total)),
+    )
+    live.create_candidate({"full_name": "After Snapshot", "id": "late"})
+
+    assert len(steps) > 1
+    assert steps[-1][0] == steps[-1][1]
+    assert not (tmp_path / "snaps" / "latest.db.partial").exists()
+    assert latest_snapshot(tmp_path / "snaps") == path
+
+    restored = DataStore.from_snapshot(path)
+    assert len(restored.list_candidates()) == 200
+    assert restored.get_candidate("late") is None
+    restored.create_candidate({"full_name": "Writable"})
+    restored.close()
+    live.close()
+
+
+def test_text_search_folds_non_ascii_case() -> None:
+    store = DataStore()
+    store.create_candidate(
+        {"full_name": "José Núñez", "titles": ["Directeur Général"], "email": "j@x.io"}
+    )
+    store.create_candidate({"full_name": "Jose Nunez", "email": "n@x.io"})
+
+    assert [c["email"] for c in store.search_candidates(text="NÚÑEZ")] == ["j@x.io"]
+    assert [c["email"] for c in store.search_candidates(text="général")] == ["j@x.io"]
+    store.close()
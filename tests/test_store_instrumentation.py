@@ -0,0 +1,84 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from src.app import app
+from src.data.instrumentation import fingerprint
+from src.data.store import DataStore
+from src.routers import admin
+
+
+def test_fingerprint_normalizes_literals_and_in_lists() -> None:
+    a = fingerprint("SELECT * FROM t WHERE id = 'x1' AND n > 10  AND k IN (?, ?, ?)")
+    b = fingerprint("select * from t where id = 'y2' and n > 3 and k in (?,?)".upper())
+    assert a == "SELECT * FROM t WHERE id = ? AND n > ? AND k IN (?, ...)"
+    assert a.upper() == b
+
+
+def test_disabled_store_uses_raw_connection() -> None:
+    store = DataStore()
+    assert type(store.conn) is sqlite3.Connection
+    assert store.query_stats is None
+    store.enable_query_stats()
+    store.disable_query_stats()
+    assert type(store.conn) is sqlite3.Connection
+
+
+def test_query_stats_counts_calls_rows_and_histogram() -> None:
+    store = DataStore()
+    stats = store.enable_query_stats(slow_ms=10_000)
+    for index in range(3):
+        store.create_candidate({"full_name": f"C{index}", "email": f"c{index}@x.io"})
+    store.list_candidates()
+
+    snapshot = stats.snapshot()
+    list_key = "SELECT id FROM candidates"
+    assert snapshot[list_key]["calls"] == 1
+    assert snapshot[list_key]["rows"] == 3
+    get_key = next(k for k in snapshot if k.startswith("SELECT * FROM candidates"))
+    assert snapshot[get_key]["calls"] == 3
+    assert sum(snapshot[get_key]["histogram"].values()) == 3
+    insert_key = next(k for k in snapshot if "INSERT INTO candidates" in k)
+    assert snapshot[insert_key]["calls"] == 3
+    store.close()
+
+
+def test_slow_queries_are_logged_with_redacted_params(caplog) -> None:
+    store = DataStore()
+    store.enable_query_stats(slow_ms=0)
+    with caplog.at_level("WARNING", logger="scoutshonor.store.slow_query"):
+        store.create_candidate({"full_name": "Secret Name", "email": "s@example.com"})
+
+    combined = " ".join(caplog.messages)
+    assert "slow query" in combined
+    assert "Secret Name" not in combined
+    assert "s@example.com" not in combined
+    assert "[REDACTED]" in combined
+    store.close()
+
+
+def test_search_terms_are_redacted_from_slow_query_log(caplog) -> None:
+    store = DataStore()
+    store.create_candidate({"full_name": "Zabrowski", "current_title": "CTO"})
+    store.enable_query_stats(slow_ms=0)
+    with caplog.at_level("WARNING", logger="scoutshonor.store.slow_query"):
+        store.search_candidates(skills=["python"], text="zabrowski")
+
+    combined = " ".join(caplog.messages)
+    assert "slow query" in combined
+    assert "zabrowski" not in combined.lower()
+    store.close()
+
+
+def test_admin_endpoint_reports_query_stats(monkeypatch) -> None:
+    client = TestClient(app)
+    assert client.get("/admin/query-stats").json()["enabled"] is False
+
+    store = DataStore()
+    store.enable_query_stats()
+    store.list_startups()
+    monkeypatch.setattr(admin, "repo", type("R", (), {"store": store})())
+    body = client.get("/admin/query-stats").json()
+    assert body["enabled"] is True
+    assert body["statements"]["SELECT id FROM startups"]["calls"] == 1
+    store.close()
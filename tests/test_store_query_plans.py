@@ -0,0 +1,114 @@
+import re
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from src.data.store import DataStore
+
+
+FULL_SCAN_RE = re.compile(r"^SCAN \w+$")
+
+# JSON-array membership cannot use a B-tree index; these scans are expected.
+ALLOWED_SCANS = ("SELECT * FROM candidates WHERE EXISTS",)
+
+
+def _exercise_store(store: DataStore) -> None:
+    startup = store.create_startup({"name": "Plan Co", "stage": "seed"})
+    role = store.create_role({"startup_id": startup["id"], "title": "CTO"})
+    store.update_role(role["id"], {"title": "VP Engineering"})
+    store.create_scorecard({"role_id": role["id"], "must_haves": ["python"]})
+    store.create_sequence({"role_id": role["id"], "name": "v1"})
+    candidate = store.create_candidate(
+        {"full_name": "Plan User", "email": "plan@example.com"}
+    )
+    store.update_candidate(candidate["id"], {"skills": ["python"]})
+    store.add_profile_source({"candidate_id": candidate["id"], "source": "csv"})
+    store.log_interaction(
+        {"candidate_id": candidate["id"], "channel": "email", "direction": "outbound"}
+    )
+    store.record_stage_event(
+        {"candidate_id": candidate["id"], "role_id": role["id"], "stage": "screen"}
+    )
+    store.record_consent_event(
+        contact="plan@example.com", status="granted", candidate_id=candidate["id"]
+    )
+    store.suppress_contact("other@example.com", reason="test")
+
+    store.list_candidates()
+    store.page_candidates(limit=10)
+    store.existing_emails(["PLAN@example.com", "new@example.com"])
+    store.page_roles(startup_id=startup["id"], limit=10)
+    store.search_candidates(skills=["python"], titles=["cto"], location="nyc")
+    store.list_startups()
+    store.list_roles()
+    store.list_roles(startup_id=startup["id"])
+    store.list_scorecards()
+    store.list_scorecards(role_id=role["id"])
+    store.list_sequences()
+    store.list_sequences(role_id=role["id"])
+    store.list_interactions()
+    store.list_interactions(candidate_id=candidate["id"])
+    store.list_stage_events(candidate["id"])
+    store.list_audit_events()
+    store.list_audit_events(event_type="suppression_added")
+    store.is_suppressed("plan@example.com")
+    store.changes_since(0, limit=10)
+    store.commit_consumer_offset("plan", 1)
+    store.get_consumer_offset("plan")
+
+
+@pytest.fixture()
+def traced_selects() -> Iterator[Tuple[DataStore, List[str]]]:
+    store = DataStore(db_path=":memory:")
+    statements: List[str] = []
+    store.conn.set_trace_callback(statements.append)
+    _exercise_store(store)
+    store.conn.set_trace_callback(None)
+
+    selects = sorted(
+        {
+            " ".join(s.split())
+            for s in statements
+            if s.lstrip().upper().startswith("SELECT")
+        }
+    )
+    yield store, selects
+    store.close()
+
+
+def test_every_store_query_uses_an_index(traced_selects) -> None:
+    store, selects = traced_selects
+    assert len(selects) >= 20
+
+    offenders = []
+    for sql in selects:
+        if sql.startswith(ALLOWED_SCANS):
+            continue
+        plan = [
+            row["detail"] for row in store.conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+        ]
+        if any(FULL_SCAN_RE.match(detail) for detail in plan):
+            offenders.append((sql, plan))
+        elif any("USE TEMP B-TREE" in detail for detail in plan):
+            offenders.append((sql, plan))
+        elif " WHERE " in sql and not any(d.startswith("SEARCH") for d in plan):
+            offenders.append((sql, plan))
+
+    assert offenders == []
+
+
+def test_list_queries_are_covered_by_secondary_indexes(traced_selects) -> None:
+    store, _ = traced_selects
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM interactions "
+        "WHERE candidate_id = ? ORDER BY occurred_at",
+        ("x",),
+    ).fetchone()
+    assert "COVERING INDEX idx_interactions_candidate_occurred" in plan["detail"]
+
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM audit_logs "
+        "WHERE event_type = ? ORDER BY created_at DESC",
+        ("x",),
+    ).fetchone()
+    assert "COVERING INDEX idx_audit_logs_event_created" in plan["detail"]
@@ -0,0 +1,59 @@
+from src.services.text_index import TextIndex, trigrams, words
+
+DOCS = [
+    ("c1", ("Radia Perlman", "Platform Engineer", "Software Engineer")),
+    ("c2", ("Grace Hopper", "Engineering Manager")),
+    ("c3", ("Linus Torvalds", "Kernel Maintainer")),
+    ("c4", ("Radia Rikovve", None)),
+]
+
+
+def _index() -> TextIndex:
+    return TextIndex().with_documents(DOCS)
+
+
+def test_words_and_trigrams() -> None:
+    assert words("VP, Engineering") == ["vp", "engineering"]
+    assert trigrams("cat") == {"  c", " ca", "cat", "at "}
+
+
+def test_exact_prefix_and_typo_matches() -> None:
+    index = _index()
+    assert index.search("radia") == {"c1": 1.0, "c4": 1.0}
+    prefixed = index.search("plat eng")
+    assert set(prefixed) == {"c1"}
+    assert index.search("enginer managr").keys() == {"c2"}
+    assert index.search("torvlds").keys() == {"c3"}
+
+
+def test_ranking_and_threshold() -> None:
+    index = _index()
+    scores = index.search("engineer")
+    # Exact word beats a prefix match ("engineering").
+    assert scores["c1"] == 1.0 and 0.6 < scores["c2"] < 1.0
+    assert index.search("torvlds", threshold=0.9) == {}
+
+
+def test_every_word_must_match_and_restrict() -> None:
+    index = _index()
+    assert index.search("radia hopper") == {}
+    assert index.search("radia", restrict={"c4"}).keys() == {"c4"}
+    assert len(index.search("radia", limit=1)) == 1
+    assert index.search("   ") == {}
+
+
+def test_limit_keeps_the_best_scores_not_the_first_reached() -> None:
+    index = TextIndex().with_documents(
+        [("d1", ("Ann Engineering",)), ("d2", ("Ann Engineer",))]
+    )
+    # "ann" drives the walk and scores both equally; "engin" decides the rank.
+    everything = index.search("ann engin")
+    assert everything["d2"] > everything["d1"]
+    assert index.search("ann engin", limit=1) == {"d2": everything["d2"]}
+
+
+def test_with_documents_returns_updated_copy() -> None:
+    base = _index()
+    grown = base.with_documents([("c5", ("Ada Lovelace", "Platform Lead"))])
+    assert base.search("lovelace") == {}
+    assert grown.search("platform").keys() == {"c1", "c5"}